@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 """ Initializing the ldt package
 
+The subpackages are imported lazily, on first access (e.g.
+``ldt.dicts``), so that ``import ldt`` does not load all the resources and
+their dependencies. The check for a newer ldt version is not performed at
+import time either: see :func:`ldt.load_config.check_version`.
+
 Subpackages
 ===========
 
@@ -9,15 +14,27 @@ Subpackages
 
 """
 
+import importlib
+
 from ._version import __version__
-from ldt.load_config import config
+from ldt.load_config import config, check_version
+
+_SUBPACKAGES = ("helpers", "dicts", "relations", "experiments",
+                "benchmarks")
 
-from ldt import helpers
-from ldt.helpers.loading import load_resource
+#: the names available at the package level, and the modules they come from
+_SHORTCUTS = {"load_resource": "ldt.helpers.loading",
+              "Word": "ldt.relations",
+              "RelationsInPair": "ldt.relations"}
 
-from ldt import dicts
-from ldt import relations
-from ldt.relations import Word
-from ldt.relations import RelationsInPair
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        return importlib.import_module("ldt." + name)
+    if name in _SHORTCUTS:
+        value = getattr(importlib.import_module(_SHORTCUTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module 'ldt' has no attribute '" + name + "'")
 
-from ldt import experiments
+def __dir__():
+    return sorted(list(globals()) + list(_SUBPACKAGES) + list(_SHORTCUTS))
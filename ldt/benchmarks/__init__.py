@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of the ldt pipeline on synthetic data.
+
+The benchmarks can be run from the command line, with the report printed
+as JSON::
+
+    python -m ldt.benchmarks --vocab-size 10000 --sample-size 100 --top-n 10
+
+See :func:`ldt.benchmarks.pipeline.run_benchmark` for the options.
+
+"""
+
+from .synthetic import make_benchmark_data
+from .pipeline import run_benchmark
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Running the ldt pipeline benchmark from the command line."""
+
+import sys
+import json
+import argparse
+
+from ldt.benchmarks.pipeline import run_benchmark, ANALYZERS, DICTIONARIES
+
+def main(args=None):
+    """Parsing the command line options, running the benchmark and
+    printing or saving the report."""
+    parser = argparse.ArgumentParser(
+        prog="python -m ldt.benchmarks",
+        description="Timing the stages of ldt analysis on synthetic data.")
+    parser.add_argument("--path", default=None,
+                        help="the folder for the generated data (a "
+                             "temporary folder by default)")
+    parser.add_argument("--vocab-size", type=int, default=10000)
+    parser.add_argument("--sample-size", type=int, default=100)
+    parser.add_argument("--models", type=int, default=2)
+    parser.add_argument("--dimensions", type=int, default=300)
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--analyzer", choices=ANALYZERS, default="stub")
+    parser.add_argument("--dictionaries", nargs="*", choices=DICTIONARIES,
+                        default=list(DICTIONARIES),
+                        help="the dictionary types to benchmark separately")
+    parser.add_argument("--multiprocessing", type=int, default=1)
+    parser.add_argument("--no-prefetch", action="store_true")
+    parser.add_argument("--output-format", choices=["tsv", "parquet"],
+                        default="tsv")
+    parser.add_argument("--profiling", action="store_true",
+                        help="include the profile of the annotation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None,
+                        help="the file for the JSON report (printed to "
+                             "stdout by default)")
+    options = parser.parse_args(args)
+
+    report = run_benchmark(
+        path=options.path, vocab_size=options.vocab_size,
+        sample_size=options.sample_size, models=options.models,
+        dimensions=options.dimensions, top_n=options.top_n,
+        analyzer=options.analyzer, dictionaries=tuple(options.dictionaries),
+        multiprocessing=options.multiprocessing,
+        prefetch=not options.no_prefetch,
+        output_format=options.output_format, profiling=options.profiling,
+        seed=options.seed)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as stream:
+            json.dump(report, stream, indent=4)
+    else:
+        # the progress messages of the experiments go to stdout as well,
+        # so the report is printed last
+        sys.stdout.write(json.dumps(report, indent=4) + "\n")
+    return report
+
+if __name__ == '__main__':
+    main()
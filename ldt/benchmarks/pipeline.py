@@ -0,0 +1,498 @@
+# -*- coding: utf-8 -*-
+"""Benchmarking the full ldt pipeline on synthetic data.
+
+The benchmark generates a synthetic resource folder (see
+:mod:`ldt.benchmarks.synthetic`), points the ldt config to it, and times
+each stage of the default workflow:
+
+ - *neighbors*: extracting the vector neighborhoods of the vocab sample;
+ - *dictionaries*: looking up the extracted pairs in each type of
+   dictionary resource separately (names, numbers, associations, google
+   dependencies, corpus cooccurrence and frequencies, WordNet);
+ - *annotation*: annotating the neighborhoods;
+ - *scoring*: computing the ld scores.
+
+For each stage the report lists the processed word pairs per second, the
+peak resident memory of the process (and of its finished worker
+processes) and the hit rates of the in-memory lookup caches. Note that the
+caches of the worker processes are not included, so the cache statistics
+are only complete for the runs with a single process.
+
+The online resources are never queried, so that the timings are
+reproducible. The annotation can be performed by one of two analyzers:
+
+ - *stub*: :class:`SyntheticAnalyzer` looks the pairs up in the synthetic
+   resources and derives the rest of the relations from a hash of the pair,
+   so that only the overhead of the annotation pipeline itself is measured;
+ - *offline*: :class:`~ldt.relations.pair.RelationsInPair` with WordNet
+   and the custom English derivation rules, with Wiktionary stubbed out by
+   :class:`OfflineWiktionary`.
+
+Examples:
+    >>> report = ldt.benchmarks.pipeline.run_benchmark(vocab_size=10000,
+    sample_size=100, top_n=10)
+    >>> report["stages"]["annotation"]["pairs_per_sec"]
+    1523.4
+
+"""
+
+import os
+import sys
+import time
+import zlib
+import shutil
+import datetime
+import platform
+import tempfile
+import contextlib
+
+from ldt import __version__
+from ldt.load_config import config
+from ldt.helpers.tables import list_tables, read_table
+from ldt.benchmarks.synthetic import make_benchmark_data, \
+    LANGUAGE_RESOURCES, CORPUS_RESOURCES
+
+#: the dictionary types that are benchmarked separately
+DICTIONARIES = ("names", "numbers", "associations", "gdeps", "cooccurrence",
+                "freqdict", "wordnet")
+
+#: the analyzers available for the annotation stage
+ANALYZERS = ("stub", "offline")
+
+#: the relations that :class:`SyntheticAnalyzer` assigns at random
+_STUB_RELATIONS = ["SharedPOS", "SharedMorphForm", "SharedDerivation",
+                   "Synonyms", "Antonyms", "Meronyms", "Hyponyms",
+                   "Hypernyms", "OtherRelations", "Misspellings"]
+
+class OfflineWiktionary(object):
+    """A stand-in for the Wiktionary resource of
+    :class:`~ldt.dicts.derivation.meta.DerivationAnalyzer`, which is
+    queried online. No words are found in it."""
+
+    def __init__(self, language="en", **kwargs): #pylint: disable=unused-argument
+        self.language = language
+        self.cache = None
+
+    def is_a_word(self, word): #pylint: disable=unused-argument,no-self-use
+        """No word exists in the offline Wiktionary."""
+        return False
+
+    def get_etymologies(self, word): #pylint: disable=unused-argument,no-self-use
+        """No etymologies are available offline."""
+        return None
+
+    def get_related_words(self, word): #pylint: disable=unused-argument,no-self-use
+        """No related words are available offline."""
+        return []
+
+class SyntheticAnalyzer(object):
+    """A stand-in for :class:`~ldt.relations.pair.RelationsInPair` with
+    the same interface. The names, numbers and associations are looked up
+    in the (synthetic) ldt resources, and the rest of the relations are
+    derived from a hash of the pair, so that the annotation is
+    deterministic and costs almost nothing."""
+
+    def __init__(self):
+        # pylint: disable=import-outside-toplevel
+        from ldt.dicts.resources import NameDictionary, NumberDictionary, \
+            AssociationDictionary
+        self.namedict = NameDictionary()
+        self.numberdict = NumberDictionary()
+        self.association_dict = AssociationDictionary()
+
+    def analyze(self, target, neighbor, silent=True, debugging=False): #pylint: disable=unused-argument
+        """Annotating a pair.
+
+        Args:
+            target (str): the target word
+            neighbor (str): the neighbor word
+            silent (bool): ignored
+            debugging (bool): ignored
+
+        Returns:
+            (dict): the relations of the pair
+        """
+        key = zlib.crc32((target + ":" + neighbor).encode("utf-8"))
+        res = {}
+        for i, relation in enumerate(_STUB_RELATIONS):
+            # each relation holds for about a quarter of the pairs
+            if (key >> (2 * i)) & 3 == 0:
+                res[relation] = True
+        res["ShortestPath"] = round((key % 1000) / 1000, 3)
+        if self.namedict.is_a_word(target) and \
+                self.namedict.is_a_word(neighbor):
+            res["ProperNouns"] = True
+        if self.numberdict.is_a_word(target) and \
+                self.numberdict.is_a_word(neighbor):
+            res["Numbers"] = True
+        if self.association_dict.are_related(target, neighbor):
+            res["Associations"] = True
+        return res
+
+@contextlib.contextmanager
+def offline_wiktionary():
+    """Replacing Wiktionary with :class:`OfflineWiktionary` in the
+    derivation analyzers initialized in this context."""
+    # pylint: disable=import-outside-toplevel
+    import ldt.dicts.derivation.meta as derivation
+    wiktionary = derivation.DerivationWiktionary
+    derivation.DerivationWiktionary = OfflineWiktionary
+    try:
+        yield
+    finally:
+        derivation.DerivationWiktionary = wiktionary
+
+def offline_analyzer():
+    """Setting up :class:`~ldt.relations.pair.RelationsInPair` with the
+    resources that do not need the Internet connection: WordNet, the
+    custom English derivation rules and the ldt resource files.
+
+    Returns:
+        (RelationsInPair): the analyzer
+    """
+    # pylint: disable=import-outside-toplevel
+    from ldt.dicts.normalize import Normalization
+    from ldt.dicts.derivation.meta import DerivationAnalyzer
+    from ldt.dicts.semantics.metadictionary import MetaDictionary
+    from ldt.relations.pair import RelationsInPair
+
+    with offline_wiktionary():
+        normalizer = Normalization(language="English",
+                                   order=("wordnet", "custom"),
+                                   custom_base="wordnet", lowercasing=True)
+        derivation = DerivationAnalyzer(language="English",
+                                        persistent_cache=False)
+        lex_dict = MetaDictionary(language="English", order=("wordnet",))
+    return RelationsInPair(language="English", normalizer=normalizer,
+                           derivation_dict=derivation, lex_dict=lex_dict)
+
+@contextlib.contextmanager
+def benchmark_config(manifest):
+    """Temporarily pointing the ldt config to the synthetic resources.
+
+    Args:
+        manifest (dict): the output of
+            :func:`~ldt.benchmarks.synthetic.make_benchmark_data`
+    """
+    path = manifest["path_to_resources"]
+    corpus_resources = dict(config.get("corpus_resources") or {})
+    corpus_resources[manifest["corpus"]] = dict(CORPUS_RESOURCES)
+    language_resources = dict(config.get("language_resources") or {})
+    language_resources["en"] = dict(LANGUAGE_RESOURCES)
+    changes = {"path_to_resources": path,
+               "path_to_cache": os.path.join(path, "cache"),
+               "corpus": manifest["corpus"],
+               "corpus_resources": corpus_resources,
+               "language_resources": language_resources}
+    if not os.path.isdir(changes["path_to_cache"]):
+        os.makedirs(changes["path_to_cache"])
+    saved = {key: config[key] for key in changes if key in config}
+    config.update(changes)
+    try:
+        yield
+    finally:
+        for key in changes:
+            if key in saved:
+                config[key] = saved[key]
+            else:
+                del config[key]
+
+def peak_rss():
+    """Retrieving the peak resident set size of this process and of its
+    finished child processes.
+
+    Returns:
+        (dict): the peak memory in Mb, or None if it cannot be determined on
+        this platform
+    """
+    try:
+        import resource #pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    # ru_maxrss is in bytes on macOS, and in kilobytes elsewhere
+    scale = 1024 ** 2 if sys.platform == "darwin" else 1024
+    return {"self": round(resource.getrusage(
+        resource.RUSAGE_SELF).ru_maxrss / scale, 1),
+            "children": round(resource.getrusage(
+                resource.RUSAGE_CHILDREN).ru_maxrss / scale, 1)}
+
+def cached_functions(*objects):
+    """Collecting the cached methods of ldt objects, including the ones of
+    the ldt objects they hold as attributes.
+
+    Args:
+        objects: ldt objects or classes
+
+    Returns:
+        (dict): the cached functions by their qualified names
+    """
+    res = {}
+    seen = set()
+    stack = list(objects)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        classes = obj.__mro__ if isinstance(obj, type) else type(obj).__mro__
+        for cls in classes:
+            if not cls.__module__.startswith("ldt."):
+                continue
+            for attr in vars(cls).values():
+                if hasattr(attr, "cache_info"):
+                    res[attr.__qualname__] = attr
+        if isinstance(obj, type):
+            continue
+        values = list(getattr(obj, "__dict__", {}).values())
+        for value in values:
+            if isinstance(value, dict):
+                values += [x for x in value.values() if
+                           type(x).__module__.startswith("ldt.")]
+            elif type(value).__module__.startswith("ldt."):
+                stack.append(value)
+    return res
+
+def clear_caches(functions):
+    """Emptying the caches of the cached functions."""
+    for function in functions.values():
+        function.cache_clear()
+
+def cache_stats(functions):
+    """Summarizing the use of the caches.
+
+    Args:
+        functions (dict): the cached functions by their names
+
+    Returns:
+        (dict): the hits, misses and hit rates of the caches that were
+        used, and their totals
+    """
+    res = {}
+    hits = misses = 0
+    for name in sorted(functions):
+        info = functions[name].cache_info()
+        if info.hits + info.misses:
+            res[name] = _hit_rate(info.hits, info.misses)
+            hits += info.hits
+            misses += info.misses
+    res["total"] = _hit_rate(hits, misses)
+    return res
+
+def _hit_rate(hits, misses):
+    """Helper for formatting the cache statistics."""
+    rate = round(hits / (hits + misses), 4) if hits + misses else None
+    return {"hits": hits, "misses": misses, "hit_rate": rate}
+
+def _stage_report(seconds, pairs, **kwargs):
+    """Helper for formatting the results of a stage."""
+    res = {"seconds": round(seconds, 4), "pairs": pairs,
+           "pairs_per_sec": round(pairs / seconds, 2) if seconds else None}
+    res.update(kwargs)
+    res["peak_rss_mb"] = peak_rss()
+    return res
+
+def _load_dictionary(name, words, corpus):
+    """Helper for initializing a dictionary to benchmark, and the function
+    that looks up a pair in it."""
+    # pylint: disable=import-outside-toplevel
+    from ldt.dicts.resources import ResourceDict, NameDictionary, \
+        NumberDictionary, AssociationDictionary
+    from ldt.relations.distribution import DistributionDict
+
+    if name in ["names", "numbers"]:
+        if name == "names":
+            dictionary = NameDictionary()
+        else:
+            dictionary = NumberDictionary()
+        return dictionary, lambda x, y: (dictionary.is_a_word(x),
+                                         dictionary.is_a_word(y))
+    if name == "associations":
+        dictionary = AssociationDictionary()
+    elif name == "gdeps":
+        dictionary = ResourceDict(resource="gdeps", wordlist=words)
+    elif name == "cooccurrence":
+        dictionary = ResourceDict(resource="cooccurrence",
+                                  corpus=corpus, wordlist=words)
+    elif name == "freqdict":
+        dictionary = DistributionDict(corpus=corpus)
+        return dictionary, lambda x, y: (dictionary.frequency_in_corpus(x),
+                                         dictionary.frequency_in_corpus(y))
+    elif name == "wordnet":
+        from ldt.dicts.semantics.metadictionary import MetaDictionary
+        dictionary = MetaDictionary(language="English", order=("wordnet",))
+        return dictionary, lambda x, y: (dictionary.get_relations(x),
+                                         dictionary.get_relations(y))
+    else:
+        raise ValueError("Unknown dictionary type: " + str(name) + ". "
+                         "Please use one of the following: " +
+                         ", ".join(DICTIONARIES))
+    return dictionary, dictionary.are_related
+
+def benchmark_dictionaries(pairs, dictionaries=DICTIONARIES, corpus=None):
+    """Timing the lookups of word pairs in each type of dictionary.
+
+    Args:
+        pairs (list of tuples): the (target, neighbor) pairs
+        dictionaries (tuple of str): the dictionary types to benchmark
+        corpus (str): the corpus of the distributional resources (by
+            default, the one specified in the current config)
+
+    Returns:
+        (dict): the loading and lookup times, the lookup rates and the cache
+        statistics per dictionary type
+    """
+    res = {}
+    words = sorted(set(x for pair in pairs for x in pair))
+    for name in dictionaries:
+        start = time.perf_counter()
+        dictionary, lookup = _load_dictionary(name, words, corpus)
+        load_seconds = time.perf_counter() - start
+        functions = cached_functions(dictionary)
+        clear_caches(functions)
+        start = time.perf_counter()
+        for target, neighbor in pairs:
+            lookup(target, neighbor)
+        res[name] = _stage_report(time.perf_counter() - start, len(pairs),
+                                  load_seconds=round(load_seconds, 4),
+                                  caches=cache_stats(functions))
+    return res
+
+def _collect_pairs(directory):
+    """Helper for reading all the target:neighbor pairs of an experiment
+    stage."""
+    pairs = []
+    for path in list_tables(directory).values():
+        input_df = read_table(path, columns=["Target", "Neighbor"])
+        pairs += list(zip(input_df["Target"], input_df["Neighbor"]))
+    return pairs
+
+def run_benchmark(path=None, vocab_size=10000, sample_size=100, models=2,
+                  dimensions=300, top_n=10, analyzer="stub",
+                  ld_scores="all", dictionaries=DICTIONARIES,
+                  multiprocessing=1, prefetch=True, output_format="tsv",
+                  profiling=False, seed=0):
+    """Generating synthetic data and timing all the stages of ldt analysis.
+
+    Args:
+        path (str): the folder for the synthetic data and the experiment
+            results. If None, a temporary folder is used and removed
+            afterwards.
+        vocab_size (int): the vocabulary size of the synthetic embeddings
+        sample_size (int): the number of target words
+        models (int): the number of embedding models
+        dimensions (int): the number of vector dimensions
+        top_n (int): the number of neighbors per target word
+        analyzer (str): "stub" or "offline" (see the module documentation)
+        ld_scores (str or list): the ld scores to annotate, as in
+            :class:`~ldt.experiments.annotate.AnnotateVectorNeighborhoods`
+        dictionaries (tuple of str): the dictionary types to benchmark
+            separately (see :const:`DICTIONARIES`). If empty, this stage is
+            skipped.
+        multiprocessing (int): the number of processes for the annotation
+        prefetch (bool): whether the dictionary data is prefetched before
+            the annotation (only used by the offline analyzer)
+        output_format (str): the format of the experiment tables
+        profiling (bool): if True, the profile of the annotation (see
+            :mod:`ldt.helpers.profiling`) is included in the report
+        seed (int): the random seed for the synthetic data
+
+    Returns:
+        (dict): the benchmark report (JSON-serializable)
+    """
+    if not analyzer in ANALYZERS:
+        raise ValueError("The analyzer should be one of the following: " +
+                         ", ".join(ANALYZERS))
+    temporary = path is None
+    if temporary:
+        path = tempfile.mkdtemp(prefix="ldt_benchmark_")
+    try:
+        start = time.perf_counter()
+        manifest = make_benchmark_data(path, vocab_size=vocab_size,
+                                       sample_size=sample_size,
+                                       models=models, dimensions=dimensions,
+                                       seed=seed)
+        data_seconds = time.perf_counter() - start
+        with benchmark_config(manifest):
+            stages = _run_stages(manifest, top_n=top_n, analyzer=analyzer,
+                                 ld_scores=ld_scores,
+                                 dictionaries=dictionaries,
+                                 multiprocessing=multiprocessing,
+                                 prefetch=prefetch,
+                                 output_format=output_format,
+                                 profiling=profiling)
+    finally:
+        if temporary:
+            shutil.rmtree(path, ignore_errors=True)
+
+    parameters = dict(manifest["parameters"])
+    parameters.update({"top_n": top_n, "analyzer": analyzer,
+                       "ld_scores": ld_scores,
+                       "multiprocessing": multiprocessing,
+                       "prefetch": prefetch, "output_format": output_format,
+                       "profiling": profiling})
+    return {"ldt_version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.datetime.now().isoformat(),
+            "parameters": parameters,
+            "data_seconds": round(data_seconds, 4),
+            "stages": stages,
+            "peak_rss_mb": peak_rss()}
+
+def _run_stages(manifest, top_n, analyzer, ld_scores, dictionaries,
+                multiprocessing, prefetch, output_format, profiling):
+    """Helper for timing the experiment stages on the generated data."""
+    # pylint: disable=import-outside-toplevel
+    from ldt.experiments import VectorNeighborhoods, \
+        AnnotateVectorNeighborhoods, LDScoring
+    from ldt.dicts.resources import ResourceDict
+
+    output_dir = os.path.join(manifest["path_to_resources"], "experiments")
+    experiment = os.path.join(output_dir, "benchmark")
+    stages = {}
+
+    start = time.perf_counter()
+    neighborhoods = VectorNeighborhoods(
+        experiment_name="benchmark", overwrite=True, top_n=top_n,
+        embeddings=manifest["embeddings"], output_dir=output_dir,
+        dataset=manifest["vocab_sample"], output_format=output_format)
+    neighborhoods.get_results()
+    seconds = time.perf_counter() - start
+    pairs = _collect_pairs(os.path.join(experiment, "neighbors"))
+    stages["neighbors"] = _stage_report(seconds, len(pairs))
+
+    if dictionaries:
+        stages["dictionaries"] = benchmark_dictionaries(
+            pairs, dictionaries, corpus=manifest["corpus"])
+
+    start = time.perf_counter()
+    if analyzer == "stub":
+        ldt_analyzer = SyntheticAnalyzer()
+    else:
+        ldt_analyzer = offline_analyzer()
+    load_seconds = time.perf_counter() - start
+    functions = cached_functions(ldt_analyzer, ResourceDict)
+    clear_caches(functions)
+    start = time.perf_counter()
+    annotation = AnnotateVectorNeighborhoods(
+        experiment_name="benchmark", overwrite=True, ld_scores=ld_scores,
+        output_dir=output_dir, ldt_analyzer=ldt_analyzer,
+        multiprocessing=multiprocessing, prefetch=prefetch,
+        output_format=output_format, profiling=profiling)
+    annotation.get_results()
+    stages["annotation"] = _stage_report(
+        time.perf_counter() - start, annotation.metadata["total_pairs"],
+        load_seconds=round(load_seconds, 4),
+        caches=cache_stats(functions))
+    if profiling:
+        stages["annotation"]["profile"] = annotation.metadata["profile"]
+
+    start = time.perf_counter()
+    scoring = LDScoring(experiment_name="benchmark", overwrite=True,
+                        ld_scores="all", output_dir=output_dir, bootstrap=0,
+                        multiprocessing=multiprocessing)
+    scoring.get_results()
+    stages["scoring"] = _stage_report(
+        time.perf_counter() - start,
+        len(_collect_pairs(os.path.join(experiment, "neighbors_annotated"))))
+    return stages
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""Generating synthetic data for ldt benchmarks.
+
+This module creates a complete, self-contained ldt resource folder of
+configurable size: word embeddings in the plain-text format (one folder per
+model, with vecto-style metadata), a vocabulary sample, the language
+resources (names, numbers, associations, google dependency ngrams) and the
+corpus resources (frequency dictionary, vocabulary and cooccurrence data)
+of a synthetic corpus.
+
+The vocabulary consists of pronounceable pseudo-words, optionally mixed
+with the English lemmas of WordNet, so that the offline dictionaries find
+some of the words. The data is random, but reproducible for a given seed.
+
+Examples:
+    >>> manifest = ldt.benchmarks.synthetic.make_benchmark_data(
+    "/tmp/benchmark", vocab_size=10000, sample_size=100)
+    >>> manifest["embeddings"]
+    ['/tmp/benchmark/embeddings/synthetic_1',
+    '/tmp/benchmark/embeddings/synthetic_2']
+
+"""
+
+import os
+import json
+import uuid
+
+import numpy as np
+import pandas as pd
+
+#: the name of the synthetic corpus
+CORPUS = "synthetic"
+
+#: the name of the synthetic vocabulary sample
+VOCAB_SAMPLE = "synthetic_sample"
+
+#: the file names of the synthetic resources, in the format of the ldt config
+LANGUAGE_RESOURCES = {"names": "names.vocab", "numbers": "numbers.vocab",
+                      "associations": "associations.json",
+                      "gdeps": "gdeps.jsonl"}
+CORPUS_RESOURCES = {"freqdict": CORPUS + ".freqdict",
+                    "vocabulary": CORPUS + ".vocab",
+                    "cooccurrence": "3grams.jsonl"}
+
+_ONSETS = ["b", "d", "f", "g", "k", "l", "m", "n", "p", "r", "s", "t", "v",
+           "z", "br", "kl", "st", "tr"]
+_VOWELS = ["a", "e", "i", "o", "u", "ai", "ou"]
+_CODAS = ["", "", "n", "r", "s", "l", "k"]
+
+_NUMBERS = ["zero", "one", "two", "three", "four", "five", "six", "seven",
+            "eight", "nine", "ten", "eleven", "twelve", "twenty", "thirty",
+            "hundred", "thousand", "million"]
+
+def make_words(size, seed=0, real_words=None):
+    """Generating a vocabulary of unique words.
+
+    Args:
+        size (int): the number of words
+        seed (int): the random seed
+        real_words (list of str): if provided, these words are included in
+            the vocabulary (up to *size*), and the rest is filled with
+            pseudo-words
+
+    Returns:
+        (list of str): the words, in random order
+    """
+    rng = np.random.RandomState(seed)
+    words = list(dict.fromkeys(real_words or []))[:size]
+    seen = set(words)
+    syllables = [o + v + c for o in _ONSETS for v in _VOWELS for c in _CODAS]
+    length = 2
+    while len(words) < size:
+        batch = min(size - len(words), 10000)
+        # the longer words are only needed if the short ones run out
+        indices = rng.randint(len(syllables), size=(batch * 2, length))
+        for row in indices:
+            word = "".join(syllables[i] for i in row)
+            if not word in seen:
+                seen.add(word)
+                words.append(word)
+                if len(words) == size:
+                    break
+        length += 1
+    rng.shuffle(words)
+    return words
+
+def wordnet_words(size, seed=0):
+    """Sampling single-word English lemmas from WordNet.
+
+    Args:
+        size (int): the maximum number of words
+        seed (int): the random seed
+
+    Returns:
+        (list of str): the words, or an empty list if WordNet data is not
+        installed
+    """
+    try:
+        from nltk.corpus import wordnet #pylint: disable=import-outside-toplevel
+        lemmas = sorted(x for x in wordnet.all_lemma_names() if x.isalpha())
+    except LookupError:
+        return []
+    rng = np.random.RandomState(seed)
+    size = min(size, len(lemmas))
+    return [lemmas[i] for i in sorted(rng.choice(len(lemmas), size,
+                                                 replace=False))]
+
+def write_embeddings(words, path, model, dimensions=300, seed=0):
+    """Saving random word vectors as a vecto-loadable embeddings folder.
+
+    Args:
+        words (list of str): the vocabulary
+        path (str): the folder to create
+        model (str): the model name (ldt names the output files after it)
+        dimensions (int): the number of vector dimensions
+        seed (int): the random seed
+
+    Returns:
+        (str): the path to the embeddings folder
+    """
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    rng = np.random.RandomState(seed)
+    vectors = pd.DataFrame(rng.standard_normal(
+        (len(words), dimensions)).astype(np.float32), index=words)
+    vectors.to_csv(os.path.join(path, "vectors.txt"), sep=" ", header=False,
+                   float_format="%.5f")
+    metadata = {"class": "embeddings", "model": model,
+                "dimensions": dimensions, "vocabulary_size": len(words),
+                "uuid": str(uuid.uuid4()),
+                "description": "random vectors for ldt benchmarks"}
+    _save_json(metadata, os.path.join(path, "metadata.json"))
+    return path
+
+def write_vocab_sample(words, path, name=VOCAB_SAMPLE):
+    """Saving a vocabulary sample in the experiments/vocab_samples
+    subfolder of an ldt resource folder.
+
+    Args:
+        words (list of str): the sample
+        path (str): the ldt resource folder
+        name (str): the name of the sample
+
+    Returns:
+        (str): the path to the vocab file
+    """
+    folder = os.path.join(path, "experiments", "vocab_samples", name)
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    vocab_path = os.path.join(folder, name + ".vocab")
+    _save_lines(words, vocab_path)
+    metadata = {"class": "dataset", "uuid": str(uuid.uuid4()),
+                "task": "get_neighbors", "language": ["english"],
+                "name": name, "size": len(words),
+                "description": "synthetic sample for ldt benchmarks"}
+    _save_json(metadata, os.path.join(folder, "metadata.json"))
+    return vocab_path
+
+def write_resources(words, path, related_words=10, coverage=0.5, seed=0):
+    """Saving the synthetic language and corpus resources in an ldt
+    resource folder.
+
+    Args:
+        words (list of str): the vocabulary
+        path (str): the ldt resource folder
+        related_words (int): the number of related words per entry in
+            the associations, google dependency and cooccurrence data
+        coverage (float): the share of the vocabulary that has entries in
+            these resources
+        seed (int): the random seed
+
+    Returns:
+        (dict): the paths to the resource files
+    """
+    rng = np.random.RandomState(seed)
+    res = {}
+    language_folder = os.path.join(path, "language_resources", "en")
+    corpus_folder = os.path.join(path, "corpus_resources", CORPUS)
+    for folder in [language_folder, corpus_folder]:
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+
+    res["names"] = os.path.join(language_folder, LANGUAGE_RESOURCES["names"])
+    names = rng.choice(words, max(1, len(words) // 20), replace=False)
+    _save_lines(sorted(x.capitalize() for x in names), res["names"])
+
+    res["numbers"] = os.path.join(language_folder,
+                                  LANGUAGE_RESOURCES["numbers"])
+    _save_lines(_NUMBERS, res["numbers"])
+
+    entries = int(len(words) * coverage)
+    related = min(related_words, len(words) - 1)
+    for resource, folder in [("associations", language_folder),
+                             ("gdeps", language_folder),
+                             ("cooccurrence", corpus_folder)]:
+        if resource == "cooccurrence":
+            res[resource] = os.path.join(folder, CORPUS_RESOURCES[resource])
+        else:
+            res[resource] = os.path.join(folder, LANGUAGE_RESOURCES[resource])
+        keys = rng.choice(len(words), entries, replace=False)
+        values = rng.randint(len(words), size=(entries, related))
+        counts = rng.zipf(2.0, size=(entries, related))
+        with open(res[resource], "w", encoding="utf-8") as stream:
+            if resource == "associations":
+                data = {words[k]: [words[i] for i in v] for k, v in
+                        zip(keys, values)}
+                json.dump(data, stream)
+                continue
+            for k, v, c in zip(keys, values, counts):
+                if resource == "gdeps":
+                    entry = {words[k]: sorted(set(words[i] for i in v))}
+                else:
+                    entry = {words[k]: {words[i]: int(n) for i, n in
+                                        zip(v, c)}}
+                stream.write(json.dumps(entry) + "\n")
+
+    res["freqdict"] = os.path.join(corpus_folder, CORPUS_RESOURCES["freqdict"])
+    frequencies = rng.zipf(1.5, size=len(words)).clip(max=10 ** 7) * 10
+    with open(res["freqdict"], "w", encoding="utf-8") as stream:
+        for word, frequency in zip(words, frequencies):
+            stream.write(word + "\t" + str(frequency) + "\n")
+
+    res["vocabulary"] = os.path.join(corpus_folder,
+                                     CORPUS_RESOURCES["vocabulary"])
+    _save_lines(words, res["vocabulary"])
+    return res
+
+def make_benchmark_data(path, vocab_size=10000, sample_size=100, models=2,
+                        dimensions=300, real_words=0.5, related_words=10,
+                        coverage=0.5, seed=0):
+    """Generating all the data for a benchmark in an ldt resource folder.
+
+    Args:
+        path (str): the folder in which the data will be created
+        vocab_size (int): the vocabulary size of the embeddings and the
+            resources
+        sample_size (int): the number of words in the vocabulary sample
+        models (int): the number of embedding models
+        dimensions (int): the number of vector dimensions
+        real_words (float): the share of the vocabulary that is sampled
+            from WordNet, if it is installed
+        related_words (int): the number of related words per entry in the
+            associations, google dependency and cooccurrence data
+        coverage (float): the share of the vocabulary that has entries in
+            these resources
+        seed (int): the random seed
+
+    Returns:
+        (dict): the manifest of the generated data, which is also saved as
+        *manifest.json* in the data folder
+    """
+    if sample_size > vocab_size:
+        raise ValueError("The vocab sample cannot be larger than the "
+                         "vocabulary.")
+    if not 0 <= real_words <= 1 or not 0 < coverage <= 1:
+        raise ValueError("The real_words and coverage arguments should be "
+                         "fractions between 0 and 1.")
+    if not os.path.isdir(path):
+        os.makedirs(path)
+
+    real = wordnet_words(int(vocab_size * real_words), seed=seed) \
+        if real_words else []
+    words = make_words(vocab_size, seed=seed, real_words=real)
+
+    embeddings = []
+    for i in range(models):
+        model = CORPUS + "_" + str(i + 1)
+        embeddings.append(write_embeddings(
+            words, os.path.join(path, "embeddings", model), model=model,
+            dimensions=dimensions, seed=seed + i))
+
+    sample = list(np.random.RandomState(seed).choice(words, sample_size,
+                                                     replace=False))
+    write_vocab_sample(sample, path)
+    resources = write_resources(words, path, related_words=related_words,
+                                coverage=coverage, seed=seed)
+
+    manifest = {"path_to_resources": path, "embeddings": embeddings,
+                "vocab_sample": VOCAB_SAMPLE, "corpus": CORPUS,
+                "resources": resources,
+                "parameters": {"vocab_size": vocab_size,
+                               "sample_size": sample_size, "models": models,
+                               "dimensions": dimensions,
+                               "real_words": len(real),
+                               "related_words": related_words,
+                               "coverage": coverage, "seed": seed}}
+    _save_json(manifest, os.path.join(path, "manifest.json"))
+    return manifest
+
+def _save_lines(lines, path):
+    """Helper for saving one-column vocab files."""
+    with open(path, "w", encoding="utf-8") as stream:
+        stream.write("\n".join(lines) + "\n")
+
+def _save_json(data, path):
+    """Helper for saving metadata files."""
+    with open(path, "w", encoding="utf-8") as stream:
+        json.dump(data, stream, ensure_ascii=False, indent=4)
@@ -9,29 +9,173 @@
 
     The current functionality includes:
 
-     - Basic retrieval of urllib queries, given a set of arguments;
+     - Basic retrieval of API queries, given a set of arguments;
      - Determining whether a word entry exists;
      - Automatically formatting the dictionary language argument as required.
      - counting the number of queries performed in this session
+     - prefetching the data for a whole wordlist with concurrent requests;
      - retrieving BabelNet nodes and edges;
+     - querying a local store of BabelNet data instead of the API, and
+       recording the API responses to such a store.
+
+    The local store (:class:`BabelNetStore`) keeps the API responses by
+    request, so it can be filled either by recording the responses of the
+    online API, by importing previously recorded responses from a jsonl file,
+    or from a BabelNet export with :meth:`BabelNetStore.add_synset`. With a
+    local store, no BabelNet key is required, and all lookups are performed
+    offline.
+
+    Examples:
+        >>> store = ldt.dicts.base.babelnet.BabelNetStore("babelnet.sqlite")
+        >>> store.add_synset("bn:00015267n", ["cat", "true_cat"],
+        language="EN", edges=[("is-a", "HYPERNYM", "bn:00054180n")])
+        >>> babelnet = ldt.dicts.semantics.babelnet.BabelNet(
+        language="English", babelnet_store=store)
+        >>> babelnet.get_ids("cat")
+        ['bn:00015267n']
 
     Todo:
 
-     - cache saved between sessions;
      - authorization error for babelnet on invalid key;
-     - querying offline dump of BabelNet.
 
 """
 
-import urllib
-import urllib.request
+import urllib.parse
 import json
-import gzip
-import functools
 from ldt.dicts.dictionary import Dictionary
 from ldt.helpers.resources import lookup_language_by_code
+from ldt.helpers.persistent_cache import PersistentCache
+from ldt.helpers.http import get_client, prefetch_cache
 from ldt.load_config import config
 from ldt.helpers.exceptions import AuthorizationError
+from ldt.helpers.caching import cached
+
+#: the url of BabelNet API
+API_URL = "https://babelnet.io/v5/"
+
+#: the responses retrieved by :meth:`BaseBabelNet.prefetch`, by url
+_PREFETCHED = prefetch_cache("BabelNet.prefetched")
+
+def request_key(service, params):
+    """Formatting the key under which a BabelNet response is stored
+    locally. The key is independent of the user key and of the order of
+    the parameters.
+
+    Args:
+        service (str): the name of the BabelNet API service (e.g. *getSynset*)
+        params (dict): the parameters of the request
+
+    Returns:
+        (str): the key of the request
+    """
+    params = sorted((k, v) for k, v in params.items() if k != "key")
+    return service + "?" + urllib.parse.urlencode(params)
+
+class BabelNetStore(object):
+    """A local store of BabelNet API responses, indexed by request."""
+
+    def __init__(self, path=None):
+        """Initializing the store.
+
+        Args:
+            path (str): the path to the SQLite file of the store. If not
+                specified, the persistent cache file in the ldt resources
+                folder is used.
+
+        """
+        self._cache = PersistentCache(namespace="babelnet", path=path)
+        #: (str): the path to the store file
+        self.path = self._cache.path
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, service, params):
+        """Retrieving the stored response to a request.
+
+        Args:
+            service (str): the name of the BabelNet API service
+            params (dict): the parameters of the request
+
+        Returns:
+            the stored json data, or None if the request is not in the store
+        """
+        return self._cache.get(request_key(service, params))
+
+    def add(self, service, params, data):
+        """Saving the response to a request.
+
+        Args:
+            service (str): the name of the BabelNet API service
+            params (dict): the parameters of the request
+            data: the json data returned by BabelNet
+
+        Returns:
+            None
+        """
+        self._cache.set(request_key(service, params), data)
+
+    def import_jsonl(self, path):
+        """Importing recorded BabelNet responses. Every line of the file is
+        expected to be a json object with the *service*, *params* and
+        *response* fields.
+
+        Args:
+            path (str): the path to the jsonl file
+
+        Returns:
+            (int): the number of imported responses
+        """
+        values = {}
+        with open(path, "r", encoding="utf-8") as jsonl:
+            for line in jsonl:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                key = request_key(record["service"], record["params"])
+                values[key] = record["response"]
+        self._cache.set_many(values)
+        return len(values)
+
+    def add_synset(self, babelnet_id, lemmas, language="EN", pos=None,
+                   edges=()):
+        """Adding a synset from a BabelNet export. The data is saved in the
+        same format as the responses of the BabelNet API, so that the
+        synset is found by lemma search, and its lemmas and edges can be
+        retrieved.
+
+        Args:
+            babelnet_id (str): the id of the synset (e.g. 'bn:00516031n')
+            lemmas (list): the lemmas of the synset in the given language
+            language (str): the 2-letter code of the language of the lemmas
+            pos (str): the part of speech of the synset. If not specified,
+                it is inferred from the last letter of the id.
+            edges (iterable): the outgoing edges of the synset as tuples of
+                (relation name, relation group, target id), e.g.
+                ("is-a", "HYPERNYM", "bn:00054180n")
+
+        Returns:
+            None
+        """
+        language = language.upper()
+        if not pos:
+            pos = {"n": "NOUN", "v": "VERB", "a": "ADJ",
+                   "r": "ADV"}.get(babelnet_id[-1], "NOUN")
+        for lemma in lemmas:
+            params = {"lemma": lemma, "searchLang": language}
+            ids = self.get("getSynsetIds", params) or []
+            if babelnet_id not in [entry["id"] for entry in ids]:
+                ids.append({"id": babelnet_id, "pos": pos,
+                            "source": "BABELNET"})
+            self.add("getSynsetIds", params, ids)
+        params = {"id": babelnet_id, "searchLang": language}
+        senses = [{"properties": {"language": language, "simpleLemma": lemma}}
+                  for lemma in lemmas]
+        self.add("getSynset", params, {"senses": senses})
+        edges = [{"language": language, "target": target,
+                  "pointer": {"name": name, "relationGroup": group}}
+                 for name, group, target in edges]
+        self.add("getOutgoingEdges", params, edges)
 
 class BaseBabelNet(Dictionary):
     """The class providing the base BabelNet interface.
@@ -47,17 +191,25 @@ class BaseBabelNet(Dictionary):
         * the exceptions on daily limit exceeded & invalid key
 
     """
-    def __init__(self, babelnet_key=config["babelnet_key"], **kw): #pylint:
+    def __init__(self, babelnet_key=config["babelnet_key"],
+                 babelnet_store=config.get("babelnet_store", None),
+                 record=False, **kw): #pylint:
     # disable=unused-argument
         """ Initializing the BabelNet class.
 
         Unlike the basic Dictionary class, BabelNet checks the language
         argument upon initialization and converts it to the 2-letter code if
-        necessary. Exception is raised if the BabelNet key is not supplied.
+        necessary. Exception is raised if the BabelNet key is not supplied,
+        unless the data is to be retrieved from a local store.
 
         Args:
             babelnet_key (str): the BabelNet user key (registration at
             `BabelNet <https://babelnet.org/register>`_)
+            babelnet_store (str or BabelNetStore): the local store of
+                BabelNet data (or the path to it). If specified, the
+                lookups are performed in the store instead of the online API.
+            record (bool): if True, BabelNet API is queried as usual, and
+                all the responses are saved to the local store
 
         """
         super(BaseBabelNet, self).__init__()
@@ -65,9 +217,18 @@ class BaseBabelNet(Dictionary):
         if len(self.language) > 2:
             self.language = lookup_language_by_code(self.language, reverse=True)
         self._language = self.language.upper()
-        if babelnet_key:
-            self.babelnet_key = babelnet_key
-        else:
+        if isinstance(babelnet_store, str):
+            babelnet_store = BabelNetStore(babelnet_store) if \
+                babelnet_store else None
+        #: (BabelNetStore): the local store of BabelNet data
+        self.store = babelnet_store
+        self.record = record
+        # an empty store is still a store (BabelNetStore defines __len__)
+        if record and babelnet_store is None:
+            raise ValueError("A BabelNet store is required for recording the "
+                             "responses.")
+        self.babelnet_key = babelnet_key
+        if not babelnet_key and (record or babelnet_store is None):
             raise AuthorizationError("Please provide a BabelNet key. If you "
                                      "don't have one, register at "
                                      "https://babelnet.org/register ")
@@ -101,7 +262,7 @@ class BaseBabelNet(Dictionary):
             return True
         return False
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def query(self, url):
         """Helper method for querying BabelNet
 
@@ -113,22 +274,100 @@ class BaseBabelNet(Dictionary):
 
         """
 
-        request = urllib.request.Request(url)
-        request.add_header('Accept-encoding', 'gzip')
-        # print(request.get_full_url())
-        try:
-            response = urllib.request.urlopen(request)
-            self.queries += 1
-        except urllib.error.HTTPError:
+        data = _PREFETCHED.get(url, None)
+        if data is not None:
+            return data
+        data = get_client().get_json(url)
+        if data is None:
             print("Cannot reach BabelNet")
             return None
+        self.queries += 1
+        return data
 
-        if response.info().get('Content-Encoding') == 'gzip':
-            gz_data = gzip.decompress(response.read()).decode('utf-8')
-            data = json.loads(gz_data)
-            return data
+    def _url(self, service, params):
+        """Helper for formatting the url of a BabelNet API request."""
+        query_params = dict(params)
+        query_params["key"] = self.babelnet_key
+        return API_URL + service + '?' + urllib.parse.urlencode(query_params)
+
+    def _request(self, service, params):
+        """Helper for retrieving the response to a BabelNet request, either
+        from the local store or from the online API.
+
+        Args:
+            service (str): the name of the BabelNet API service
+            params (dict): the parameters of the request (without the key)
+
+        Returns:
+            the json data of the response, or None if it is not available
+        """
+        if self.store is not None and not self.record:
+            return self.store.get(service, params)
+        data = self.query(self._url(service, params))
+        if self.record and data is not None:
+            self.store.add(service, params, data)
+        return data
+
+    def prefetch(self, words, edges=True, lemmas=True):
+        """Retrieving the BabelNet data for a list of words with concurrent
+        requests, so that the subsequent lookups of these words do not wait
+        for the network. Nothing is queried if the data comes from a local
+        store.
+
+        Args:
+            words (iterable): the words to look up
+            edges (bool): if True, the edges of all the synsets of the words
+                are also retrieved
+            lemmas (bool): if True, the lemmas of the synsets related to the
+                words are also retrieved (requires *edges*)
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+        Returns:
+            (int): the number of retrieved responses
+        """
+        if self.store is not None and not self.record:
+            return 0
+        client = get_client()
+
+        def fetch(service, params_list):
+            """Fetching the responses that are not prefetched yet."""
+            urls = {self._url(service, params): params for params in
+                    params_list}
+            responses = {url: _PREFETCHED.get(url, None) for url in urls}
+            new = [url for url in urls if responses[url] is None]
+            data = client.fetch_many(new)
+            for url, response in data.items():
+                if response is None:
+                    continue
+                self.queries += 1
+                _PREFETCHED.set(url, response)
+                responses[url] = response
+                if self.record:
+                    self.store.add(service, urls[url], response)
+            return list(responses.values()), len(data)
+
+        responses, total = fetch("getSynsetIds",
+                                 [{'lemma': word, 'searchLang': self.language}
+                                  for word in dict.fromkeys(words)])
+        if not edges:
+            return total
+        ids = [entry["id"] for response in responses if response
+               for entry in response]
+        responses, count = fetch("getOutgoingEdges",
+                                 [{'id': babelnet_id,
+                                   'searchLang': self.language}
+                                  for babelnet_id in dict.fromkeys(ids)])
+        total += count
+        if not lemmas:
+            return total
+        targets = [edge.get("target") for response in responses if response
+                   for edge in response if edge.get("language") ==
+                   self.language]
+        _, count = fetch("getSynset", [{'id': target,
+                                        'searchLang': self.language}
+                                       for target in dict.fromkeys(targets)])
+        return total + count
+
+    @cached()
     def get_ids(self, word, full=False):
         """Returns the list of BabelNet IDS for a given word
 
@@ -139,20 +378,18 @@ class BaseBabelNet(Dictionary):
             (list): a list of BabelNet ids of the 'bn:00516031n' format
         """
 
-        service_url = 'https://babelnet.io/v5/getSynsetIds'
         res = []
-        params = {'lemma': word, 'searchLang': self.language,
-                  'key': self.babelnet_key}
-        url = service_url + '?' + urllib.parse.urlencode(params)
-
-        data = self.query(url)
+        params = {'lemma': word, 'searchLang': self.language}
+        data = self._request("getSynsetIds", params)
         if full:
             return data
+        if not data:
+            return res
         for result in data:
             res.append(result["id"])
         return res
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def get_lemmas(self, babelnet_id):
         """ Getting lemmas associated with a babelnet_id.
 
@@ -165,15 +402,13 @@ class BaseBabelNet(Dictionary):
 
         """
 
-        res = {}
-        service_url = 'https://babelnet.io/v5/getSynset'
-        params = {'id': babelnet_id, 'searchLang': self.language,
-                  'key': self.babelnet_key}
-        url = service_url + '?' + urllib.parse.urlencode(params)
-        data = self.query(url)
+        params = {'id': babelnet_id, 'searchLang': self.language}
+        data = self._request("getSynset", params)
 
-        senses = data.get("senses")
         res = []
+        if not data:
+            return res
+        senses = data.get("senses", [])
         for sense in senses:
             if sense["properties"]["language"] == self.language:
                 res.append(sense["properties"]["simpleLemma"])
@@ -184,7 +419,7 @@ class BaseBabelNet(Dictionary):
         res = self.post_process(res)
         return res
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def get_edges(self, babelnet_id):
         """ Getting babelnet_ids related to the given babelnet_id.
 
@@ -199,15 +434,13 @@ class BaseBabelNet(Dictionary):
         """
         # returns a dict of ids: list of [types/relation_groups] of words the
         #  target bnet_id is related to
-        res = {}
-        service_url = 'https://babelnet.io/v5/getOutgoingEdges'
-        params = {'id': babelnet_id, 'searchLang': self.language,
-                  'key': self.babelnet_key}
-        url = service_url + '?' + urllib.parse.urlencode(params)
-        data = self.query(url)
+        params = {'id': babelnet_id, 'searchLang': self.language}
+        data = self._request("getOutgoingEdges", params)
 
         res = {"other": [], "hypernyms": [], "hyponyms": [], "meronyms": [],
                "holonyms": [], "synonyms": [], "antonyms": []}
+        if not data:
+            return res
         #do synonyms work that way?
         for result in data:
             if self.language == result["language"]:
@@ -15,7 +15,7 @@
         * sleep option
 """
 
-import functools
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
 from wiktionaryparser import WiktionaryParser
@@ -24,6 +24,7 @@ from ldt.helpers.resources import lookup_language_by_code
 from ldt.helpers.wiktionary_cache import load_wiktionary_cache
 from ldt.dicts.dictionary import Dictionary
 from ldt.load_config import config
+from ldt.helpers.caching import cached
 
 
 class BaseWiktionary(Dictionary):
@@ -83,6 +84,17 @@ class BaseWiktionary(Dictionary):
             language = lookup_language_by_code(language, reverse=True)
         self._language = language
 
+    def cache_identity(self):
+        """The identity of the dictionary for caching (see
+        :func:`ldt.helpers.caching.resource_identity`). The Wiktionary pages
+        do not depend on the subclass, so all the Wiktionary dictionaries
+        for a language share the retrieved pages.
+
+        Note:
+            The subclasses that change the processing of the pages in their
+            cached methods should override this method."""
+        return ("Wiktionary", self._language, self.lowercasing)
+
     def load_cache(self):
         """Loading the cached list of titles of existing Wiktionary pages.
         If it doesn't exist, this list is created in the ldt resources directory
@@ -116,12 +128,35 @@ class BaseWiktionary(Dictionary):
                 return True
             return False
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    def prefetch(self, words, max_workers=config.get("http_workers", 8)):
+        """Retrieving the Wiktionary pages for a list of words in parallel
+        threads, so that the subsequent lookups of these words are served
+        from the query cache. If the cache of page titles is loaded,
+        only the existing pages are requested.
+
+        Args:
+            words (iterable): the words to look up
+            max_workers (int): the number of parallel requests
+
+        Returns:
+            (int): the number of retrieved pages
+        """
+        words = list(dict.fromkeys(words))
+        if self.cache:
+            words = [word for word in words if word in self.cache]
+        if not words:
+            return 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = list(executor.map(self.query, words))
+        return len([page for page in pages if page])
+
     def query(self, word):
         """A method to retrieve Wiktionary data online.
 
         A wrapper for `WiktionaryParser
         <https://www.github.com/Suyash458/WiktionaryParser>`_.
+        If the cache of page titles is loaded, the words without pages are
+        not queried.
 
         Args:
             word (str): word to be queried.
@@ -133,6 +168,23 @@ class BaseWiktionary(Dictionary):
             Find the specific error that is thrown when too many
             requests are made in parallel.
         """
+        if self.cache and not word in self.cache:
+            return None
+        return self._fetch(word)
+
+    @cached(persistent=True, cache_none=False)
+    def _fetch(self, word):
+        """Helper for :meth:`query`, retrieving the Wiktionary page of a word
+        regardless of the cache of page titles (so that the retrieved pages
+        can be shared by all the dictionaries with the same
+        :meth:`cache_identity`). The failed queries are not cached.
+
+        Args:
+            word (str): word to be queried.
+
+        Returns:
+            a list of Wiktionary data points, or None if the query failed
+        """
 
         #convert from language code to canonical name for Wiktionary parser
         language = lookup_language_by_code(self._language)
@@ -159,11 +211,4 @@ class BaseWiktionary(Dictionary):
                       "by the server.")
                 return None
 
-        if not self.cache:
-            return retrieve_wikidata(word)
-
-        else:
-            if not word in self.cache:
-                return None
-            else:
-                return retrieve_wikidata(word)
+        return retrieve_wikidata(word)
@@ -27,6 +27,48 @@ from ldt.helpers.formatting import _check_res
 from ldt.helpers.loading import load_language_file
 from ldt.helpers.exceptions import ResourceError
 
+def _build_trie(affixes, reverse=False):
+    """Helper for compiling a list of affixes into a character trie.
+
+    Args:
+        affixes (list): the affixes
+        reverse (bool): if True, the affixes are added from the last
+            character (for matching suffixes)
+
+    Returns:
+        (dict): nested dictionaries keyed by characters. The *None* key of a
+        node holds the indices (in the original list) of the affixes ending
+        there.
+    """
+    trie = {}
+    for index, affix in enumerate(affixes):
+        node = trie
+        for char in (reversed(affix) if reverse else affix):
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(index)
+    return trie
+
+def _match_trie(trie, word, reverse=False):
+    """Helper for finding all the affixes in a trie that the word starts (or
+    ends) with, in a single pass over the word.
+
+    Args:
+        trie (dict): the output of :func:`_build_trie`
+        word (str): the word to match
+        reverse (bool): if True, the word is matched from the end
+
+    Returns:
+        (list): the sorted indices of the matching affixes
+    """
+    res = list(trie.get(None, []))
+    node = trie
+    for char in (reversed(word) if reverse else word):
+        node = node.get(char)
+        if node is None:
+            break
+        res += node.get(None, [])
+    return sorted(res)
+
 #pylint: disable=too-many-instance-attributes
 class Affixes(BaseCustomDict):
     """This class implements a generic interface for custom
@@ -74,6 +116,7 @@ class Affixes(BaseCustomDict):
         #                             "for this language.")
 
         self.vowels = set(resources["vowels"])
+        # the affix lists are compiled into tries by the property setters
         self.prefixes = resources["prefixes"]
         self.suffixes = resources["suffixes"]
         self.suffix_families = resources["suffix_families"]
@@ -91,6 +134,87 @@ class Affixes(BaseCustomDict):
         self.insertions_before_consonants = resources[
             "insertions_before_consonants"]
 
+    @property
+    def prefixes(self):
+        """(list): the productive prefixes of the language."""
+        return self._prefixes
+
+    @prefixes.setter
+    def prefixes(self, value):
+        self._prefixes = value
+        self._prefix_trie = _build_trie(value)
+
+    @property
+    def suffixes(self):
+        """(list): the productive suffixes of the language."""
+        return self._suffixes
+
+    @suffixes.setter
+    def suffixes(self, value):
+        self._suffixes = value
+        self._suffix_trie = _build_trie(value, reverse=True)
+
+    @property
+    def suffix_families(self):
+        """(dict): the suffixes (values) that replace other suffixes (keys)
+        in the complex > simple direction."""
+        return self._suffix_families
+
+    @suffix_families.setter
+    def suffix_families(self, value):
+        self._suffix_families = value
+        self._family_suffixes = [(key, suffix) for key in value for suffix in
+                                 value[key]]
+        self._family_trie = _build_trie([x[1] for x in self._family_suffixes],
+                                        reverse=True)
+
+    @property
+    def exceptions(self):
+        """(dict): the exceptional derivational pairs ({word: root}) for
+        each affix or pattern."""
+        return self._exceptions
+
+    @exceptions.setter
+    def exceptions(self, value):
+        self._exceptions = value
+        # word > [(affix index, key index, affix, root)]
+        self._exceptions_forward = {}
+        # root > [(affix index, key index, affix, word)]
+        self._exceptions_reverse = {}
+        for i, affix in enumerate(value):
+            for j, (key, root) in enumerate(value[affix].items()):
+                self._exceptions_forward.setdefault(key, []).append(
+                    (i, j, affix, root))
+                self._exceptions_reverse.setdefault(root, []).append(
+                    (i, j, affix, key))
+
+    def _matching_prefixes(self, word):
+        """Helper for retrieving all the prefixes that the word starts
+        with, in the order of :attr:`prefixes`.
+
+        Args:
+            word (str): the word to check
+
+        Returns:
+            (list): the matching prefixes
+        """
+        return [self.prefixes[i] for i in _match_trie(self._prefix_trie,
+                                                      word)]
+
+    def _matching_suffixes(self, word):
+        """Helper for retrieving all the suffixes that the word ends with,
+        in the order of :attr:`suffixes`. All the suffix decomposition
+        strategies only consider these suffixes.
+
+        Args:
+            word (str): the word to check
+
+        Returns:
+            (list): the matching suffixes
+        """
+        return [self.suffixes[i] for i in _match_trie(self._suffix_trie, word,
+                                                      reverse=True)]
+
     def is_a_vowel(self, letter):
         """Returns True is the letter is a vowel
 
@@ -108,7 +232,9 @@ class Affixes(BaseCustomDict):
     def check_exceptions(self, word, res=None):
 
         """Method for retrieving derivational info that requires only simple
-        lookup in in the `DerivationCustomDict.exceptions`.
+        lookup in in the `DerivationCustomDict.exceptions`. The exception
+        tables are indexed by words and roots, so the cost of the lookup does
+        not depend on their size.
 
         Args:
             word_ (str): the word to analyze
@@ -121,28 +247,42 @@ class Affixes(BaseCustomDict):
 
         res = _check_res(res)
 
-        if not self.equidistant_patterns:
-            for affix in self.exceptions.keys():
-                for key, value in self.exceptions[affix].items():
-                    if key == word:
-                        res["suffixes"].append(affix)
-                        res["roots"].append(value)
-        else:
-            for affix in self.exceptions.keys():
-                for key, value in self.exceptions[affix].items():
-                    if key == word:
-                        if "root_vowel" in affix:
-                            res["other"].append(affix)
-                        else:
-                            res["suffixes"].append(affix)
-                        res["roots"].append(value)
-                    elif affix in self.equidistant_patterns:
-                        if value == word:
-                            if "root_vowel" in affix:
-                                res["other"].append(affix)
-                            else:
-                                res["suffixes"].append(affix)
-                            res["roots"].append(key)
+        matches = self._exceptions_forward.get(word, [])
+        if self.equidistant_patterns:
+            # for the equidistant patterns the roots can be looked up in the
+            # reverse direction (e.g. "deem" > "doom")
+            reverse = [x for x in self._exceptions_reverse.get(word, [])
+                       if x[2] in self.equidistant_patterns and x[3] != word]
+            if reverse:
+                matches = sorted(matches + reverse)
+
+        for _, _, affix, root in matches:
+            if self.equidistant_patterns and "root_vowel" in affix:
+                res["other"].append(affix)
+            else:
+                res["suffixes"].append(affix)
+            res["roots"].append(root)
+        return res
+
+    def check_exceptions_many(self, words):
+        """Batch version of :meth:`check_exceptions` for analyzing a whole
+        vocabulary.
+
+        Args:
+            words (iterable): the words to analyze
+
+        Returns:
+            (dict): the words with derivational data found in the
+            exceptions, with the same dictionaries as returned by
+            :meth:`check_exceptions`
+        """
+        res = {}
+        for word in words:
+            if word in self._exceptions_forward or \
+                    word in self._exceptions_reverse:
+                analysis = self.check_exceptions(word)
+                if analysis["roots"]:
+                    res[word] = analysis
         return res
 
     # def _check_res(self, res):
@@ -168,18 +308,17 @@ class Affixes(BaseCustomDict):
 
         res = _check_res(res)
 
-        for prefix in self.prefixes:
-            if word.startswith(prefix):
-                if word.startswith(prefix+"-") and len(word) > len(prefix)+1:
-                    # if ldt.dict.noise.is_a_word(word[len(p) + 1:]):
-                    if self.dictionary.is_a_word(word[len(prefix) + 1:]):
+        for prefix in self._matching_prefixes(word):
+            if word.startswith(prefix+"-") and len(word) > len(prefix)+1:
+                # if ldt.dict.noise.is_a_word(word[len(p) + 1:]):
+                if self.dictionary.is_a_word(word[len(prefix) + 1:]):
+                    res["prefixes"].append(prefix + "-")
+                    res["roots"].append(word[len(prefix) + 1:])
+            else:
+                if len(word) > len(prefix) +2:
+                    if self.dictionary.is_a_word(word[len(prefix):]):
                         res["prefixes"].append(prefix + "-")
-                        res["roots"].append(word[len(prefix) + 1:])
-                else:
-                    if len(word) > len(prefix) +2:
-                        if self.dictionary.is_a_word(word[len(prefix):]):
-                            res["prefixes"].append(prefix + "-")
-                            res["roots"].append(word[len(prefix):])
+                        res["roots"].append(word[len(prefix):])
         return res
 
     def _decompose_by_suffix_family(self, word, res=None):
@@ -195,18 +334,16 @@ class Affixes(BaseCustomDict):
         """
         res = _check_res(res)
 
-        for key, value in self.suffix_families.items():
-            key_suffix = key
-            suffixes = value
-            for suffix in suffixes:
-                if word.endswith(suffix) and len(word[:-len(suffix)]) > 2:
-                    candidate = word[:-len(suffix)]+key_suffix
-                    if self.dictionary.is_a_word(candidate):
-                        res["suffixes"].append(dash_suffix(suffix))
-                        res["roots"].append(candidate)
+        for i in _match_trie(self._family_trie, word, reverse=True):
+            key_suffix, suffix = self._family_suffixes[i]
+            if len(word[:-len(suffix)]) > 2:
+                candidate = word[:-len(suffix)]+key_suffix
+                if self.dictionary.is_a_word(candidate):
+                    res["suffixes"].append(dash_suffix(suffix))
+                    res["roots"].append(candidate)
         return res
 
-    def _decompose_suffix_simple(self, word, res=None):
+    def _decompose_suffix_simple(self, word, res=None, suffixes=None):
         """The most basic decomposition of suffixes: no change to the stem.
 
         Example:
@@ -218,16 +355,21 @@ class Affixes(BaseCustomDict):
         Args:
             word (str): a potential nonce-word
             res (dict): if present, this dictionary will be updated
+            suffixes (list): the suffixes that the word ends with (the
+                output of :meth:`_matching_suffixes`), if they were already
+                retrieved by the caller
 
         Returns:
             (dict): updated or newly created dictionary with derivational data
 
         """
         res = _check_res(res)
+        if suffixes is None:
+            suffixes = self._matching_suffixes(word)
 
-        for suffix in self.suffixes:
+        for suffix in suffixes:
 
-            if word.endswith(suffix) and len(word[:-len(suffix)]) > 2:
+            if len(word[:-len(suffix)]) > 2:
 
                 candidate = word[:-len(suffix)]
                 if self.dictionary.is_a_word(candidate):
@@ -235,7 +377,7 @@ class Affixes(BaseCustomDict):
                     res["roots"].append(candidate)
         return res
 
-    def _decompose_suffix_doubling(self, word, res=None):
+    def _decompose_suffix_doubling(self, word, res=None, suffixes=None):
         """Decomposing vowel suffixes that led to doubling of the final
         consonant of the root.
 
@@ -248,17 +390,22 @@ class Affixes(BaseCustomDict):
         Args:
             word (str): a potential nonce-word
             res (dict): if present, this dictionary will be updated
+            suffixes (list): the suffixes that the word ends with (the
+                output of :meth:`_matching_suffixes`), if they were already
+                retrieved by the caller
 
         Returns:
             (dict): updated or newly created dictionary with derivational data
 
         """
         res = _check_res(res)
+        if suffixes is None:
+            suffixes = self._matching_suffixes(word)
 
-        for suffix in self.suffixes:
+        for suffix in suffixes:
 
             if self.is_a_vowel(suffix[0]):
-                if word.endswith(suffix) and len(word[:-len(suffix)]) > 2:
+                if len(word[:-len(suffix)]) > 2:
                     if word[-(len(suffix)+1)] == word[-(len(suffix)+2)]:
                         candidate = word[:-len(suffix)-1]
                         if self.dictionary.is_a_word(candidate):
@@ -267,7 +414,7 @@ class Affixes(BaseCustomDict):
                             res["roots"].append(candidate)
         return res
 
-    def _decompose_suffix_replacements(self, word, res=None):
+    def _decompose_suffix_replacements(self, word, res=None, suffixes=None):
         """Decomposing suffixes with phonetic changes before vocalic or
         consonantal suffixes.
 
@@ -280,16 +427,21 @@ class Affixes(BaseCustomDict):
         Args:
             word (str): a potential nonce-word
             res (dict): if present, this dictionary will be updated
+            suffixes (list): the suffixes that the word ends with (the
+                output of :meth:`_matching_suffixes`), if they were already
+                retrieved by the caller
 
         Returns:
             (dict): updated or newly created dictionary with derivational data
 
         """
         res = _check_res(res)
+        if suffixes is None:
+            suffixes = self._matching_suffixes(word)
 
-        for suffix in self.suffixes:
+        for suffix in suffixes:
 
-            if word.endswith(suffix) and len(word[:-len(suffix)]) > 2:
+            if len(word[:-len(suffix)]) > 2:
 
                 if self.is_a_vowel(suffix[0]):
                     replacements = self.replacements_before_vowels
@@ -307,7 +459,7 @@ class Affixes(BaseCustomDict):
             # else:
         return res
 
-    def _decompose_suffix_insertions(self, word, res=None):
+    def _decompose_suffix_insertions(self, word, res=None, suffixes=None):
         """Decomposing suffixes with insertions before vocalic or consonantal
         suffixes.
 
@@ -320,16 +472,21 @@ class Affixes(BaseCustomDict):
         Args:
             word (str): a potential nonce-word
             res (dict): if present, this dictionary will be updated
+            suffixes (list): the suffixes that the word ends with (the
+                output of :meth:`_matching_suffixes`), if they were already
+                retrieved by the caller
 
         Returns:
             (dict): updated or newly created dictionary with derivational data
 
         """
         res = _check_res(res)
+        if suffixes is None:
+            suffixes = self._matching_suffixes(word)
 
-        for suffix in self.suffixes:
+        for suffix in suffixes:
 
-            if word.endswith(suffix) and len(word[:-len(suffix)]) > 2:
+            if len(word[:-len(suffix)]) > 2:
 
                 if self.is_a_vowel(suffix[0]):
                     insertions = self.insertions_before_vowels
@@ -344,7 +501,7 @@ class Affixes(BaseCustomDict):
                         res["roots"].append(candidate)
         return res
 
-    def _decompose_suffix_blend(self, word, res=None):
+    def _decompose_suffix_blend(self, word, res=None, suffixes=None):
         """Decomposing suffixes with replacements (typically due to the
         blending of identical sounds at the affix border).
 
@@ -357,16 +514,21 @@ class Affixes(BaseCustomDict):
         Args:
             word (str): a potential nonce-word
             res (dict): if present, this dictionary will be updated
+            suffixes (list): the suffixes that the word ends with (the
+                output of :meth:`_matching_suffixes`), if they were already
+                retrieved by the caller
 
         Returns:
             (dict): updated or newly created dictionary with derivational data
 
         """
         res = _check_res(res)
+        if suffixes is None:
+            suffixes = self._matching_suffixes(word)
 
-        for suffix in self.suffixes:
+        for suffix in suffixes:
 
-            if word.endswith(suffix) and len(word[:-len(suffix)]) > 2:
+            if len(word[:-len(suffix)]) > 2:
 
                 for pair in self.replacements_in_suffixes:
                     if suffix[0] == pair[1]:
@@ -420,7 +582,8 @@ class Affixes(BaseCustomDict):
 
         """
         res = _check_res(res)
-        res = self._decompose_suffix_simple(word, res)
+        suffixes = self._matching_suffixes(word)
+        res = self._decompose_suffix_simple(word, res, suffixes=suffixes)
         # res = self._decompose_suffix_doubling(word, res)
         # res = self._decompose_suffix_replacements(word, res)
         # res = self._decompose_suffix_insertions(word, res)
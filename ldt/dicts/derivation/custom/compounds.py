@@ -141,6 +141,10 @@ class Compounds(BaseCustomDict):
         :meth:`_in_vocab`). By default filters out analyses with overly
         short subwords, and does not handle short words.
 
+        Each substring is only looked up once, the splits of the rest of the
+        word are memoized, and the branches that could only yield analyses
+        rejected by the min_split filter are not explored.
+
         Example:
             >>> print(split_compound("tomcat", min_length=3))
             [['tom', 'cat']]
@@ -167,57 +171,59 @@ class Compounds(BaseCustomDict):
         if len(word) < min_length:
             return [[word]]
 
-        def build_stem_tree(compound):
-            """Helper for building the tree-like dictionary structure with
-                all possible splits of the word
+        max_short = None
+        if filtering:
+            if filtering.startswith("min_split"):
+                min_length = int(filtering.strip("min_split_"))
+                max_short = _max_short_subwords(len(word), min_length)
+
+        # the validity of each substring is only checked once per word
+        valid = {}
+        def in_vocab(subword):
+            """Helper for memoizing :meth:`_in_vocab`."""
+            if not subword in valid:
+                valid[subword] = bool(self._in_vocab(subword))
+            return valid[subword]
+
+        splits = {}
+        def split(compound, budget):
+            """Helper for retrieving all possible splits of the (rest of
+            the) word, as lists of stems. If no prefix of the word is a stem,
+            the word is considered unanalyzable and ignored.
 
             Args:
                 compound (str): the word to analyze
+                budget (int): the number of stems shorter than min_length
+                    that the analysis can still contain (None for no limit)
 
             Returns:
-                (dict): nested dictionaries with keys for split nodes
-
-            Todo:
-                * filtering by frequency
-                * filtering by embedding similarity
-                * filtering by ngrams
-
+                (list): list of lists of stems
             """
-
-            if not isinstance(compound, dict):
-                res = {compound + " ": {}}
-            for i in res:
-                for k in range(1, len(i)):
-                    if self._in_vocab(i[:k]) and i[:k] != i:
-                        res[i][i[:k]] = build_stem_tree(i[k:].strip())
+            if (compound, budget) in splits:
+                return splits[(compound, budget)]
+            res = []
+            has_stems = False
+            for k in range(1, len(compound)+1):
+                if not in_vocab(compound[:k]):
+                    continue
+                has_stems = True
+                next_budget = budget
+                if budget is not None and k < min_length:
+                    if not budget:
+                        # the analysis would be filtered out anyway
+                        continue
+                    next_budget = budget - 1
+                for rest in split(compound[k:].strip(), next_budget):
+                    res.append([compound[:k]] + rest)
+            if not has_stems:
+                res = [[]]
+            splits[(compound, budget)] = res
             return res
 
-        tree = build_stem_tree(word)
-
-        lists = []
-        #pylint: disable=dangerous-default-value
-        def tree_traverse_iter(tree, prefix=[]):
-            """Helper for flattening the dictionary tree structure into a
-            list of lists with all possible splits"""
-            for key in tree:
-                if tree[key] == {}:
-                    lists.append(prefix + [key])
-                else:
-                    tree_traverse_iter(tree[key], prefix + [key])
-
-        tree_traverse_iter(tree)
-        cleaned = []
-        for i in range(len(lists)):
-            cleaned_list = [lists[i][ind] for ind in range(len(lists[i])) if
-                            int(ind/2) != ind/2]
-            cleaned.insert(i, cleaned_list)
-
-        cleaned = [i for i in cleaned if i != [word]]
+        cleaned = [i for i in split(word, max_short) if i != [word]]
 
-        if filtering:
-            if filtering.startswith("min_split"):
-                min_length = int(filtering.strip("min_split_"))
-                cleaned = filter_by_min_length(cleaned, min_length)
+        if max_short is not None:
+            cleaned = filter_by_min_length(cleaned, min_length)
 
         return cleaned
 
@@ -263,6 +269,32 @@ class Compounds(BaseCustomDict):
         return res
 
 
+def _max_short_subwords(length, min_length, threshold=0.1):
+    """Helper for :meth:`Compounds.split_compound`: the maximum number of
+    subwords shorter than *min_length* that an analysis of a word of the
+    given length can contain and still pass :func:`filter_by_min_length`.
+
+    Args:
+        length (int): the length of the word
+        min_length (int): the minimum length of words in an acceptable
+            analysis
+        threshold: the acceptable ratio of short to longer words in the
+            analysis
+
+    Returns:
+        (int): the maximum number of short subwords
+    """
+    short = 0
+    while True:
+        candidate = short + 1
+        # the minimum number of subwords for this ratio to be acceptable
+        total = int(candidate / threshold) + 1
+        while not candidate/total < threshold:
+            total += 1
+        if (total - candidate) * min_length + candidate > length:
+            return short
+        short = candidate
+
 def filter_by_min_length(splits, min_length, threshold=0.1):
     """Filtering out those compound analyses that contain over a
     threshold ratio of words over specified length.
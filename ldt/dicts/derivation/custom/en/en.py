@@ -160,15 +160,18 @@ class EnglishDerivation(DerivationCustomDict):
         """
         res = _check_res(res)
         res = self._decompose_language_specific_suffixes(word, res)
-        res = self._decompose_suffix_simple(word, res)
-        res = self._decompose_suffix_doubling(word, res)
-        res = self._decompose_suffix_replacements(word, res)
-        res = self._decompose_suffix_insertions(word, res)
-        res = self._decompose_suffix_blend(word, res)
+        # the suffixes of the word are matched once for all the strategies
+        suffixes = self._matching_suffixes(word)
+        for strategy in [self._decompose_suffix_simple,
+                         self._decompose_suffix_doubling,
+                         self._decompose_suffix_replacements,
+                         self._decompose_suffix_insertions,
+                         self._decompose_suffix_blend]:
+            res = strategy(word, res, suffixes=suffixes)
 
         return res
 
-    def _decompose_suffix_e(self, word, res=None):
+    def _decompose_suffix_e(self, word, res=None, suffixes=None):
         """Decomposing consonant suffixes before which final "e" was dropped.
 
         Example:
@@ -180,16 +183,21 @@ class EnglishDerivation(DerivationCustomDict):
         Args:
             word (str): a potential nonce-word
             res (dict): if present, this dictionary will be updated
+            suffixes (list): the suffixes that the word ends with (the
+                output of :meth:`_matching_suffixes`), if they were already
+                retrieved by the caller
 
         Returns:
             (dict): updated or newly created dictionary with derivational data
 
         """
         res = _check_res(res)
+        if suffixes is None:
+            suffixes = self._matching_suffixes(word)
 
-        for suffix in self.suffixes:
+        for suffix in suffixes:
 
-            if word.endswith(suffix) and self.is_a_vowel(suffix[0]):
+            if self.is_a_vowel(suffix[0]):
 
                 candidate = word[:-len(suffix)] + "e"
                 if self.dictionary.is_a_word(candidate):
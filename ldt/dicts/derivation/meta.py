@@ -16,18 +16,54 @@ Examples:
     'many-kinded', 'first-of-its-kind', 'kind of', 'kindful', 'kindless'],
      'roots': ['kind'], 'suffixes': ['-ness']}
 
+    The analysis of a whole vocabulary can be pre-computed in parallel, and
+    saved to disk to be re-used in other experiments:
+
+    >>> test_dict = ldt.dicts.derivation.analyze.DerivationAnalyzer(
+    persistent_cache=True)
+    >>> res = test_dict.analyze_many(["kindness", "unkind"], n_jobs=4)
+
 Note:
     Only English is fully supported for analysis of productive
     morphological patterns at the moment.
 
 """
 
+import os
+import copy
+import hashlib
+import multiprocessing
+
+from nltk.corpus import wordnet as wn
+
+from ldt._version import __version__
 from ldt.dicts.dictionary import Dictionary
 from ldt.load_config import config
 from ldt.dicts.derivation.wiktionary import DerivationWiktionary
 from ldt.dicts.derivation.wordnet.en import DerivationWordNet
 from ldt.dicts.derivation.custom.en.en import EnglishDerivation
 from ldt.helpers.resources import update_dict
+from ldt.helpers.persistent_cache import PersistentCache
+from ldt.helpers.profiling import get_profiler, profiled
+from ldt.helpers.wiktionary_cache import find_vocab_file
+from ldt.helpers.wiktionary_cache import get_cache_dir
+
+#: the analyzer object of a worker process of
+#: :meth:`DerivationAnalyzer.analyze_many`
+_analyzer = None
+
+def _init_worker(analyzer):
+    """Helper for :meth:`DerivationAnalyzer.analyze_many`: setting up the
+    analyzer of a worker process. The analyzer is passed as an argument of
+    the pool initializer, so that it reaches the workers with any process
+    start method (including *spawn*)."""
+    global _analyzer #pylint: disable=global-statement
+    _analyzer = analyzer
+
+def _analyze_one(word):
+    """Helper for :meth:`DerivationAnalyzer.analyze_many`: analyzing a word
+    in a worker process set up by :func:`_init_worker`."""
+    return _analyzer._analyze(word) #pylint: disable=protected-access
 
 class DerivationAnalyzer(Dictionary):
     """DerivationAnalyzer class combines to all derivation analysis
@@ -36,7 +72,22 @@ class DerivationAnalyzer(Dictionary):
     # pylint: disable=unused-argument
 
     def __init__(self, language=config["default_language"],
-                 lowercasing=config["lowercasing"]):
+                 lowercasing=config["lowercasing"],
+                 persistent_cache=config.get("persistent_cache", False)):
+        """Initializing the analyzer.
+
+        Args:
+            language (str): the language of the analyzed words
+            lowercasing (bool): *True* if all data should be lowercased
+            persistent_cache (bool, str or PersistentCache): if True,
+                the analyses are saved to the default persistent cache file,
+                so that they are re-used across experiments and shared by
+                worker processes. A path to another cache file or a
+                :class:`~ldt.helpers.persistent_cache.PersistentCache`
+                object can also be passed. The stored analyses are kept
+                separately for different versions of ldt and its resources.
+
+        """
 
         super(DerivationAnalyzer, self).__init__(language=language,
                                                  lowercasing=lowercasing)
@@ -48,6 +99,46 @@ class DerivationAnalyzer(Dictionary):
             self.custom = None
 
         self.wiktionary = DerivationWiktionary(language=language)
+
+        #: pre-computed analyses (see :meth:`analyze_many`)
+        self._analyzed = {}
+
+        #: (PersistentCache): the persistent store for the analyses, if any
+        self.persistent_cache = None
+        if isinstance(persistent_cache, PersistentCache):
+            self.persistent_cache = persistent_cache
+        elif persistent_cache:
+            namespace = "derivation_" + self.language + "_" + \
+                        self.resource_version()
+            path = persistent_cache if isinstance(persistent_cache,
+                                                  str) else None
+            self.persistent_cache = PersistentCache(namespace=namespace,
+                                                    path=path)
+
+    def resource_version(self):
+        """Identifying the versions of the resources that the analysis
+        depends on: ldt itself, the language file with productive affixes,
+        WordNet and the Wiktionary page cache.
+
+        Returns:
+            (str): a short hash of the resource versions
+        """
+        versions = [__version__, self.language]
+        if self.custom:
+            path = os.path.dirname(os.path.realpath(__file__))
+            path = os.path.join(path, "custom", self.language,
+                                self.language + ".yaml")
+            if os.path.isfile(path):
+                with open(path, "rb") as stream:
+                    versions.append(hashlib.md5(stream.read()).hexdigest())
+        if self.wordnet:
+            versions.append("wordnet-" + str(wn.get_version()))
+        if self.wiktionary.cache:
+            path_to_cache = get_cache_dir(config["path_to_resources"])
+            versions.append(find_vocab_file(self.wiktionary.language,
+                                            path_to_cache))
+        return hashlib.md5("|".join(versions).encode()).hexdigest()[:12]
+
     def is_a_word(self, word):
         return self.wiktionary.is_a_word(word)
 
@@ -63,13 +154,18 @@ class DerivationAnalyzer(Dictionary):
         """
         res = {'original_word': [word], 'other': [], 'prefixes': [],
                'roots': [], 'suffixes': []}
+        profiler = get_profiler()
         if self.custom:
-            res = self.custom.analyze_affixes(word)
+            res = profiler.call("DerivationAnalyzer.analyze", "custom",
+                                self.custom.analyze_affixes, word)
             if not res["roots"]:
-                compounds = self.custom.decompose_compound(word)
+                compounds = profiler.call("DerivationAnalyzer.analyze",
+                                          "custom",
+                                          self.custom.decompose_compound, word)
                 res = update_dict(res, compounds)
         if not res["roots"]:
-            etym = self.wiktionary.get_etymologies(word)
+            etym = profiler.call("DerivationAnalyzer.analyze", "wiktionary",
+                                 self.wiktionary.get_etymologies, word)
 
             if etym:
                 res["roots"] = etym[0]
@@ -91,27 +187,86 @@ class DerivationAnalyzer(Dictionary):
             (list of str): list of words derivationally related to the target word.
         """
         family = []
+        profiler = get_profiler()
         if self.wordnet:
             try:
-                family += self.wordnet.get_related_words(word)
+                family += profiler.call("DerivationAnalyzer.analyze",
+                                        "wordnet",
+                                        self.wordnet.get_related_words, word)
             except TypeError:
                 pass
 
-        family += self.wiktionary.get_related_words(word)
+        family += profiler.call("DerivationAnalyzer.analyze", "wiktionary",
+                                self.wiktionary.get_related_words, word)
         if family:
             family = list(set(family))
             return family
         return []
 
+    @profiled("DerivationAnalyzer.analyze")
     def analyze(self, word):
         """Bringing together all derivational information for the query word.
 
+        The analysis is looked up in the pre-computed analyses and in the
+        persistent store first, if it is enabled.
+
         Args:
             word (str): the word to look up.
 
         Returns:
             (dict of str): the derivational analysis data.
         """
+        if word in self._analyzed:
+            get_profiler().record_hit("DerivationAnalyzer.analyze")
+            return copy.deepcopy(self._analyzed[word])
+        if self.persistent_cache is not None:
+            res = self.persistent_cache.get(word)
+            if res is not None:
+                get_profiler().record_hit("DerivationAnalyzer.analyze")
+                return res
+        res = self._analyze(word)
+        if self.persistent_cache is not None:
+            self.persistent_cache.set(word, res)
+        return res
+
+    def analyze_many(self, words, n_jobs=1):
+        """Pre-computing the derivational analysis for a whole vocabulary,
+        so that subsequent :meth:`analyze` calls become lookups. If the
+        persistent store is enabled, only the words not yet in it are
+        analyzed, and the new analyses are saved to it.
+
+        Args:
+            words (iterable): the words to analyze
+            n_jobs (int): the number of processes to use
+
+        Returns:
+            (dict): the words with their derivational analysis data, in the
+            order of the input (without duplicates)
+        """
+        words = list(dict.fromkeys(words))
+        res = {}
+        if self.persistent_cache is not None:
+            res = self.persistent_cache.get_many(words)
+        to_analyze = [word for word in words if not word in res]
+
+        if n_jobs > 1 and len(to_analyze) > 1:
+            chunksize = max(1, len(to_analyze) // (n_jobs * 4))
+            with multiprocessing.Pool(n_jobs, initializer=_init_worker,
+                                      initargs=(self,)) as pool:
+                analyses = pool.map(_analyze_one, to_analyze,
+                                    chunksize=chunksize)
+        else:
+            analyses = [self._analyze(word) for word in to_analyze]
+        new = dict(zip(to_analyze, analyses))
+
+        if self.persistent_cache is not None and new:
+            self.persistent_cache.set_many(new)
+        res.update(new)
+        self._analyzed.update(res)
+        return {word: res[word] for word in words}
+
+    def _analyze(self, word):
+        """Helper for :meth:`analyze`: the actual analysis."""
         res = self._get_constituents(word)
         res["related_words"] = []
         if res["roots"]:
@@ -9,12 +9,12 @@ Wiktionary.
 """
 
 from difflib import SequenceMatcher
-import functools
 
 from ldt.helpers.formatting import strip_non_alphabetical_characters
 from ldt.dicts.base.wiktionary import BaseWiktionary
 from ldt.dicts.semantics.wiktionary import Wiktionary
 from ldt.load_config import config
+from ldt.helpers.caching import cached
 
 class DerivationWiktionary(BaseWiktionary):
     """This class implements querying morphological information from
@@ -56,7 +56,7 @@ class DerivationWiktionary(BaseWiktionary):
             return etymologies
 
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def get_etymologies(self, word, exclude_old_sources=None):
         """Rule-based parsing of Wiktionary etymologies.
 
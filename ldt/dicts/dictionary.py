@@ -29,7 +29,7 @@ from ldt.helpers.resources import load_stopwords
 from ldt.helpers.resources import lookup_language_by_code as lookup_language
 from ldt.helpers.formatting import get_spacing_variants
 from ldt.helpers.formatting import remove_text_inside_brackets
-from ldt.load_config import config
+from ldt.load_config import config, nltk_download
 
 class Dictionary(metaclass=abc.ABCMeta):
     """The base LDT dictionary class.
@@ -54,7 +54,7 @@ class Dictionary(metaclass=abc.ABCMeta):
                 in all LDT resources
 
         """
-
+        nltk_download()
         self._language = language
         self.lowercasing = lowercasing
 
@@ -16,18 +16,27 @@ class MorphBabelNet(MorphDictionary, BaseBabelNet):
 
     def __init__(self, language=config["default_language"],
                  lowercasing=config["lowercasing"],
-                 babelnet_key=config["babelnet_key"]):
+                 babelnet_key=config["babelnet_key"],
+                 babelnet_store=config.get("babelnet_store", None),
+                 record=False):
         """ Initializing the base class.
 
         Args:
             language (str): the language of the query
             babelnet_key (bool): the user key for BabelNet API
+            babelnet_store (str or BabelNetStore): the local store of
+                BabelNet data (or the path to it) to be used instead of the
+                online API
+            record (bool): if True, the responses of the online API are
+                saved to the local store
 
         """
 
         super(MorphBabelNet, self).__init__(language=language,
                                             babelnet_key=babelnet_key,
-                                            lowercasing=lowercasing)
+                                            lowercasing=lowercasing,
+                                            babelnet_store=babelnet_store,
+                                            record=record)
 
     def get_pos(self, word, formatting="dict"):
         """Retrieving parts of speech for a given word.
@@ -66,11 +75,11 @@ class MorphBabelNet(MorphDictionary, BaseBabelNet):
                             "interjection", "num": "numeral"}
 
         if res:
-            for i in res:
+            for i in list(res):
                 if i in replacements:
                     res[replacements[i]] = res.pop(i)
 
-        if format == "list":
+        if formatting == "list":
             res = list(res.keys())
         return res
 
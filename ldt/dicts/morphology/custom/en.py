@@ -12,12 +12,12 @@
 """
 
 import inflect
-import functools
 
 from ldt.dicts.morphology.morph_dictionary import MorphDictionary
 from ldt.dicts.base.custom.en import BaseCustomDict
 from ldt.dicts.base.wordnet.en import BaseWordNet
 from ldt.load_config import config
+from ldt.helpers.caching import cached
 
 
 class MorphCustomDict(MorphDictionary, BaseCustomDict):
@@ -45,13 +45,13 @@ class MorphCustomDict(MorphDictionary, BaseCustomDict):
     def get_form(self, word):
         pass
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def is_a_word(self, word):
         if self._lemmatize(word):
             return True
         return False
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def _lemmatize(self, word):
         """ A crude rule-based fallback for (frequent) cases where WordNet
         lemmatizer fails.
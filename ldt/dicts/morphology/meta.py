@@ -26,7 +26,6 @@ TODO:
 
 """
 
-import functools
 
 from ldt.helpers.exceptions import AuthorizationError
 
@@ -35,7 +34,9 @@ from ldt.dicts.morphology.wiktionary import MorphWiktionary
 from ldt.dicts.morphology.wordnet.en import MorphWordNet
 from ldt.dicts.morphology.babelnet import MorphBabelNet
 from ldt.dicts.morphology.custom.en import MorphCustomDict
+from ldt.helpers.profiling import get_profiler, profiled
 from ldt.load_config import config
+from ldt.helpers.caching import cached
 
 class MorphMetaDict(Dictionary):
     """Class implementing a collection of dictionaries which are queried in
@@ -94,7 +95,8 @@ class MorphMetaDict(Dictionary):
             self._dicts[dictionary] = self.custom
             self._order.append(dictionary)
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @profiled("MorphMetaDict.is_a_word")
+    @cached()
     def is_a_word(self, word, minimal=True):
         """ Returning the name of the resource containing an entry for the
         queried word (the first in the pre-defined order).
@@ -117,8 +119,10 @@ class MorphMetaDict(Dictionary):
 
         """
         res = []
+        profiler = get_profiler()
         for dictionary in self._order:
-            if self._dicts[dictionary].is_a_word(word):
+            if profiler.call("MorphMetaDict.is_a_word", dictionary,
+                             self._dicts[dictionary].is_a_word, word):
                 res.append(dictionary)
                 if minimal:
                     return res
@@ -126,7 +130,8 @@ class MorphMetaDict(Dictionary):
             return res
         return None
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @profiled("MorphMetaDict.get_pos")
+    @cached()
     def get_pos(self, word, minimal=True):
         """Getting the possible POSes for the word.
 
@@ -148,20 +153,27 @@ class MorphMetaDict(Dictionary):
 
         """
         res = []
+        profiler = get_profiler()
         dicts = self.is_a_word(word, minimal)
         if dicts:
             if not minimal:
                 for dictionary in dicts:
-                    candidates = self._dicts[dictionary].get_pos(word, formatting="list")
+                    candidates = profiler.call(
+                        "MorphMetaDict.get_pos", dictionary,
+                        self._dicts[dictionary].get_pos, word,
+                        formatting="list")
                     if candidates:
                         res += candidates
             else:
-                res = self._dicts[dicts[0]].get_pos(word, formatting="list")
+                res = profiler.call("MorphMetaDict.get_pos", dicts[0],
+                                    self._dicts[dicts[0]].get_pos, word,
+                                    formatting="list")
         if res:
             return list(set(res))
         return None
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @profiled("MorphMetaDict.lemmatize")
+    @cached()
     def lemmatize(self, word):
         """Returns a list of lemmas of the target word.
 
@@ -172,13 +184,16 @@ class MorphMetaDict(Dictionary):
             (list): lemmas of the word
         """
         res = []
+        profiler = get_profiler()
 
         if "wordnet" in self._dicts:
-            wordnet = self._dicts["wordnet"].lemmatize(word)
+            wordnet = profiler.call("MorphMetaDict.lemmatize", "wordnet",
+                                    self._dicts["wordnet"].lemmatize, word)
             if wordnet:
                 return wordnet
         if hasattr(self, "custom"):
-            res = self.custom.lemmatize(word)
+            res = profiler.call("MorphMetaDict.lemmatize", "custom",
+                                self.custom.lemmatize, word)
             if res:
                 return res
         return None
\ No newline at end of file
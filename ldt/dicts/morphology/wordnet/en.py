@@ -6,7 +6,8 @@ Princeton WordNet.
 
      - Retrieving POS information;
      - Retrieving morphological form of an entry;
-     - Retrieving possible lemmas of a word.
+     - Retrieving possible lemmas of a word;
+     - Pre-computing lemmas and POS tags for a whole vocabulary.
 
 Note:
 
@@ -29,11 +30,79 @@ from ldt.dicts.base.wordnet.en import BaseWordNet
 from ldt.dicts.morphology.morph_dictionary import MorphDictionary
 from ldt.load_config import config
 from ldt.helpers.loading import load_resource
+from ldt.helpers.caching import register_cache
+
+_LEMMATIZER = WordNetLemmatizer()
+
+#: the path to the pre-built list of WordNet lemmas
+LEMMAS_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                           "en.vocab")
+
+#: the WordNet POS tags with the names used in ldt. LDT ignores the
+#: distinction between "head" and "satellite" adjectives.
+_POS_NAMES = {"n": "noun", "v": "verb", "a": "adjective", "r": "adverb",
+              "s": "adjective"}
+
+#: the inflected form -> {"lemmas": [...], "pos": {...}} index, filled by
+#: :meth:`MorphWordNet.build_index` and bounded by the cache budgets (see
+#: :mod:`ldt.helpers.caching`)
+_INDEX = register_cache("MorphWordNet.index")
+
+_TABLES = {}
+
+def _wordnet_tables():
+    """Helper for retrieving the exception lists, the morphy substitution
+    rules and the lemma index of WordNet, which are loaded once per
+    process.
+
+    Returns:
+        (dict): the tables under the *exceptions*, *rules* and *lemmas* keys
+    """
+    if not _TABLES:
+        # pylint: disable=protected-access
+        _TABLES["exceptions"] = wn._exception_map
+        _TABLES["rules"] = wn.MORPHOLOGICAL_SUBSTITUTIONS
+        _TABLES["lemmas"] = wn._lemma_pos_offset_map
+    return _TABLES
+
+def _morphy(word, pos, tables):
+    """Helper for finding the base forms of a word for one POS, with the
+    same algorithm as WordNet morphy: the exception list of the POS if the
+    word is in it, and the suffix substitution rules otherwise.
+
+    Args:
+        word (str): the (lowercased) word
+        pos (str): the WordNet POS tag ("n", "v", "a" or "r")
+        tables (dict): the output of :func:`_wordnet_tables`
+
+    Returns:
+        (list): the base forms found in WordNet for this POS
+    """
+    exceptions = tables["exceptions"][pos]
+    if word in exceptions:
+        forms = exceptions[word]
+    else:
+        forms = [word[:-len(old)] + new for old, new in tables["rules"][pos]
+                 if word.endswith(old)]
+    res = []
+    for form in [word] + list(forms):
+        if pos in tables["lemmas"].get(form, {}) and not form in res:
+            res.append(form)
+    return res
 
 
 class MorphWordNet(MorphDictionary, BaseWordNet):
     """This class implements an interface for retrievning POS
-    information from NLTK WordNet and lemmatization."""
+    information from NLTK WordNet and lemmatization.
+
+    Note:
+        The results of :meth:`get_pos` and :meth:`lemmatize` can be
+        pre-computed for a whole vocabulary with :meth:`build_index`. The
+        index is shared by all instances of the class, so that the
+        normalization and derivation modules that create their own
+        :class:`MorphWordNet` objects benefit from it as well.
+
+    """
 
     def __init__(self, language=config["default_language"],
                  lowercasing=config["lowercasing"]):
@@ -50,9 +119,7 @@ class MorphWordNet(MorphDictionary, BaseWordNet):
 
         # loading a pre-built list of wordnet lemmas. building it anew on
         # initialization of dictionary is too slow.
-        dir_path = os.path.dirname(os.path.realpath(__file__))
-        lemmas_path = os.path.join(dir_path, "en.vocab")
-        lemmas = load_resource(lemmas_path)
+        lemmas = load_resource(LEMMAS_PATH)
         self.lemmas = lemmas
         # all_wn_lemmas = []
         # for synset in wn.all_synsets():
@@ -84,26 +151,36 @@ class MorphWordNet(MorphDictionary, BaseWordNet):
             * pos format
         """
         word = self._lowercase(word)
+        entry = _INDEX.get(word, None)
+        if entry is not None:
+            res = dict(entry["pos"])
+        else:
+            res = self._get_pos(word)
+        if formatting == "list":
+            res = list(res.keys())
+        return res
+
+    @staticmethod
+    def _get_pos(word):
+        """Helper for counting the WordNet senses of a word per POS.
+
+        Args:
+            word (str): the word to be looked up
+
+        Returns:
+            (dict): part-of-speech tags with number of senses as values
+        """
         poses = []
         res = {}
         tags = [".v.", ".n.", ".a.", ".r.", ".s."]
         for synset in wn.synsets(word):
             name = synset.name()
-            #        ss.append(s.name())
             for tag in tags:
                 if tag in name:
                     poses.append(tag.strip("."))
-        for pos in list(set(poses)):
-            res[pos] = poses.count(pos)
-        # normalize the pos tags
-        new_tags = {
-            "n": "noun", "v": "verb", "a": "adjective", "r": "adverb",
-            "s": "adjective"
-        }
-        new_res = {new_tags[k]: res[k] for k in res}
-        if formatting == "list":
-            new_res = list(new_res.keys())
-        return new_res
+        for pos in poses:
+            res[_POS_NAMES[pos]] = res.get(_POS_NAMES[pos], 0) + 1
+        return res
 
     def lemmatize(self, word):
         """The method returning all possible dictionary form(s) for a given
@@ -122,27 +199,118 @@ class MorphWordNet(MorphDictionary, BaseWordNet):
         Todo:
         """
         word = self._lowercase(word)
+        entry = _INDEX.get(word, None)
+        if entry is not None:
+            return list(entry["lemmas"])
+        return self._lemmatize(word)
+
+    def _lemmatize(self, word):
+        """Helper for lemmatizing a (lowercased) word with WordNet
+        morphy rules and exception lists.
+
+        Args:
+            word (str): the word to be looked up
+
+        Returns:
+            (list): lemma(s) of the given word
+        """
         res = []
         if word in self.lemmas:
             res.append(word)
         if word[-1] in ["e", "t", "n", "d", "w", "g", "k", "l", "s", "y",
                         "m", "n"]:
-            verb = WordNetLemmatizer().lemmatize(word, 'v')
+            verb = _LEMMATIZER.lemmatize(word, 'v')
             if verb != word:
                 res.append(verb)
         if word.endswith("er") or word.endswith("est"):
-            adjective = WordNetLemmatizer().lemmatize(word, 'a')
+            adjective = _LEMMATIZER.lemmatize(word, 'a')
             if adjective != word:
                 res.append(adjective)
         if word.endswith("s"):
-            noun = WordNetLemmatizer().lemmatize(word, 'n')
+            noun = _LEMMATIZER.lemmatize(word, 'n')
             if noun != word:
                 res.append(noun)
         if not res:
             if self.is_a_word(word):
                 res.append(word)
-        # for synset in wn.synsets(word):
-        #     if synset.name().split(".")[0] == word:
-        #         res.append(word)
-        #         break
         return list(set(res))
+
+    def build_index(self, vocabulary):
+        """Pre-computing lemmas and POS information for a whole vocabulary
+        (e.g. that of an embedding), so that subsequent calls to
+        :meth:`lemmatize` and :meth:`get_pos` are dictionary lookups.
+
+        The entries are computed from the exception lists, the morphy rules
+        and the lemma index of WordNet directly, without creating synsets.
+        Words not found in WordNet are indexed too (with empty lemmas and
+        POS), since the negative lookups are the most frequent ones for noisy
+        vocabularies. The index is bounded by the budget of the
+        *MorphWordNet.index* cache (see :mod:`ldt.helpers.caching`).
+
+        Args:
+            vocabulary (iterable): the words to index
+
+        Returns:
+            (dict): the index entries for the given vocabulary, with
+            *lemmas* and *pos* keys for each word
+
+        """
+        tables = _wordnet_tables()
+        res = {}
+        for word in vocabulary:
+            if not word:
+                continue
+            word = self._lowercase(word)
+            if word in res:
+                continue
+            entry = _INDEX.get(word, None)
+            if entry is None:
+                entry = self._index_entry(word, tables)
+                _INDEX.set(word, entry)
+            res[word] = entry
+        return res
+
+    def _index_entry(self, word, tables):
+        """Helper for computing the lemmas and POS of a (lowercased) word
+        from the WordNet tables, in the same way as :meth:`_lemmatize` and
+        :meth:`_get_pos`.
+
+        Args:
+            word (str): the word
+            tables (dict): the output of :func:`_wordnet_tables`
+
+        Returns:
+            (dict): the *lemmas* and *pos* of the word
+        """
+        forms = {pos: _morphy(word, pos, tables) for pos in "nvar"}
+        pos = {}
+        for tag in forms:
+            # the synsets are looked up case-insensitively
+            senses = sum(len(tables["lemmas"][x][tag]) for x in
+                         _morphy(word.lower(), tag, tables))
+            if senses:
+                pos[_POS_NAMES[tag]] = senses
+
+        def shortest(tag):
+            """The output of the WordNet lemmatizer for a POS."""
+            return min(forms[tag], key=len) if forms[tag] else word
+
+        lemmas = []
+        if word in self.lemmas:
+            lemmas.append(word)
+        if word[-1] in ["e", "t", "n", "d", "w", "g", "k", "l", "s", "y",
+                        "m", "n"] and shortest("v") != word:
+            lemmas.append(shortest("v"))
+        if (word.endswith("er") or word.endswith("est")) and \
+                shortest("a") != word:
+            lemmas.append(shortest("a"))
+        if word.endswith("s") and shortest("n") != word:
+            lemmas.append(shortest("n"))
+        if not lemmas and pos:
+            lemmas.append(word)
+        return {"lemmas": list(set(lemmas)), "pos": pos}
+
+    @staticmethod
+    def clear_index():
+        """Removing all pre-computed entries from the shared index."""
+        _INDEX.clear()
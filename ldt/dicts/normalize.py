@@ -43,6 +43,11 @@ Examples:
     >>> test_dict.normalize("grammarlexicon")
     {'found_in': ['wordnet'], 'lemmas': ['grammar', "lexicon],
     'word_categories': ['Misspellings'], 'pos': ['noun']}
+    >>> table = test_dict.normalize_many(["cats", "grammar.com", "cats"])
+    >>> table
+                Word Categories Lemmas   POS   FoundIn
+    0         cats  [Lexicon]  [cat]  [noun] [wordnet]
+    1  grammar.com     [URLs]     []  [noun]        []
 
 Todo:
     * check the checking of foreign words against wiktionary output
@@ -54,7 +59,10 @@ Todo:
         citation for this resource.
 """
 
-import functools
+
+import multiprocessing
+
+import pandas as pd
 
 from ldt.dicts.morphology.meta import MorphMetaDict
 from ldt.dicts.resources import NumberDictionary
@@ -66,6 +74,7 @@ from ldt.dicts.derivation.custom.compounds import Compounds
 from ldt.dicts.morphology.wordnet.en import MorphWordNet
 
 from ldt.load_config import config
+from ldt.helpers.caching import cached
 
 
 
@@ -84,7 +93,7 @@ def contains_non_letters(word):
                 return True
     return False
 
-@functools.lru_cache(maxsize=config["cache_size"])
+@cached()
 def denoise(word):
     """Remove non-alpha symbols, if any."""
     trash = []
@@ -117,6 +126,55 @@ def turn_to_words(word):
     res.append(subword)
     return res
 
+#: the normalizer object of a worker process of
+#: :meth:`Normalization.normalize_many`
+_normalizer = None
+
+def _init_worker(normalizer):
+    """Helper for :meth:`Normalization.normalize_many`: setting up the
+    normalizer of a worker process. The normalizer is passed as an argument
+    of the pool initializer, so that it reaches the workers with any
+    process start method (including *spawn*)."""
+    global _normalizer #pylint: disable=global-statement
+    _normalizer = normalizer
+
+def _normalize_one(word):
+    """Helper for :meth:`Normalization.normalize_many`: normalizing a
+    word in a worker process set up by :func:`_init_worker`."""
+    return _normalizer.normalize(word)
+
+#: the fields of :meth:`Normalization.normalize` output and the columns of
+#: the :meth:`Normalization.normalize_many` table
+_COLUMNS = {"word_categories": "Categories", "lemmas": "Lemmas",
+            "pos": "POS", "found_in": "FoundIn"}
+
+def _to_row(word, res):
+    """Helper for converting :meth:`Normalization.normalize` output to a
+    row of the normalization table."""
+    row = {"Word": word}
+    for key, column in _COLUMNS.items():
+        value = res.get(key, [])
+        if isinstance(value, str):
+            value = [value]
+        row[column] = list(value)
+    return row
+
+def _from_row(row):
+    """Helper for converting a row of the normalization table back to
+    :meth:`Normalization.normalize` output."""
+    res = {}
+    for key, column in _COLUMNS.items():
+        value = row[column]
+        if isinstance(value, str):
+            value = [x for x in value.split(", ") if x]
+        elif not isinstance(value, list):
+            value = []
+        if value or key == "word_categories":
+            res[key] = list(value)
+    if res["word_categories"] == ["Missing"]:
+        res["word_categories"] = "Missing"
+    return res
+
 class Normalization(MorphMetaDict):
     """The _normalizer class brings together many ldt resources for
     fixing frequent tokenization and spelling problems in the word
@@ -157,6 +215,8 @@ class Normalization(MorphMetaDict):
         #: ldt compound splitter object
         self.splitter = Compounds(dictionary=self.wordnet,
                                   morph_dictionary=morph_dict)
+        #: pre-computed normalization results (see :meth:`preload`)
+        self._normalized = {}
 
     def _noise(self, word):
         """Handling the cases where the input doesn't contain any letters.
@@ -186,20 +246,14 @@ class Normalization(MorphMetaDict):
         Returns:
             (dict): word category labels and found lemmas, if any.
         """
-        res = {}
+        res = self._unanalyzable(word)
+        if res:
+            return res
 
-        if self.numberdict.is_a_word(word):
-            res["word_categories"] = ["Numbers"]
-            res["pos"] = ["numeral"]
-        elif self.webdict.is_a_word(word):
-            res["word_categories"] = ["URLs"]
-            res["pos"] = ["noun"]
-        elif self.filedict.is_a_word(word):
-            res["word_categories"] = ["Filenames"]
-            res["pos"] = ["noun"]
-        elif word.startswith("#"):
+        if word.startswith("#"):
             attempt = self.is_a_word(word.strip("#"))
             if attempt:
+                res = {}
                 res["word_categories"] = ["Hashtags"]
                 res["found_in"] = attempt
                 res["lemmas"] = self.lemmatize(word.strip("#"))
@@ -211,6 +265,31 @@ class Normalization(MorphMetaDict):
 
 
 
+    def _unanalyzable(self, word):
+        """Handling the numbers, URLs and filenames, which are recognized
+        without any dictionary lookups (shared by :meth:`_resources` and
+        :meth:`_classify_cheaply`).
+
+        Args:
+            word (str): the word to check.
+
+        Returns:
+            (dict): word category labels, or None if the word is none of
+            these
+        """
+        res = {}
+        if self.numberdict.is_a_word(word):
+            res["word_categories"] = ["Numbers"]
+            res["pos"] = ["numeral"]
+        elif self.webdict.is_a_word(word):
+            res["word_categories"] = ["URLs"]
+            res["pos"] = ["noun"]
+        elif self.filedict.is_a_word(word):
+            res["word_categories"] = ["Filenames"]
+            res["pos"] = ["noun"]
+        if res:
+            return res
+
     def _subwords(self, word):
         """Handling the cases where the input doesn't contain any letters.
 
@@ -374,6 +453,8 @@ class Normalization(MorphMetaDict):
             (dict): word category labels and found lemmas, if any.
         """
         word = str(word)
+        if word in self._normalized:
+            return _from_row(self._normalized[word])
         if not contains_a_letter(word):
         # the word contains nothing to analyze
             res = self._noise(word)
@@ -408,3 +489,101 @@ class Normalization(MorphMetaDict):
         # give up
         else:
             return {"word_categories": "Missing"}
+
+    def _classify_cheaply(self, word):
+        """Helper for :meth:`normalize_many`: handling the cases that do
+        not need any dictionary lookups (noise, numbers, URLs and
+        filenames), with the same results as :meth:`normalize`.
+
+        Args:
+            word (str): the word to check.
+
+        Returns:
+            (dict): word category labels, or None if the word needs full
+            normalization
+        """
+        if not contains_a_letter(word):
+            return self._noise(word)
+        if not contains_non_letters(word):
+            return None
+        # _dash() takes precedence over the resources in normalize()
+        for dash in ["―", "—", "–", "-", "‒"]:
+            if dash in word:
+                return None
+        return self._unanalyzable(word)
+
+    def normalize_many(self, words, n_jobs=1, path=None):
+        """Normalizing a whole vocabulary (e.g. that of an embedding) at
+        once.
+
+        The input is deduplicated, and the words that can be classified
+        without dictionary lookups (noise, numbers, URLs, filenames) are
+        handled first. The WordNet lemma and POS index is pre-computed for
+        the remaining words, which are then processed with :meth:`normalize`
+        in *n_jobs* processes.
+
+        Args:
+            words (iterable): the words to normalize
+            n_jobs (int): the number of processes to use for the words that
+                need spellchecking and compound splitting
+            path (str): if specified, the resulting table is saved to this
+                file (tab-separated, list values joined with ", ")
+
+        Returns:
+            (pandas.DataFrame): a table with *Word*, *Categories*, *Lemmas*,
+            *POS* and *FoundIn* columns, one row per unique input word, which
+            can be loaded back with :meth:`preload`
+
+        """
+        unique = list(dict.fromkeys([str(word) for word in words]))
+        results = {}
+        remaining = []
+        for word in unique:
+            if word in self._normalized:
+                results[word] = _from_row(self._normalized[word])
+                continue
+            res = self._classify_cheaply(word)
+            if res:
+                results[word] = res
+            else:
+                remaining.append(word)
+
+        if remaining:
+            if hasattr(self, "wordnet"):
+                self.wordnet.build_index(remaining)
+            if n_jobs > 1:
+                chunksize = max(1, len(remaining) // (n_jobs * 4))
+                with multiprocessing.Pool(n_jobs, initializer=_init_worker,
+                                          initargs=(self,)) as pool:
+                    normalized = pool.map(_normalize_one, remaining,
+                                          chunksize=chunksize)
+            else:
+                normalized = [self.normalize(word) for word in remaining]
+            for word, res in zip(remaining, normalized):
+                results[word] = res
+
+        table = pd.DataFrame([_to_row(word, results[word]) for word in unique],
+                             columns=["Word"] + list(_COLUMNS.values()))
+        if path:
+            export = table.copy()
+            for column in _COLUMNS.values():
+                export[column] = export[column].apply(", ".join)
+            export.to_csv(path, sep="\t", index=False)
+        return table
+
+    def preload(self, table):
+        """Loading the pre-computed output of :meth:`normalize_many`, so that
+        :meth:`normalize` becomes a lookup for the words in it.
+
+        Args:
+            table (pandas.DataFrame or str): the normalization table, or the
+                path to the file in which it was saved
+
+        Returns:
+            None
+        """
+        if isinstance(table, str):
+            table = pd.read_csv(table, sep="\t", header=0, dtype=str,
+                                keep_default_na=False)
+        for row in table.to_dict("records"):
+            self._normalized[str(row["Word"])] = row
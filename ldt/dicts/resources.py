@@ -13,7 +13,7 @@ Todo:
 """
 
 import os
-import functools
+import hashlib
 
 from abc import ABCMeta, abstractmethod
 
@@ -22,8 +22,10 @@ from ldt.helpers.exceptions import DictError
 from ldt.helpers.resources import load_stopwords
 from ldt.helpers.resources import lookup_language_by_code
 from ldt.helpers.loading import load_resource
+from ldt.helpers.shared_resources import get_registry
 from ldt.helpers.formatting import get_spacing_variants
 from ldt.load_config import config
+from ldt.helpers.caching import cached
 
 # class LexicographicDictionary(Dictionary, metaclass=ABCMeta):
 class ResourceDict(Dictionary):
@@ -33,7 +35,8 @@ class ResourceDict(Dictionary):
     def __init__(self, path=None, resource="names",
                  language=config["default_language"],
                  lowercasing=config["lowercasing"],
-                 corpus=config["corpus"], freq=False, wordlist=None):
+                 corpus=None, freq=False, wordlist=None,
+                 shared=config.get("shared_resources", False)):
         """ Initializing the vocab lookup class.
 
         Args:
@@ -46,9 +49,15 @@ class ResourceDict(Dictionary):
             resource (str): the resource to initialize (if path is a
                 dictionary), as indicated in the config file. For example,
                 "names", "numbers", "associations".
+            corpus (str): the corpus of the distributional resources. If
+                None, the corpus specified in the current config is used.
             freq (bool): for cooccurrence dictionaries, True if integer
                 frequencies should be returned (otherwise booleans are
                 returned). Has no effect on anything else.
+            shared (bool): if True, the resource is converted to a compact
+                file and memory-mapped, so that all the processes using it
+                share one copy in memory (see
+                :mod:`ldt.helpers.shared_resources`)
         """
 
         super(ResourceDict, self).__init__()
@@ -67,7 +76,7 @@ class ResourceDict(Dictionary):
                 subfolder = self.language
             elif resource in ["freqdict", "vocabulary", "cooccurrence"]:
                 resource_type = "corpus_resources"
-                subfolder = corpus
+                subfolder = corpus if corpus is not None else config["corpus"]
 
             path_to_dict = os.path.join(config["path_to_resources"],
                                         resource_type, subfolder,
@@ -77,36 +86,52 @@ class ResourceDict(Dictionary):
             #: the path from which the resource is loaded
             self.path = path_to_dict
 
-        try:
+        def load():
+            """Loading the resource from its source file."""
             if resource not in ["cooccurrence", "gdeps"]:
-                data = load_resource(self.path, format="infer",
+                return load_resource(self.path, format="infer",
                                      lowercasing=lowercasing, silent=True)
-            else:
-
-                if freq:
-                    data = load_resource(self.path, format="json_freqdict",
-                                         lowercasing=lowercasing, silent=True)
+            if freq:
+                return load_resource(self.path, format="json_freqdict",
+                                     lowercasing=lowercasing, silent=True)
+            return load_resource(self.path, format="infer",
+                                 lowercasing=lowercasing, silent=True,
+                                 wordlist=wordlist)
 
-                else:
-                    data = load_resource(self.path, format="infer",
-                                         lowercasing=lowercasing, silent=True,
-                                         wordlist=wordlist)
+        if wordlist:
+            wordlist_id = hashlib.md5("\n".join(sorted(set(
+                wordlist))).encode("utf-8")).hexdigest()
+        else:
+            wordlist_id = None
+        # the data is determined by the file and the loading options
+        self._identity = (type(self).__qualname__, self.path, lowercasing,
+                          freq, wordlist_id)
 
-                # else:
-                #     data = load_resource(self.path, format="json",
-                #                          lowercasing=lowercasing, silent=True)
-            self.data = data
+        try:
+            if shared:
+                self.data = get_registry().get(
+                    self.path, load, lowercasing=lowercasing, freq=freq,
+                    wordlist=wordlist_id)
+            else:
+                self.data = load()
         except FileNotFoundError:
             print("No resource was found, please check the file path "
                   ""+self.path)
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    def cache_identity(self):
+        """The identity of the resource for caching (see
+        :func:`ldt.helpers.caching.resource_identity`): the resources loaded
+        from the same file with the same options share the cached lookups.
+        It is None if the data was modified after loading."""
+        return self._identity
+
+    @cached()
     def is_a_word(self, word):
         if word in self.data:
             return True
         return False
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def are_related(self, word1, word2, freq=False):
         """Determining if two words are related: a helper method for
         resources with lists of related words per word entry.
@@ -194,7 +219,7 @@ class NumberDictionary(ResourceDict):
                                              lowercasing=lowercasing,
                                              path=None, resource=resource)
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def is_a_word(self, word):
         """Returns True if the word is an ordinal or cardinal numeral,
         or if if contains an Arabic number.
@@ -242,6 +267,26 @@ class AssociationDictionary(ResourceDict):
                                              lowercasing=lowercasing,
                                              path=path, resource=resource)
 
+def _split_domains(domains):
+    """Helper for :class:`WebDictionary`: compiling the domain list for
+    hashed lookups.
+
+    Args:
+        domains (iterable): the domains, such as ".com"
+
+    Returns:
+        (frozenset, tuple): the single-label domains without the dot, and the
+        irregular entries that have to be checked linearly
+    """
+    labels = set()
+    irregular = []
+    for domain in domains:
+        if domain.startswith(".") and domain.count(".") == 1:
+            labels.add(domain[1:])
+        else:
+            irregular.append(domain)
+    return frozenset(labels), tuple(irregular)
+
 class WebDictionary(ResourceDict):
 
 
@@ -273,20 +318,44 @@ class WebDictionary(ResourceDict):
                                             lowercasing=lowercasing,
                                             path=full_path,
                                             resource=resource)
+        self._labels, self._irregular_domains = _split_domains(
+            getattr(self, "data", []))
 
+    @cached()
     def is_a_word(self, word):
+        """Checking if a word looks like a URL: it either contains a
+        protocol prefix, or ends with a known top-level domain, or has a
+        known top-level domain followed by a slash.
+
+        Note:
+            Single-label domains are looked up by the last label of the word
+            (and of each part of it preceding a slash) in a hash set, so the
+            cost of a lookup does not depend on the size of the domain list.
+            The few irregular entries of the list (e.g. the ones including
+            bidirectional text markers) are checked linearly.
+
+        Args:
+            word (str): the word to check
+
+        Returns:
+            (bool): True if the word looks like a URL
+
+        """
         for protocol in ["www.", "http:", "ftp:"]:
             if protocol in word:
                 return True
 
         if not "." in word:
             return False
-        else:
-            for domain in self.data:
-                if word.endswith(domain):
-                    return True
-                elif domain + "/" in word:
-                    return True
+        if word.rsplit(".", 1)[1] in self._labels:
+            return True
+        for part in word.split("/")[:-1]:
+            if "." in part and part.rsplit(".", 1)[1] in self._labels:
+                return True
+        for domain in self._irregular_domains:
+            if word.endswith(domain) or domain + "/" in word:
+                return True
+        return False
 
     def are_related(self, word1, word2):
         pass
@@ -45,7 +45,9 @@ class BabelNet(BaseBabelNet, LexicographicDictionary):
     # pylint: disable=unused-argument
     def __init__(self, language=config["default_language"],
                  lowercasing=config["lowercasing"],
-                 babelnet_key=config["babelnet_key"]):
+                 babelnet_key=config["babelnet_key"],
+                 babelnet_store=config.get("babelnet_store", None),
+                 record=False):
         """ Initializing the BabelNet class.
 
         Unlike the basic Dictionary class, BabelNet checks the language
@@ -60,11 +62,18 @@ class BabelNet(BaseBabelNet, LexicographicDictionary):
             this session
             babelnet_key (str): the BabelNet user key (registration at
             `BabelNet <https://babelnet.org/register>`_)
+            babelnet_store (str or BabelNetStore): the local store of
+                BabelNet data (or the path to it) to be used instead of the
+                online API (see :class:`~ldt.dicts.base.babelnet.BabelNetStore`)
+            record (bool): if True, the responses of the online API are
+                saved to the local store
 
         """
         super(BabelNet, self).__init__(language=language,
                                        lowercasing=lowercasing,
-                                       babelnet_key=babelnet_key)
+                                       babelnet_key=babelnet_key,
+                                       babelnet_store=babelnet_store,
+                                       record=record)
         # self.queries = 0
         # if len(language) > 2:
         #     language = lookup_language_by_code(language, reverse=True)
@@ -182,7 +191,7 @@ class BabelNet(BaseBabelNet, LexicographicDictionary):
                             res[relation] += lemmas
 
         for relation in relations:
-            res[relation] = self.post_process(res[relation])
+            res[relation] = self.post_process(res.get(relation, []))
         return res
 
 #todo babelnet synonyms - just lemmas for each id of a queried word?
@@ -19,6 +19,7 @@ from ldt.dicts.semantics.wikisaurus import Wikisaurus
 from ldt.dicts.semantics.wiktionary import Wiktionary
 from ldt.dicts.semantics.wordnet.en import WordNet
 from ldt.dicts.semantics.babelnet import BabelNet
+from ldt.helpers.profiling import get_profiler, profiled
 
 from ldt.load_config import config
 
@@ -62,6 +63,7 @@ class MetaDictionary(Dictionary):
         self.language = language
         self._dicts = {}
         self._order = []
+        self._relations = {}
 
         for dictionary in order:
 
@@ -95,6 +97,7 @@ class MetaDictionary(Dictionary):
                                     "hypernyms", "meronyms", "holonyms",
                                     "troponyms", "coordinate terms", "other")
 
+    @profiled("MetaDictionary.is_a_word")
     def is_a_word(self, word, minimal=True):
         """ Returning the name of the resource containing an entry for the
         queried word (the first in the pre-defined order).
@@ -117,8 +120,10 @@ class MetaDictionary(Dictionary):
 
         """
         res = []
+        profiler = get_profiler()
         for dictionary in self._order:
-            if self._dicts[dictionary].is_a_word(word):
+            if profiler.call("MetaDictionary.is_a_word", dictionary,
+                             self._dicts[dictionary].is_a_word, word):
                 res.append(dictionary)
                 if minimal:
                     return res
@@ -126,6 +131,7 @@ class MetaDictionary(Dictionary):
             return res
         return None
 
+    @profiled("MetaDictionary.get_relations")
     def get_relations(self, word, minimal=False, relations="main"):
         """Combining relations data from all available sources.
 
@@ -145,12 +151,21 @@ class MetaDictionary(Dictionary):
             * include babelnet relations in supported_relations
 
         """
+        key = (word, minimal, relations)
+        if isinstance(relations, (str, tuple)) and key in self._relations:
+            get_profiler().record_hit("MetaDictionary.get_relations")
+            return {k: list(v) for k, v in self._relations[key].items()}
+
         res = {}
 
         dicts = self.is_a_word(word, minimal)
+        if not dicts:
+            dicts = []
         for i in dicts:
-                relation_dict = self._dicts[i].get_relations(word, relations,
-                                                             reduce=True)
+                relation_dict = get_profiler().call(
+                    "MetaDictionary.get_relations", i,
+                    self._dicts[i].get_relations, word, relations,
+                    reduce=True)
                 # print(relation_dict)
                 for relation in relation_dict:
                     if relation_dict[relation]:
@@ -163,6 +178,37 @@ class MetaDictionary(Dictionary):
             res[relation] = sorted(res[relation])
         return res
 
+    def prefetch(self, words, minimal=False, relations="main"):
+        """Retrieving the relations for a list of words up front.
+
+        The online resources fetch their entries for all the words with
+        concurrent requests first, and then the combined relations of every
+        word are computed and kept in memory, so that subsequent
+        :meth:`get_relations` calls with the same arguments are lookups.
+
+        Args:
+            words (iterable): the words to look up
+            minimal (bool): if True, only the first matching resource will be
+                queried
+            relations (tuple, string): the relations to look up
+
+        Returns:
+            (dict): the words with their relations
+        """
+        words = list(dict.fromkeys(words))
+        for dictionary in self._order:
+            if dictionary != "wordnet" and hasattr(self._dicts[dictionary],
+                                                   "prefetch"):
+                self._dicts[dictionary].prefetch(words)
+        res = {}
+        for word in words:
+            res[word] = self.get_relations(word, minimal=minimal,
+                                           relations=relations)
+            if isinstance(relations, (str, tuple)):
+                self._relations[(word, minimal, relations)] = \
+                    {k: list(v) for k, v in res[word].items()}
+        return res
+
     def get_relation(self, word, relation, minimal=False):
         """Wrapper for :meth:`get_relations` for one-relation use.
 
@@ -7,6 +7,7 @@ previously known as Wikisaurus; this is a cool name, so LDT kept it.
      - Retrieving Wiktionary Thesaurus Data with Wiktionary API;
      - Aggregating all relations types;
      - Determining whether a word entry exists;
+     - Prefetching the entries for a whole wordlist with concurrent requests;
      - Optionally caching the latest list of page titles for determining
        whether pages exist;
      - Automatically formatting the dictionary language argument as required.
@@ -16,17 +17,17 @@ previously known as Wikisaurus; this is a cool name, so LDT kept it.
 
 """
 
-import urllib.request
-import functools
-import json
-
 
+from ldt.helpers.http import get_client, prefetch_cache
 from ldt.helpers.resources import lookup_language_by_code
 from ldt.helpers.wiktionary_cache import load_wiktionary_cache
 from ldt.dicts.semantics.lex_dictionary import LexicographicDictionary
 from ldt.dicts.base.wiktionary import BaseWiktionary
 from ldt.load_config import config
+from ldt.helpers.caching import cached
 
+#: the Thesaurus pages retrieved by :meth:`Wikisaurus.prefetch`, by url
+_PREFETCHED = prefetch_cache("Wikisaurus.prefetched")
 
 class Wikisaurus(BaseWiktionary, LexicographicDictionary):
     """The class providing Wikisaurus interface with a custom API parser.
@@ -99,9 +100,10 @@ class Wikisaurus(BaseWiktionary, LexicographicDictionary):
                 return True
             return False
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached(persistent=True, cache_none=False)
     def query(self, word):
-        """Retrieving data from Wikisaurus API.
+        """Retrieving data from Wikisaurus API. The failed queries are not
+        cached.
 
         Args:
             word (str): word to be queried.
@@ -109,34 +111,43 @@ class Wikisaurus(BaseWiktionary, LexicographicDictionary):
         Returns (list):
             a list of Wikisaurus "revisions" data points
 
-        Todo:
-            Find the specific error that is thrown when too many
-            requests are made in parallel.
         """
 
+        url = self._url(word)
+        data = _PREFETCHED.get(url, None)
+        if data is None:
+            data = get_client().get_json(url)
+        return _get_revisions(data)
+
+    def _url(self, word):
+        """Helper for formatting the API url of the Thesaurus page of a
+        word."""
         wikisaurus_url = "https://" + self.language + \
                          '.wiktionary.org//w/api.php?format=json&action=query' \
                          '&prop=revisions&rvprop=content&titles=Thesaurus:'
-        url = wikisaurus_url + word
-        request = urllib.request.Request(url)
-        try:
-            response = urllib.request.urlopen(request).read()
-        except urllib.error.URLError:
-            return None
-        if response:
-            data = json.loads(response)
-            data = data["query"]["pages"]
-            rels = []
-
-            for i in data.keys():
-                try:
-                    revisions = data[i]["revisions"]
-                    for revision in revisions:
-                        rels.append(revision["*"])
-                    # rels += data[i]["revisions"]['*']  # , "\n\n")
-                except KeyError:
-                    pass
-        return rels
+        return wikisaurus_url + word
+
+    def prefetch(self, words):
+        """Retrieving the Thesaurus pages for a list of words with
+        concurrent requests, so that the subsequent lookups of these words
+        do not wait for the network. If the cache of page titles is loaded,
+        only the existing pages are requested.
+
+        Args:
+            words (iterable): the words to look up
+
+        Returns:
+            (int): the number of retrieved pages
+        """
+        if self.cache:
+            words = [word for word in words if word in self.cache]
+        urls = [self._url(word) for word in words]
+        urls = [url for url in urls if not url in _PREFETCHED]
+        data = get_client().fetch_many(urls)
+        data = {url: response for url, response in data.items() if response}
+        for url, response in data.items():
+            _PREFETCHED.set(url, response)
+        return len(data)
 
     def _parse_wikisaurus_relations(self, wikidata):
         """Helper method for :meth:`get_relations`, returning wiki data
@@ -228,6 +239,31 @@ class Wikisaurus(BaseWiktionary, LexicographicDictionary):
         return new_res
 
 
+def _get_revisions(data):
+    """Helper for :meth:`Wikisaurus.query`, extracting the contents of page
+    revisions from the API response.
+
+    Args:
+        data (dict): the json data returned by Wiktionary API
+
+    Returns:
+        (list): the contents of the page revisions, or None if there is no
+        data
+
+    """
+    if not data:
+        return None
+    pages = data["query"]["pages"]
+    rels = []
+    for i in pages.keys():
+        try:
+            revisions = pages[i]["revisions"]
+            for revision in revisions:
+                rels.append(revision["*"])
+        except KeyError:
+            pass
+    return rels
+
 def cleanup_wiki_string(line):
     """Helper for :meth:`_cleanup_wikisaurus`
 
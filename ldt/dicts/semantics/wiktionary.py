@@ -10,13 +10,13 @@
         * language-specific tokenizers in :meth:`get_relations`.
 """
 
-import functools
 
 from ldt.dicts.semantics.lex_dictionary import LexicographicDictionary
 from ldt.dicts.base.wiktionary import BaseWiktionary
 from ldt.helpers.formatting import remove_text_inside_brackets
 from ldt.helpers.formatting import strip_non_alphabetical_characters
 from ldt.load_config import config
+from ldt.helpers.caching import cached
 
 
 class Wiktionary(BaseWiktionary, LexicographicDictionary):
@@ -61,7 +61,7 @@ class Wiktionary(BaseWiktionary, LexicographicDictionary):
                                     "derived terms")
 
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def get_relations(self, word, relations="all",
                       reduce=False): #pylint: disable=arguments-differ
 
@@ -12,7 +12,6 @@
 """
 
 
-import functools
 import timeout_decorator
 
 from nltk.corpus import wordnet as wn
@@ -22,6 +21,7 @@ from ldt.dicts.semantics.lex_dictionary import DictionaryWithDefinitions
 from ldt.dicts.base.wordnet.en import BaseWordNet
 from ldt.helpers.formatting import remove_text_inside_brackets
 from ldt.load_config import config
+from ldt.helpers.caching import cached
 
 
 # class WordNet(DictionaryWithDefinitions, BaseWordNet):
@@ -52,7 +52,12 @@ class WordNet(BaseWordNet, DictionaryWithDefinitions):
                                     "member_meronyms", "substance_meronyms",
                                     "meronyms")
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    def cache_identity(self):
+        """The identity of the dictionary for caching (see
+        :func:`ldt.helpers.caching.resource_identity`)."""
+        return (type(self).__qualname__, self.language, self.lowercasing)
+
+    @cached()
     def _get_all_synonyms(self, word):
         """A helper method for :func:`get_relation`
 
@@ -72,7 +77,7 @@ class WordNet(BaseWordNet, DictionaryWithDefinitions):
 
         return list(set(res))
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def _get_antonyms(self, word):
         """A helper method for :func:`get_relation`
 
@@ -98,7 +103,7 @@ class WordNet(BaseWordNet, DictionaryWithDefinitions):
         res = list(set(res))
         return res
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def _get_all_antonyms(self, word):
         """ A helper method for :func:`get_relation`
 
@@ -124,7 +129,7 @@ class WordNet(BaseWordNet, DictionaryWithDefinitions):
         return res
 
     @timeout_decorator.timeout(10, use_signals=False)
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def _get_nyms(self, word, relation, synonyms=True, depth=1):
         """ Single interface to all WordNet relations computed with
         closure (i.e. except synonyms and antonyms).
@@ -181,7 +186,7 @@ class WordNet(BaseWordNet, DictionaryWithDefinitions):
         return result
 
     # pylint: disable=arguments-differ
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def get_relation(self, word, relation, synonyms=True, silent=True): #pylint:
         # disable=arguments-differ
         """ Single interface to all WordNet relations
@@ -287,7 +292,7 @@ class WordNet(BaseWordNet, DictionaryWithDefinitions):
         return res
 
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def get_definitions(self, word, remove_notes=True):
         """A simple wrapper for NLTK's Princeton wordnet definitions.
 
@@ -19,6 +19,8 @@ Note:
 Basic functionality:
 
     * target language spellchecking
+    * suggesting corrections, either with enchant or with a symmetric-delete
+      index of a given vocabulary (see :mod:`ldt.dicts.spellcheck.symspell`)
     * checking if a word as "foreign", i.e. if the queried word has an entry
       in a number of spellchecker dictionaries for a set of other
       pre-defined languages;
@@ -32,7 +34,6 @@ Todo:
 
 """
 
-import functools
 import unicodedata
 
 from difflib import SequenceMatcher
@@ -43,13 +44,20 @@ from ldt.dicts.dictionary import Dictionary
 from ldt.load_config import config
 from ldt.helpers.resources import lookup_language_by_code
 from ldt.helpers.exceptions import LanguageError
+from ldt.helpers.persistent_cache import PersistentCache
+from ldt.dicts.spellcheck.symspell import SymSpell
+from ldt.helpers.caching import cached
+
+_MISSING = object()
 
 class Spellchecker(Dictionary):
     """The base spellchecker class (pyenchant-based at the moment)."""
 
     def __init__(self, language=config["default_language"],
                  foreign_languages=("german", "french"),
-                 engine_order="aspell,myspell"):
+                 engine_order="aspell,myspell",
+                 persistent_cache=config.get("persistent_cache", False),
+                 backend="enchant", vocabulary=None):
         """Initializaing a spellchecker for the target and a number of
         frequent "foreign" languages.
 
@@ -68,6 +76,16 @@ class Spellchecker(Dictionary):
             engine_order (str): pyenchant variable for the order of
                 spellchecmer engine providers. Available providers vary by
                 system.
+            persistent_cache (bool, str or PersistentCache): if True,
+                spellchecking results are saved to the default persistent
+                cache file, so that they are re-used across runs and shared
+                between worker processes. A path to another cache file or a
+                :class:`~ldt.helpers.persistent_cache.PersistentCache`
+                object can also be passed.
+            backend (str): the source of spelling suggestions: *enchant*
+                or *symspell* (a symmetric-delete index of the vocabulary).
+            vocabulary (iterable or dict): the words for the *symspell*
+                backend, optionally with their frequencies.
 
         Note:
              Aspell worked better then hunspell or myspell in our experiments.
@@ -107,6 +125,60 @@ class Spellchecker(Dictionary):
         for lang in self.foreign_languages:
             self.foreign.append(self._enchant_dict(lang))
 
+        #: (str): the source of spelling suggestions
+        self.backend = backend
+        #: (SymSpell): the symmetric-delete index for the *symspell* backend
+        self.symspell = None
+        if backend == "symspell":
+            if vocabulary is None:
+                raise ValueError("The symspell backend requires a "
+                                 "vocabulary.")
+            self.symspell = SymSpell(vocabulary)
+        elif backend != "enchant":
+            raise ValueError("Unknown spellchecker backend: " + str(backend) +
+                             ". The supported backends are enchant and "
+                             "symspell.")
+
+        #: (PersistentCache): the persistent cache for the results, if any
+        self.persistent_cache = None
+        if isinstance(persistent_cache, PersistentCache):
+            self.persistent_cache = persistent_cache
+        elif persistent_cache:
+            # the results depend on the engines, languages and vocabulary,
+            # so they should not be shared between differently configured
+            # spellcheckers
+            namespace = "_".join(["spellcheck", self.language,
+                                  self.backend, self.engine_order,
+                                  ",".join(self.foreign_languages)])
+            if self.symspell is not None:
+                namespace += "_" + self.symspell.fingerprint()
+            path = persistent_cache if isinstance(persistent_cache,
+                                                  str) else None
+            self.persistent_cache = PersistentCache(namespace=namespace,
+                                                    path=path)
+
+    def _cached(self, method, word, compute):
+        """Helper for looking up the results of a spellchecking method in
+        the persistent cache, and computing and saving them if they are not
+        there.
+
+        Args:
+            method (str): the cached method (a part of the cache key)
+            word (str): the queried word
+            compute (callable): the function computing the result
+
+        Returns:
+            the result of *compute()*
+        """
+        if self.persistent_cache is None:
+            return compute()
+        key = method + "\t" + word
+        res = self.persistent_cache.get(key, _MISSING)
+        if res is _MISSING:
+            res = compute()
+            self.persistent_cache.set(key, res)
+        return res
+
     def _enchant_dict(self, language):
         """ Helper for enchant dictionary initialization.
 
@@ -147,10 +219,11 @@ class Spellchecker(Dictionary):
             (bool): *True* if the word is in the spellchecker dictionary for
             the target language.
         """
-        return self.target.check(word)
+        return self._cached("is_a_word", word,
+                            lambda: self.target.check(word))
 
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def in_foreign_dicts(self, word):
         """Returns True if the word is found in the spellchecker resources
         for the specified foreign languages.
@@ -166,7 +239,11 @@ class Spellchecker(Dictionary):
         Returns:
             (bool): True if the word is found in the "foreign" dictionaries.
         """
+        return self._cached("in_foreign_dicts", word,
+                            lambda: self._in_foreign_dicts(word))
 
+    def _in_foreign_dicts(self, word):
+        """Helper for :meth:`in_foreign_dicts`."""
         for spelldict in self.foreign:
             if spelldict.check(word):
                 return True
@@ -233,7 +310,10 @@ class Spellchecker(Dictionary):
             (list): a list of alternative spellings
         """
 
-        return self.target.suggest(word)
+        if self.symspell is not None:
+            return self.symspell.suggest(word)
+        return list(self._cached("suggest", word,
+                                 lambda: self.target.suggest(word)))
 
     # pylint: disable=no-self-use
     def get_opcode_alignment(self, misspelling, word):
@@ -32,6 +32,9 @@ Todo:
 import operator
 
 from ldt.dicts.spellcheck.custom import Spellchecker
+from ldt.load_config import config
+from ldt.helpers.loading import load_resource
+from ldt.helpers.caching import cached
 
 
 class SpellcheckerEn(Spellchecker):
@@ -48,16 +51,32 @@ class SpellcheckerEn(Spellchecker):
     """
 
     def __init__(self, foreign_languages=("german", "french"),
-                 engine_order="aspell,myspell"):
+                 engine_order="aspell,myspell",
+                 persistent_cache=config.get("persistent_cache", False),
+                 backend="enchant", vocabulary=None):
         """ Initializing the Misspellings class.
 
         Sets language to "en"
 
+        Args:
+            backend (str): the source of spelling suggestions: *enchant* or
+                *symspell*. The latter is much faster, and only generates the
+                candidates compatible with the patterns of
+                :meth:`common_misspellings`.
+            vocabulary (iterable or dict): the words for the *symspell*
+                backend (optionally with frequencies). Defaults to the
+                single-word lemmas of Princeton WordNet.
+
         """
+        if backend == "symspell" and vocabulary is None:
+            vocabulary = load_wordnet_vocabulary()
 
         super(SpellcheckerEn, self).__init__(language="en",
                                              foreign_languages=foreign_languages,
-                                             engine_order=engine_order)
+                                             engine_order=engine_order,
+                                             persistent_cache=persistent_cache,
+                                             backend=backend,
+                                             vocabulary=vocabulary)
 
 
     def filter_by_charset(self, word):
@@ -84,6 +103,7 @@ class SpellcheckerEn(Spellchecker):
         #                                    "hyphen-minus", "apostrophe"],
         #                                    exclude=["with"])
 
+    @cached()
     def is_foreign(self, word, dictionary=None):
         """Excluding foreign words with a combination of charset checking and
         select foreign dictionaries.
@@ -109,6 +129,14 @@ class SpellcheckerEn(Spellchecker):
             English spellchecker dictionary)
 
         """
+        if dictionary:
+            return self._is_foreign(word, dictionary)
+        # the results with extra dictionaries are not saved to disk
+        return self._cached("is_foreign", word,
+                            lambda: self._is_foreign(word))
+
+    def _is_foreign(self, word, dictionary=None):
+        """Helper for :meth:`is_foreign`."""
         if not self.filter_by_charset(word):
             return True
 
@@ -143,6 +171,15 @@ class SpellcheckerEn(Spellchecker):
                 letter, so dealing only with longer words is preferable.
 
         """
+        key = "\t".join([word, str(confidence), str(strict), str(min_length)])
+        return self._cached("spelling_nazi", key,
+                            lambda: self._spelling_nazi(word, confidence,
+                                                        strict, min_length))
+
+    #pylint: disable=too-many-locals
+    #pylint: disable=too-many-branches
+    def _spelling_nazi(self, word, confidence, strict, min_length):
+        """Helper for :meth:`spelling_nazi`."""
 
         if len(word) < min_length:
             return None
@@ -152,7 +189,7 @@ class SpellcheckerEn(Spellchecker):
 
         res = {}
         res_annotated = {}
-        suggestions = self.target.suggest(word)
+        suggestions = self.suggest(word)
 
         for candidate_word in suggestions:
 
@@ -358,3 +395,15 @@ class SpellcheckerEn(Spellchecker):
                         res.append("fishy")
 
         return list(set(res))
+
+
+def load_wordnet_vocabulary():
+    """Helper for loading the single-word lemmas of Princeton WordNet as the
+    default vocabulary of the *symspell* spellchecker backend.
+
+    Returns:
+        (list): WordNet lemmas without the multi-word expressions
+    """
+    from ldt.dicts.morphology.wordnet.en import \
+        LEMMAS_PATH #pylint: disable=import-outside-toplevel
+    return [word for word in load_resource(LEMMAS_PATH) if not "_" in word]
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+""" Symmetric-delete spelling candidate generator
+
+This module provides an alternative to enchant suggestions for the
+spellchecker classes. It is based on the symmetric deletion algorithm
+of `SymSpell <https://github.com/wolfgarbe/SymSpell>`_: all the strings that
+can be obtained from the vocabulary words by deleting a character are
+pre-computed, and the candidates for a misspelled word are the vocabulary
+words that share a deletion variant with it.
+
+With the maximum of one deletion on each side, this covers all the
+misspelling patterns that :class:`~ldt.dicts.spellcheck.en.SpellcheckerEn`
+considers to be safe to correct: a missing or an extra letter, a replaced
+letter, and a misplaced letter (*wrok > work*). Each lookup takes a constant
+number of dictionary queries per word length, regardless of the size of the
+vocabulary.
+
+Examples:
+    >>> symspell = ldt.dicts.spellcheck.symspell.SymSpell(["grammar",
+    "grammars", "magic"])
+    >>> symspell.suggest("gramar")
+    ['grammar']
+    >>> symspell.suggest("magik")
+    ['magic']
+
+"""
+
+import hashlib
+
+from collections import defaultdict
+
+def get_deletes(word):
+    """Generating all the strings that can be obtained from a word by
+    deleting one character.
+
+    Args:
+        word (str): the word
+
+    Returns:
+        (set): the deletion variants
+    """
+    return {word[:i] + word[i+1:] for i in range(len(word))}
+
+class SymSpell(object):
+    """Symmetric-delete index of a vocabulary for generating spelling
+    candidates."""
+
+    def __init__(self, vocabulary, min_length=3):
+        """Building the deletion index.
+
+        Args:
+            vocabulary (iterable or dict): the words to be suggested as
+                corrections. If a dictionary is passed, its values are
+                interpreted as word frequencies, and more frequent candidates
+                are suggested first.
+            min_length (int): the words shorter than that are not indexed
+
+        """
+        if not isinstance(vocabulary, dict):
+            vocabulary = {word: 0 for word in vocabulary}
+
+        #: (dict): the indexed words with their frequencies
+        self.frequencies = {}
+
+        index = defaultdict(list)
+        for word, freq in vocabulary.items():
+            if len(word) < min_length:
+                continue
+            self.frequencies[word] = freq
+            index[word].append(word)
+            for variant in get_deletes(word):
+                index[variant].append(word)
+        self._index = dict(index)
+        self._fingerprint = None
+
+    def __contains__(self, word):
+        return word in self.frequencies
+
+    def fingerprint(self):
+        """Summarizing the indexed vocabulary, e.g. to keep apart the cached
+        results of spellcheckers with different vocabularies.
+
+        Returns:
+            (str): the md5 hash of the indexed words and their frequencies
+        """
+        if self._fingerprint is None:
+            data = "\n".join(word + "\t" + str(self.frequencies[word]) for
+                             word in sorted(self.frequencies))
+            self._fingerprint = hashlib.md5(data.encode("utf-8")).hexdigest()
+        return self._fingerprint
+
+    def suggest(self, word):
+        """Retrieving the vocabulary words that are at most one deletion on
+        each side away from the queried word.
+
+        Args:
+            word (str): the word to check
+
+        Returns:
+            (list): the candidate words, the most frequent first (ties are
+            ordered alphabetically)
+        """
+        candidates = set()
+        for variant in get_deletes(word) | {word}:
+            candidates.update(self._index.get(variant, []))
+        return sorted(candidates,
+                      key=lambda candidate: (-self.frequencies[candidate],
+                                             candidate))
@@ -10,7 +10,10 @@ documentation of that class for more details.
 The output is saved in the experiments/analysis/your_experiment_name
 subfolder of the ldt resource folder specified in the configuration file.
 These are tab-separated data files with columns that contain ld
-scores, as described `here <http://ldtoolkit.space/ldscores/>`_.
+scores, as described `here <http://ldtoolkit.space/ldscores/>`_. The
+scores that depend on thresholds (frequency, similarity and ontology
+distance) can also be computed for grids of thresholds with
+:meth:`LDScoring.sweep`.
 
 These scores are the basic profile of the information captured by a given
 word embedding. They can be used for evaluation, error analysis, parameter
@@ -23,13 +26,20 @@ import os
 import uuid
 import datetime
 
+import numpy as np
 import pandas as pd
 
+from p_tqdm import p_map
 from vecto.utils.data import load_json
 
 from ldt.experiments.metadata import Experiment
+from ldt.helpers.tables import find_table, get_columns, read_table, \
+    read_table_chunks
 from ldt.load_config import config
 
+#: the annotation columns used for scoring, other than the binary ones
+_SCORED_COLUMNS = ["Target", "Similarity", "ShortestPath", "NeighborFrequency"]
+
 class LDScoring(Experiment):
     """This class provides a simple interface for computing ld scores,
     given a collection of annotated vector neighborhood files.
@@ -39,7 +49,13 @@ class LDScoring(Experiment):
                  extra_metadata=None,
                  overwrite=config["experiments"]["overwrite"],
                  ld_scores="main", output_dir=
-                 os.path.join(config["path_to_resources"], "experiments")):
+                 os.path.join(config["path_to_resources"], "experiments"),
+                 bootstrap=config["experiments"].get("bootstrap", 0),
+                 confidence=0.95,
+                 multiprocessing=config["experiments"]["multiprocessing"],
+                 chunksize=config["experiments"].get("chunksize", 0),
+                 batch_scoring=config["experiments"].get("batch_scoring",
+                                                         False)):
 
         """ Annotating pre-computed top *n* neighbors for a given vocab sample
 
@@ -88,6 +104,21 @@ class LDScoring(Experiment):
                     - "Hashtags",
                     - "Noise".
 
+            bootstrap (int): the number of bootstrap resamples for computing
+                the confidence intervals of ld scores. If 0, the intervals
+                are not computed.
+            confidence (float): the confidence level of the intervals
+            multiprocessing (int): the number of models for which the
+                bootstrap is performed in parallel
+            chunksize (int): if specified, the annotated files are read in
+                chunks of this many rows, and the scores are accumulated
+                chunk by chunk (see :func:`stream_scores`). Otherwise the
+                annotation of each model is loaded at once.
+            batch_scoring (bool): if True, the annotations of all models are
+                concatenated and scored together (see :meth:`_process_many`),
+                which is faster for many small models, but keeps all of
+                them in memory. By default the models are scored one by one.
+
         Returns:
 
             (None): a table with ld scores for all available variables,
@@ -111,6 +142,7 @@ class LDScoring(Experiment):
             raise IOError("The metadata for the annotated neighborhood files "
                           "was not found at "+neighbors_metadata_path)
         else:
+            self._annotation_metadata_path = neighbors_metadata_path
             neighbors_metadata = load_json(neighbors_metadata_path)
             self.metadata["embeddings"] = neighbors_metadata["embeddings"]
             self.metadata["annotation"] = neighbors_metadata
@@ -181,6 +213,19 @@ class LDScoring(Experiment):
             else:
                 raise ValueError(output_scores_error)
         self.metadata["ld_scores"] = self.output_vars
+
+        if bootstrap < 0 or not 0 < confidence < 1:
+            raise ValueError("The number of bootstrap resamples should be "
+                             "non-negative, and the confidence level should "
+                             "be between 0 and 1.")
+        self.bootstrap = bootstrap
+        self.confidence = confidence
+        self.multiprocessing = multiprocessing
+        self.chunksize = chunksize
+        self.batch_scoring = batch_scoring
+        if bootstrap:
+            self.metadata["bootstrap"] = {"resamples": bootstrap,
+                                          "confidence": confidence}
         self.message = None #"\n Annotation done! Analyzing the data now."
 
     def _load_dataset(self, dataset):
@@ -189,9 +234,82 @@ class LDScoring(Experiment):
         here."""
         pass
 
+    def _get_annotated_path(self, filename):
+        """Helper for locating the annotated neighbors file of a model (in
+        the format recorded in the annotation metadata)."""
+        stem = os.path.join(self.output_dir.replace(
+            "analysis", "neighbors_annotated"), filename)
+        fmt = self.metadata["annotation"].get("output_format")
+        return find_table(stem, fmt=fmt) or stem + "." + (fmt or "tsv")
+
+    def _read_annotated(self, embeddings_path, columns=None):
+        """Helper for loading the annotated neighbors of an embedding model.
+
+        Args:
+            embeddings_path (str): the name of embedding model to process
+            columns (list of str): if specified, only these columns are
+                loaded (the ones missing in the file are skipped)
+
+        Returns:
+            (str, pd.DataFrame): the name of the model and its annotation
+        """
+        filename = self.get_fname_for_embedding(embeddings_path)
+        return filename, read_table(self._get_annotated_path(filename),
+                                    columns=columns)
+
+    def _process_many(self, embeddings, **kwargs):
+        """Computing ld scores for a number of embedding models at once: the
+        annotations of all models are concatenated into one model-keyed
+        frame, which is scored with grouped column reductions.
+
+        Args:
+            embeddings (list of str): the names of embedding models to process
+            **kwargs: the thresholds passed to :func:`score_neighborhoods`
+
+        Returns:
+            (list of dict): the ld scores of each model, in the same order as
+            the models
+        """
+        names, frames = [], []
+        for embeddings_path in embeddings:
+            filename, input_df = self._read_annotated(
+                embeddings_path, columns=_SCORED_COLUMNS + self.binary_vars)
+            names.append(filename)
+            frames.append(input_df)
+        input_df = pd.concat(frames, keys=names, names=["Model", None],
+                             sort=False).reset_index(level=0).reset_index(
+                                 drop=True)
+        scores = score_neighborhoods(input_df, binary_vars=self.binary_vars,
+                                     **kwargs)
+        scores = scores.to_dict(orient="index")
+        res = []
+        for filename in names:
+            model_scores = scores[filename]
+            model_scores["Model"] = filename
+            res.append({i: model_scores[i] for i in model_scores
+                        if i in self.output_vars})
+        return res
+
+    def _process_streaming(self, embeddings_path):
+        """Computing ld scores for an embedding model with
+        :func:`stream_scores`, reading the annotated file in chunks.
+
+        Args:
+            embeddings_path (str): the name of embedding model to process
+
+        Returns:
+            (dict): the ld scores of the model
+        """
+        filename = self.get_fname_for_embedding(embeddings_path)
+        res = stream_scores(self._get_annotated_path(filename),
+                            chunksize=self.chunksize,
+                            binary_vars=self.binary_vars)
+        res["Model"] = filename
+        return {i: res[i] for i in res if i in self.output_vars}
+
     def _process(self, embeddings_path, lowfreq_threshold=10000,
-                      far_neighbors_threshold=0.7,
-                      close_neighbors_threshold=0.8, ontology_threshold=0.5):
+                 far_neighbors_threshold=0.7,
+                 close_neighbors_threshold=0.8, ontology_threshold=0.5):
         """
 
         Args:
@@ -209,60 +327,18 @@ class LDScoring(Experiment):
                 number will be considered "CloseInOntology".
 
         Returns:
-
+            (dict): the ld scores of the model
         """
-        filename = self.get_fname_for_embedding(embeddings_path)
-
-        annotated_file_path = os.path.join(self.output_dir.replace(
-            "analysis", "neighbors_annotated"), filename+".tsv")
-        input_df = pd.read_csv(annotated_file_path, header=0, sep="\t")
-
-        len_df = len(input_df)
-
-        def percentage(num, len_df=len_df):
-            """Helper for formatting % numbers"""
-            return round(100*num/len_df, 2)
-        res = {"Model": filename}
-        for var in self.binary_vars:
-            if var in input_df.columns:
-                try:
-                    res[var] = percentage(num=list(input_df[var]).count(True))
-                except KeyError:
-                    pass
-
-        if "ShortestPath" in input_df.columns:
-            # median of all found shortest paths - that's what was done in
-            # the paper
-            res["ShortestPathMedian"] = \
-                round(input_df["ShortestPath"].median(), 3)
-            # number of words with paths shorter than threshold
-            close = [x for x in list(
-                input_df["ShortestPath"]) if x <= ontology_threshold]
-            res["CloseInOntology"] = len(close)
-        if "NeighborFrequency" in input_df.columns:
-            highfreq_neighbors = [x for x in list(
-                input_df["NeighborFrequency"]) if isinstance(x, float)]
-            highfreq_neighbors = [x for x in highfreq_neighbors if x >
-                                  lowfreq_threshold]
-            res["HighFreqNeighbors"] = percentage(len(highfreq_neighbors))
-            res["LowFreqNeighbors"] = 100-res["HighFreqNeighbors"]
-        if "Similarity" in input_df.columns:
-            far_neighbors = [x for x in list(
-                input_df["Similarity"]) if x <= far_neighbors_threshold]
-            close_neighbors = [x for x in list(
-                input_df["Similarity"]) if x >= close_neighbors_threshold]
-            res["FarNeighbors"] = percentage(len(far_neighbors))
-            res["CloseNeighbors"] = percentage(len(close_neighbors))
-        filtered_res = {}
-        for i in res:
-            if i in self.output_vars:
-                filtered_res[i] = res[i]
-        return filtered_res
-
+        return self._process_many(
+            [embeddings_path], lowfreq_threshold=lowfreq_threshold,
+            far_neighbors_threshold=far_neighbors_threshold,
+            close_neighbors_threshold=close_neighbors_threshold,
+            ontology_threshold=ontology_threshold)[0]
 
     def get_results(self):
-        """The basic routine for processing embeddings one-by-one, and saving
-        the timestamps of when each file was started and finished."""
+        """The basic routine for computing ld scores for all embeddings and
+        saving them, together with the timestamp of when the analysis was
+        finished."""
 
         self._start_experiment()
 
@@ -270,30 +346,508 @@ class LDScoring(Experiment):
             if os.path.isfile(os.path.join(self.output_dir, "ld_scores.tsv")):
                 return None
 
-        # self.embeddings = input_data
-        res = []
-        for i in self.embeddings:
-
-            res.append(self._process(embeddings_path=i))
-
-            for i in ["GDeps", "NonCooccurring"]:
-                if not i in res[0]:
-                    if i in self.output_vars:
-                        self.output_vars.remove(i)
-
-            res_df = pd.DataFrame(res, columns=self.output_vars)
-            # res_df = res_df.set_index("Model")
-            res_df = res_df.transpose()
-            res_df.columns = res_df.iloc[0]
-            res_df = res_df[1:]
-            res_df.to_csv(os.path.join(self.output_dir, "ld_scores.tsv"),
-                          index=True, sep="\t", header=1,
-                          index_label="LDScores")
-            self.metadata["timestamp"] = datetime.datetime.now().isoformat()
-            self.save_metadata()
+        if self.batch_scoring and not self.chunksize:
+            res = self._process_many(self.embeddings)
+        else:
+            res = [self.score_embedding(i) for i in self.embeddings]
+        self.save_scores(res)
+
+    def score_embedding(self, embeddings_path):
+        """Computing the ld scores of one embedding model, for the workflows
+        in which the models are scored as soon as their annotation is
+        finished (see :mod:`ldt.experiments.scheduler`). The scores are
+        saved with :meth:`save_scores`.
+
+        Args:
+            embeddings_path (str): the name of embedding model to process
+
+        Returns:
+            (dict): the ld scores of the model
+        """
+        if self.chunksize:
+            return self._process_streaming(embeddings_path)
+        return self._process(embeddings_path)
+
+    def save_scores(self, res):
+        """Saving the ld scores of all the embedding models (and their
+        bootstrap confidence intervals, if requested), together with the
+        timestamp of when the analysis was finished.
+
+        Args:
+            res (list of dict): the ld scores of each model
+
+        Returns:
+            None
+        """
+        # the annotation may have been in progress when the scoring started
+        annotation_metadata = load_json(self._annotation_metadata_path)
+        annotation_metadata.pop("embeddings", None)
+        self.metadata["annotation"] = annotation_metadata
+
+        for i in ["GDeps", "NonCooccurring"]:
+            if not i in res[0]:
+                if i in self.output_vars:
+                    self.output_vars.remove(i)
+
+        res_df = pd.DataFrame(res, columns=self.output_vars)
+        res_df = res_df.transpose()
+        res_df.columns = res_df.iloc[0]
+        res_df = res_df[1:]
+        res_df.to_csv(os.path.join(self.output_dir, "ld_scores.tsv"),
+                      index=True, sep="\t", header=1,
+                      index_label="LDScores")
+        if self.bootstrap:
+            self._get_intervals()
+        self.metadata["timestamp"] = datetime.datetime.now().isoformat()
+        self.save_metadata()
         print("\nLD analysis is finished, the embedding profiles are saved in",
               self.output_dir, ".")
 
+    def _get_intervals(self):
+        """Computing the bootstrap confidence intervals of ld scores for all
+        embeddings (in parallel, if multiprocessing is enabled), and saving
+        them as ld_scores_ci.tsv file next to ld_scores.tsv."""
+        tasks = []
+        for embeddings_path in self.embeddings:
+            filename = self.get_fname_for_embedding(embeddings_path)
+            tasks.append({"model": filename,
+                          "path": self._get_annotated_path(filename),
+                          "binary_vars": self.binary_vars,
+                          "n_resamples": self.bootstrap,
+                          "confidence": self.confidence})
+        if self.multiprocessing > 1 and len(tasks) > 1:
+            res = p_map(_bootstrap_file, tasks,
+                        num_cpus=min(self.multiprocessing, len(tasks)))
+        else:
+            res = [_bootstrap_file(task) for task in tasks]
+        res = pd.concat(res, ignore_index=True)
+        res = res[res["LDScore"].isin(self.output_vars)]
+        res.to_csv(os.path.join(self.output_dir, "ld_scores_ci.tsv"),
+                   index=False, sep="\t")
+
+    def sweep(self, lowfreq_thresholds=None, far_neighbors_thresholds=None,
+              close_neighbors_thresholds=None, ontology_thresholds=None):
+        """Computing the threshold-dependent ld scores for grids of
+        thresholds. Each annotated file is loaded once (only the columns
+        with targets, frequencies, similarities and shortest paths), and the
+        scores for all the thresholds are computed in one pass with
+        :func:`sweep_thresholds`.
+
+        The results are saved as ld_scores_sweep.tsv file in the output
+        folder of the experiment.
+
+        Args:
+            lowfreq_thresholds (list of int): the thresholds for
+                "HighFreqNeighbors" and "LowFreqNeighbors" scores
+            far_neighbors_thresholds (list of float): the thresholds for
+                "FarNeighbors" score
+            close_neighbors_thresholds (list of float): the thresholds for
+                "CloseNeighbors" score
+            ontology_thresholds (list of float): the thresholds for
+                "CloseInOntology" score
+
+        Returns:
+            (pd.DataFrame): a tidy table with Model, LDScore, Threshold and
+            Score columns
+        """
+        grids = {"lowfreq_thresholds": lowfreq_thresholds,
+                 "far_neighbors_thresholds": far_neighbors_thresholds,
+                 "close_neighbors_thresholds": close_neighbors_thresholds,
+                 "ontology_thresholds": ontology_thresholds}
+        grids = {i: list(grids[i]) for i in grids if grids[i] is not None}
+        if not grids:
+            raise ValueError("At least one grid of thresholds should be "
+                             "specified.")
+
+        self._start_experiment()
+        res = []
+        for embeddings_path in self.embeddings:
+            filename, input_df = self._read_annotated(
+                embeddings_path, columns=["Target", "NeighborFrequency",
+                                          "Similarity", "ShortestPath"])
+            res.append(sweep_thresholds(input_df.assign(Model=filename),
+                                        **grids))
+        res = pd.concat(res, ignore_index=True)
+        res = res[res["LDScore"].isin(self.output_vars)]
+        res.to_csv(os.path.join(self.output_dir, "ld_scores_sweep.tsv"),
+                   index=False, sep="\t")
+        self.metadata["sweep"] = grids
+        self.save_metadata()
+        return res
+
+def sweep_thresholds(input_df, model_column="Model", lowfreq_thresholds=None,
+                     far_neighbors_thresholds=None,
+                     close_neighbors_thresholds=None,
+                     ontology_thresholds=None):
+    """Computing the threshold-dependent ld scores for grids of thresholds.
+
+    The values of each column are sorted once per model, and the number of
+    values on the right side of every threshold is found with binary search
+    in the sorted array. The scores match the ones computed by
+    :func:`score_neighborhoods` with the same thresholds.
+
+    Args:
+        input_df (pd.DataFrame): the annotated neighbor pairs. If the frame
+            has a *model_column*, the scores are computed for each model
+            separately.
+        model_column (str): the name of the column identifying the models
+        lowfreq_thresholds (list of int): the thresholds for
+            "HighFreqNeighbors" and "LowFreqNeighbors" scores
+        far_neighbors_thresholds (list of float): the thresholds for
+            "FarNeighbors" score
+        close_neighbors_thresholds (list of float): the thresholds for
+            "CloseNeighbors" score
+        ontology_thresholds (list of float): the thresholds for
+            "CloseInOntology" score
+
+    Returns:
+        (pd.DataFrame): a tidy table with Model, LDScore, Threshold and
+        Score columns
+    """
+    # score, column, thresholds, and which values are counted
+    sweeps = [("HighFreqNeighbors", "NeighborFrequency", lowfreq_thresholds,
+               "above"),
+              ("FarNeighbors", "Similarity", far_neighbors_thresholds,
+               "up to"),
+              ("CloseNeighbors", "Similarity", close_neighbors_thresholds,
+               "from"),
+              ("CloseInOntology", "ShortestPath", ontology_thresholds,
+               "up to")]
+
+    if model_column in input_df.columns:
+        groups = input_df.groupby(model_column, sort=False)
+    else:
+        groups = [("", input_df)]
+
+    res = []
+    for model, model_df in groups:
+        sorted_values = {}
+        for score, column, thresholds, side in sweeps:
+            if thresholds is None or not column in model_df.columns:
+                continue
+            if not column in sorted_values:
+                values = pd.to_numeric(model_df[column],
+                                       errors="coerce").to_numpy(dtype=float)
+                sorted_values[column] = np.sort(values[~np.isnan(values)])
+            values = sorted_values[column]
+            thresholds = np.asarray(thresholds, dtype=float)
+            if side == "up to":
+                counts = np.searchsorted(values, thresholds, side="right")
+            elif side == "above":
+                counts = len(values) - np.searchsorted(values, thresholds,
+                                                       side="right")
+            else:
+                counts = len(values) - np.searchsorted(values, thresholds,
+                                                       side="left")
+            if score == "CloseInOntology":
+                scores = counts
+            else:
+                scores = np.round(100 * counts / len(model_df), 2)
+            res.append(pd.DataFrame({"Model": model, "LDScore": score,
+                                     "Threshold": thresholds,
+                                     "Score": scores}))
+            if score == "HighFreqNeighbors":
+                res.append(pd.DataFrame({"Model": model,
+                                         "LDScore": "LowFreqNeighbors",
+                                         "Threshold": thresholds,
+                                         "Score": 100 - scores}))
+    if not res:
+        return pd.DataFrame(columns=["Model", "LDScore", "Threshold", "Score"])
+    return pd.concat(res, ignore_index=True)
+
+def score_neighborhoods(input_df, model_column="Model", binary_vars=None,
+                        lowfreq_threshold=10000, far_neighbors_threshold=0.7,
+                        close_neighbors_threshold=0.8, ontology_threshold=0.5):
+    """Computing ld scores from annotated neighbor pairs of one or more
+    embedding models.
+
+    All scores are computed as column reductions over the whole frame,
+    grouped by model, so a single call can score any number of models.
+
+    Args:
+        input_df (pd.DataFrame): the annotated neighbor pairs, as saved by
+            :class:`~ldt.experiments.annotate.AnnotateVectorNeighborhoods`.
+            If the frame has a *model_column*, the scores are computed for
+            each model separately; otherwise all pairs are treated as coming
+            from one model.
+        model_column (str): the name of the column identifying the models
+        binary_vars (list of str): the binary annotation columns to score.
+            If None, all columns other than the model, target, rank, neighbor
+            and continuous columns are scored.
+        lowfreq_threshold (int): neighbors above this frequency are
+            considered high-frequency.
+        far_neighbors_threshold (float): neighbors with similarity up to this
+            number are considered "far neighbors".
+        close_neighbors_threshold (float): neighbors with similarity from
+            this number are considered "close neighbors".
+        ontology_threshold (float): neighbors with shortest paths up to this
+            number are considered "CloseInOntology".
+
+    Returns:
+        (pd.DataFrame): the ld scores, one row per model (indexed by model)
+    """
+    if model_column in input_df.columns:
+        models = input_df[model_column]
+    else:
+        models = pd.Series("", index=input_df.index)
+    hits, shortest_path = _get_hits(
+        input_df, model_column=model_column, binary_vars=binary_vars,
+        lowfreq_threshold=lowfreq_threshold,
+        far_neighbors_threshold=far_neighbors_threshold,
+        close_neighbors_threshold=close_neighbors_threshold,
+        ontology_threshold=ontology_threshold)
+
+    res = _to_scores(hits.groupby(models).sum(),
+                     models.groupby(models).size())
+    if shortest_path is not None:
+        # the median of all found shortest paths - that's what was done in
+        # the paper
+        res["ShortestPathMedian"] = shortest_path.groupby(
+            models).median().round(3)
+    return res
+
+def _to_scores(counts, sizes):
+    """Helper for converting the numbers of hits of each score to ld scores.
+
+    Args:
+        counts (pd.DataFrame): the numbers of hits, one row per model
+        sizes (pd.Series): the numbers of neighbor pairs of the models
+
+    Returns:
+        (pd.DataFrame): the ld scores
+    """
+    res = (100 * counts.div(sizes, axis=0)).round(2)
+    if "HighFreqNeighbors" in res.columns:
+        res["LowFreqNeighbors"] = 100 - res["HighFreqNeighbors"]
+    if "CloseInOntology" in res.columns:
+        # the number of words with paths shorter than threshold (not a
+        # percentage)
+        res["CloseInOntology"] = counts["CloseInOntology"]
+    return res
+
+def stream_scores(path, chunksize=100000, binary_vars=None, **kwargs):
+    """Computing ld scores of one embedding model from an annotated file
+    that is read in chunks, so that the memory use does not depend on the
+    size of the file.
+
+    Only the scored columns are loaded, with explicit dtypes. The numbers of
+    hits of each score are accumulated chunk by chunk, and the median of
+    shortest paths is computed exactly from the running counts of their
+    values: the shortest path scores are inverse path lengths, so there are
+    only as many distinct values as there are path lengths.
+
+    Args:
+        path (str): the path to the annotated file (tsv or parquet)
+        chunksize (int): the number of rows read at once
+        binary_vars (list of str): the binary annotation columns to score.
+            If None, all columns other than the target, rank, neighbor and
+            continuous columns are scored.
+        **kwargs: the thresholds passed to :func:`score_neighborhoods`
+
+    Returns:
+        (dict): the ld scores
+    """
+    continuous = ["Similarity", "ShortestPath", "NeighborFrequency"]
+    header = get_columns(path)
+    if binary_vars is None:
+        binary_vars = [x for x in header if not x in
+                       ["Target", "Rank", "Neighbor", "TargetFrequency"] +
+                       continuous]
+    dtypes = {x: "boolean" for x in binary_vars if x in header}
+    dtypes.update({x: "float64" for x in continuous if x in header})
+    if not dtypes:
+        # only the number of rows is needed
+        dtypes = {header[0]: "object"}
+
+    counts, size, paths = None, 0, None
+    for chunk in read_table_chunks(path, chunksize, columns=list(dtypes),
+                                   dtype=dtypes):
+        hits, shortest_path = _get_hits(chunk, binary_vars=binary_vars,
+                                        **kwargs)
+        chunk_counts = hits.sum()
+        counts = chunk_counts if counts is None else counts + chunk_counts
+        size += len(chunk)
+        if shortest_path is not None:
+            chunk_paths = shortest_path.value_counts()
+            paths = chunk_paths if paths is None else \
+                paths.add(chunk_paths, fill_value=0)
+
+    if counts is None:
+        return {}
+    res = _to_scores(counts.astype("int64").to_frame().transpose(),
+                     pd.Series([size]))
+    res = res.to_dict(orient="records")[0]
+    if paths is not None:
+        res["ShortestPathMedian"] = np.nan
+        if len(paths):
+            paths = paths.sort_index()
+            cumulative = paths.to_numpy().cumsum()
+            total = cumulative[-1]
+            low = np.searchsorted(cumulative, (total - 1) // 2, side="right")
+            high = np.searchsorted(cumulative, total // 2, side="right")
+            res["ShortestPathMedian"] = round(
+                (paths.index[low] + paths.index[high]) / 2, 3)
+    return res
+
+def _get_hits(input_df, model_column="Model", binary_vars=None,
+              lowfreq_threshold=10000, far_neighbors_threshold=0.7,
+              close_neighbors_threshold=0.8, ontology_threshold=0.5):
+    """Helper for marking the neighbor pairs counted by each score: the
+    binary scores count the values that are True, and the threshold scores
+    count the values on the right side of the thresholds.
+
+    Returns:
+        (pd.DataFrame, pd.Series): the boolean frame with a column per score,
+        and the numeric shortest paths (None if there are none in the data)
+    """
+    if binary_vars is None:
+        binary_vars = [x for x in input_df.columns if not x in
+                       [model_column, "Target", "Rank", "Neighbor",
+                        "Similarity", "ShortestPath", "TargetFrequency",
+                        "NeighborFrequency"]]
+    hits = {}
+    for var in binary_vars:
+        if var in input_df.columns:
+            hits[var] = input_df[var] == True #pylint: disable=singleton-comparison
+    if "NeighborFrequency" in input_df.columns:
+        frequency = pd.to_numeric(input_df["NeighborFrequency"],
+                                  errors="coerce")
+        hits["HighFreqNeighbors"] = frequency > lowfreq_threshold
+    if "Similarity" in input_df.columns:
+        similarity = pd.to_numeric(input_df["Similarity"], errors="coerce")
+        hits["FarNeighbors"] = similarity <= far_neighbors_threshold
+        hits["CloseNeighbors"] = similarity >= close_neighbors_threshold
+    shortest_path = None
+    if "ShortestPath" in input_df.columns:
+        shortest_path = pd.to_numeric(input_df["ShortestPath"],
+                                      errors="coerce")
+        hits["CloseInOntology"] = shortest_path <= ontology_threshold
+    return pd.DataFrame(hits, index=input_df.index), shortest_path
+
+#: the maximum size of the resample weight matrices processed at once
+_BOOTSTRAP_BATCH = 2**22
+
+def bootstrap_scores(input_df, n_resamples=1000, confidence=0.95, seed=0,
+                     binary_vars=None, **kwargs):
+    """Computing bootstrap confidence intervals of the ld scores of one
+    embedding model.
+
+    The neighborhoods are resampled as blocks: each resample draws the
+    target words with replacement, and every drawn target brings all its
+    neighbor pairs. The hits of each score are summed per target once, so
+    that each resample only needs the number of times every target was
+    drawn (computed from NumPy index arrays), and the scores of a batch of
+    resamples are a single matrix product. The medians of shortest paths are
+    found from the cumulative weights of the sorted paths.
+
+    With the same seed, the models with the same vocabulary sample are
+    resampled with the same targets, so their intervals are comparable.
+
+    Args:
+        input_df (pd.DataFrame): the annotated neighbor pairs of one model
+        n_resamples (int): the number of bootstrap resamples
+        confidence (float): the confidence level of the intervals
+        seed (int): the seed of the random generator
+        binary_vars (list of str): the binary annotation columns to score
+            (see :func:`score_neighborhoods`)
+        **kwargs: the thresholds passed to :func:`score_neighborhoods`
+
+    Returns:
+        (pd.DataFrame): the ld scores (Score column) with the lower and upper
+        bounds of their confidence intervals (Lower and Upper columns),
+        indexed by score name
+    """
+    if n_resamples < 1 or not 0 < confidence < 1:
+        raise ValueError("The number of resamples should be positive, and "
+                         "the confidence level should be between 0 and 1.")
+    input_df = input_df.reset_index(drop=True)
+    res = score_neighborhoods(input_df, binary_vars=binary_vars, **kwargs)
+    res = pd.DataFrame({"Score": res.iloc[0]}) if len(res) else \
+        pd.DataFrame(columns=["Score"])
+    if input_df.empty:
+        res["Lower"] = np.nan
+        res["Upper"] = np.nan
+        return res
+
+    hits, shortest_path = _get_hits(input_df, binary_vars=binary_vars,
+                                    **kwargs)
+    blocks, targets = pd.factorize(input_df["Target"].astype(str))
+    n_targets = len(targets)
+    block_hits = hits.groupby(blocks).sum().to_numpy(dtype=float)
+    block_sizes = np.bincount(blocks, minlength=n_targets).astype(float)
+    if shortest_path is not None:
+        paths = shortest_path.to_numpy(dtype=float)
+        found = ~np.isnan(paths)
+        order = np.argsort(paths[found], kind="stable")
+        sorted_paths = paths[found][order]
+        path_blocks = blocks[found][order]
+    else:
+        sorted_paths = np.array([])
+
+    rng = np.random.default_rng(seed)
+    batch = max(1, _BOOTSTRAP_BATCH // max(n_targets, len(sorted_paths)))
+    samples, medians = [], []
+    for start in range(0, n_resamples, batch):
+        size = min(batch, n_resamples - start)
+        # how many times each target was drawn in each resample
+        drawn = rng.integers(0, n_targets, size=(size, n_targets))
+        drawn += np.arange(size)[:, None] * n_targets
+        weights = np.bincount(drawn.ravel(), minlength=size*n_targets)
+        weights = weights.reshape(size, n_targets)
+
+        counts = weights @ block_hits
+        samples.append(100 * counts / (weights @ block_sizes)[:, None])
+        if "CloseInOntology" in hits.columns:
+            # not a percentage, see score_neighborhoods
+            samples[-1][:, hits.columns.get_loc("CloseInOntology")] = \
+                counts[:, hits.columns.get_loc("CloseInOntology")]
+
+        if len(sorted_paths):
+            cumulative = np.cumsum(weights[:, path_blocks], axis=1)
+            total = cumulative[:, -1]
+            low = (cumulative <= ((total - 1) // 2)[:, None]).sum(axis=1)
+            high = (cumulative <= (total // 2)[:, None]).sum(axis=1)
+            last = len(sorted_paths) - 1
+            median = (sorted_paths[np.minimum(low, last)] +
+                      sorted_paths[np.minimum(high, last)]) / 2
+            median[total == 0] = np.nan
+            medians.append(median)
+
+    samples = pd.DataFrame(np.concatenate(samples), columns=hits.columns)
+    if "HighFreqNeighbors" in samples.columns:
+        samples["LowFreqNeighbors"] = 100 - samples["HighFreqNeighbors"]
+    if medians:
+        samples["ShortestPathMedian"] = np.concatenate(medians)
+    alpha = (1 - confidence) / 2
+    decimals = {i: 3 if i == "ShortestPathMedian" else 2 for i in
+                samples.columns}
+    intervals = samples.quantile([alpha, 1 - alpha]).round(decimals)
+    intervals = intervals.transpose()
+    intervals.columns = ["Lower", "Upper"]
+    return res.join(intervals)
+
+def _bootstrap_file(task):
+    """Helper for computing the bootstrap confidence intervals for one
+    annotated file in a worker process.
+
+    Args:
+        task (dict): the name of the model and the path to its annotated
+            file, with the arguments of :func:`bootstrap_scores`
+
+    Returns:
+        (pd.DataFrame): a tidy table with Model, LDScore, Score, Lower and
+        Upper columns
+    """
+    input_df = read_table(task["path"],
+                          columns=_SCORED_COLUMNS + task["binary_vars"])
+    res = bootstrap_scores(input_df, n_resamples=task["n_resamples"],
+                           confidence=task["confidence"],
+                           binary_vars=task["binary_vars"])
+    res.index.name = "LDScore"
+    res = res.reset_index()
+    res.insert(0, "Model", task["model"])
+    return res
+
 if __name__ == '__main__':
     annotation = LDScoring(experiment_name="testing", overwrite=True)
     annotation.get_results()
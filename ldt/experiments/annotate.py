@@ -11,7 +11,8 @@ documentation of that class for more details.
 
 The output is saved in the experiments/neighbors_annotated/your_experiment_name
 subfolder of the ldt resource folder specified in the configuration file.
-These are tab-separated data files with columns indicating the presence of a
+These are tables (tab-separated or parquet files, see
+:mod:`ldt.helpers.tables`) with columns indicating the presence of a
 binary relation in target_neighbor word pairs (e.g. whether they are
 synonyns), or a numerical indicator of a relationship (e.g. the distance
 between them in an ontology). See the full list of available scores `here
@@ -43,6 +44,9 @@ from p_tqdm import p_map
 from vecto.utils.data import load_json
 
 from ldt.experiments.metadata import Experiment
+from ldt.helpers.tables import check_format, find_table, get_columns, \
+    list_tables, read_table, write_table
+from ldt.helpers.profiling import Profiler, get_profiler, profiled
 from ldt.load_config import config
 from ldt.dicts.normalize import Normalization
 from ldt.dicts.derivation.meta import DerivationAnalyzer
@@ -51,6 +55,9 @@ from ldt.relations.pair import RelationsInPair
 from ldt.relations.distribution import DistributionDict
 from ldt.load_config import config
 
+#: the field for the profiling statistics of the annotated pairs
+_PROFILE_KEY = "_profile"
+
 
 # class NoDaemonProcess(multiprocessing.Process):
 #   def __init__(self, group=None, target=None, name=None, args=(), kwargs={},
@@ -85,7 +92,12 @@ class AnnotateVectorNeighborhoods(Experiment):
                                          "experiments"),
                  ldt_analyzer=None,
                  multiprocessing=config["experiments"]["multiprocessing"],
-                 debugging=False):
+                 debugging=False,
+                 prefetch=config["experiments"].get("prefetch", False),
+                 output_format=config["experiments"].get("output_format",
+                                                         "tsv"),
+                 export_tsv=False,
+                 profiling=config["experiments"].get("profiling", False)):
 
         """ Annotating pre-computed top *n* neighbors for a given vocab sample
 
@@ -107,6 +119,26 @@ class AnnotateVectorNeighborhoods(Experiment):
                 resources set up as desired (see tutorial and
                 class documentation). If None, default settings for English
                 will be used.
+            multiprocessing (int): the number of processes to use
+            debugging (bool): if True, the errors in the annotation of
+                individual pairs are not silenced
+            prefetch (bool): if True, the dictionary data for all the words
+                in the neighborhoods is resolved before the annotation of
+                individual pairs (see
+                :meth:`~ldt.relations.pair.RelationsInPair.prefetch`). The
+                per-pair timeout does not apply to the prefetching, so it is
+                off by default.
+            output_format (str): the format of the annotated files: "tsv"
+                or "parquet" (see :mod:`ldt.helpers.tables`). While the
+                annotation is in progress, the annotated pairs are saved to a
+                tsv file, so that the data is not lost if the annotation is
+                interrupted.
+            export_tsv (bool): if True, the parquet files are also saved
+                as tsv.
+            profiling (bool): if True, the calls of the ldt components and
+                resources involved in the annotation are counted and timed,
+                and the summary is saved in the experiment metadata (see
+                :mod:`ldt.helpers.profiling`)
             ld_scores (str or list of str): "all" for all supported scores,
                 or a list of ld_scores. Supported values are:
 
@@ -155,6 +187,11 @@ class AnnotateVectorNeighborhoods(Experiment):
         self.metadata["output_dir"] = self.output_dir
         self.metadata["debugging"] = debugging
         self.metadata["multiprocessing"] = multiprocessing
+        self.metadata["prefetch"] = prefetch
+        self.metadata["output_format"] = check_format(output_format)
+        self.metadata["profiling"] = profiling
+        self._export_tsv = export_tsv
+        self._profile = Profiler()
 
         self._load_dataset(dataset=None)
         neighbors_metadata_path = self.output_dir.replace(
@@ -169,6 +206,8 @@ class AnnotateVectorNeighborhoods(Experiment):
             self.metadata["neighbors_metadata_path"] = neighbors_metadata_path
             neighbors_metadata = load_json(neighbors_metadata_path)
             self.metadata["embeddings"] = neighbors_metadata["embeddings"]
+            # None for the neighborhoods saved before the format was recorded
+            self._neighbors_format = neighbors_metadata.get("output_format")
             self.embeddings = []
             for embedding in self.metadata["embeddings"]:
                 self.embeddings.append(embedding["path"])
@@ -258,23 +297,47 @@ class AnnotateVectorNeighborhoods(Experiment):
         prior_data = collect_prior_data(self.metadata["output_dir"])
         # print("collected prior data", len(prior_data))
 
+        # the variable types are only kept in metadata while a file is
+        # being annotated
+        self.metadata["continuous_vars"] = self.continuous_vars
+        self.metadata["binary_vars"] = self.binary_vars
+
         global metadata
         metadata = self.metadata
 
         global global_analyzer
         global_analyzer = self.ldt_analyzer
 
+        profiler = get_profiler()
+        if metadata["profiling"]:
+            was_enabled = profiler.enabled
+            profiler.enable()
+            before = profiler.snapshot()
+
         filename = self.get_fname_for_embedding(embeddings_path)
-        neighbor_file_path = os.path.join(self.output_dir.replace(
-            "neighbors_annotated", "neighbors"), filename+".tsv")
+        neighbor_file_path = find_table(os.path.join(self.output_dir.replace(
+            "neighbors_annotated", "neighbors"), filename),
+                                        fmt=self._neighbors_format)
+        if not neighbor_file_path:
+            raise IOError("The vector neighborhoods of " + filename +
+                          " were not found.")
         print("\nAnnotating "+neighbor_file_path)
         self.metadata["out_path"] = os.path.join(self.output_dir,
                                                  filename+".tsv")
 
-        input_df = pd.read_csv(neighbor_file_path, header=0, sep="\t")
+        input_df = read_table(neighbor_file_path)
         self.metadata["total_pairs"] += len(input_df)
         dicts = input_df.to_dict(orient="records")
 
+        if metadata["prefetch"] and hasattr(global_analyzer, "prefetch"):
+            pending = [d for d in dicts if not
+                       d["Target"] + ":" + d["Neighbor"] in prior_data]
+            if pending:
+                print("\nPrefetching dictionary data")
+                global_analyzer.prefetch(
+                    collect_targets_and_neighbors(pending),
+                    n_jobs=metadata["multiprocessing"])
+
         if metadata["multiprocessing"] == 1:
             print("\nMultiprocessing: 1 core")
             newdicts = []
@@ -308,25 +371,33 @@ class AnnotateVectorNeighborhoods(Experiment):
             # pool.join()
 
         dicts = self.add_distr_data(dicts)
+        if metadata["profiling"]:
+            self._profile.merge(profiler.since(before))
+            for d in dicts:
+                self._profile.merge(d.pop(_PROFILE_KEY, {}))
+            if not was_enabled:
+                profiler.disable()
         self.save_results(dicts, overwrite=True)
 
     def save_results(self, dicts, overwrite=False):
         output_df = pd.DataFrame(dicts,
                                  columns=["Target", "Rank", "Neighbor",
                                           "Similarity"]+self._ld_scores)
-        if not os.path.exists(self.metadata["out_path"]):
+        if overwrite:
+            # the tsv file with the annotation in progress is replaced by
+            # the table in the output format
+            write_table(output_df, self.metadata["out_path"][:-len(".tsv")],
+                        fmt=self.metadata["output_format"],
+                        export_tsv=self._export_tsv)
+        elif not os.path.exists(self.metadata["out_path"]):
             output_df.to_csv(self.metadata["out_path"], index=False,
                              sep="\t", header=True)
         else:
-            if not overwrite:
             # existing_df = pd.read_csv(self.metadata["out_path"], header=0, sep="\t")
             # existing_dicts = existing_df.to_dict(orient="records")
             # if not existing_dicts == dicts:
-                output_df.to_csv(self.metadata["out_path"], index=False, sep="\t",
-                                 mode="a", header=False)
-            else:
-                output_df.to_csv(self.metadata["out_path"], index=False,
-                                 sep="\t", header=True)
+            output_df.to_csv(self.metadata["out_path"], index=False, sep="\t",
+                             mode="a", header=False)
 
 
     def _postprocess_metadata(self):
@@ -334,12 +405,15 @@ class AnnotateVectorNeighborhoods(Experiment):
         calculating the overall coverage (considered as number of non-unique
         pairs for which dictionary data was successfully found)."""
 
-        del self.metadata["continuous_vars"]
-        del self.metadata["binary_vars"]
+        self.metadata.pop("continuous_vars", None)
+        self.metadata.pop("binary_vars", None)
+        if self.metadata.get("profiling"):
+            self.metadata["profile"] = self._profile.summary()
 
         # find missing data
-        input_df = pd.read_csv(self.metadata["out_path"], header=0,
-                               sep="\t")
+        out_path = self.metadata["out_path"][:-len(".tsv")]
+        output_format = self.metadata["output_format"]
+        input_df = read_table(find_table(out_path, fmt=output_format))
         dicts = input_df.to_dict(orient="records")
         set_dicts = {}
         for i in dicts:
@@ -364,8 +438,10 @@ class AnnotateVectorNeighborhoods(Experiment):
 
         #order the dataframe in the original order
         res = []
-        input_neighbors_df = pd.read_csv(self.metadata["out_path"].replace(
-                "neighbors_annotated", "neighbors"), header=0, sep="\t")
+        input_neighbors_df = read_table(
+            find_table(out_path.replace("neighbors_annotated", "neighbors"),
+                       fmt=self._neighbors_format),
+            columns=["Target", "Neighbor"])
         neighbor_dicts = input_neighbors_df.to_dict(orient="records")
         for i in neighbor_dicts:
             k = i["Target"]+":"+i["Neighbor"]
@@ -374,11 +450,12 @@ class AnnotateVectorNeighborhoods(Experiment):
             except KeyError:
                 pass
         self.save_results(res, overwrite=True)
-        print("\nAnnotation done:", self.metadata["out_path"])
+        print("\nAnnotation done:", find_table(out_path, fmt=output_format))
 
 
 
 
+    @profiled("AnnotateVectorNeighborhoods.add_distr_data")
     def add_distr_data(self, dicts):
         distr_scores = ["NonCooccurring", "GDeps", "TargetFrequency", "NeighborFrequency"]
         scores = [x for x in distr_scores if x in self._ld_scores]
@@ -392,7 +469,7 @@ class AnnotateVectorNeighborhoods(Experiment):
         else:
             wordlist = None
         frequencies = "TargetFrequency" in self._ld_scores or "NeighborFrequency" in self._ld_scores
-        distr_dict = DistributionDict(gdeps=gdeps,
+        distr_dict = DistributionDict(corpus=config["corpus"], gdeps=gdeps,
                                       cooccurrence=cooccurrence,
                                       wordlist=wordlist,
                                       frequencies=frequencies)
@@ -481,14 +558,11 @@ def collect_prior_data(output_dir):
          pairs.
 
     """
-    processed_files = os.listdir(output_dir)
-    if "metadata.json" in processed_files:
-        processed_files.remove("metadata.json")
     prior_res = {}
-    for f in processed_files:
-        input_df = pd.read_csv(os.path.join(output_dir, f), header=0, sep="\t")
-        del input_df["Rank"]
-        del input_df["Similarity"]
+    for path in list_tables(output_dir).values():
+        columns = [x for x in get_columns(path) if not x in ["Rank",
+                                                             "Similarity"]]
+        input_df = read_table(path, columns=columns)
         dicts = input_df.to_dict(orient="records")
         for pair in dicts:
             prior_res[pair["Target"]+":"+pair["Neighbor"]] = pair
@@ -547,6 +621,12 @@ def _process_one_dict(col_dict):
     prior_data objects."""
     neighbor = col_dict["Neighbor"]
     target = col_dict["Target"]
+    # the statistics of the worker processes are sent back with the results
+    profiling = metadata["profiling"] and metadata["multiprocessing"] != 1
+    if profiling:
+        profiler = get_profiler()
+        profiler.enable()
+        before = profiler.snapshot()
 #    print(target + ":" + neighbor in prior_data)
     if target + ":" + neighbor in prior_data:
 #        print("using prior results")
@@ -572,6 +652,8 @@ def _process_one_dict(col_dict):
             for i in to_check_binary:
                 col_dict[i] = i in relations
     save_result(col_dict)
+    if profiling:
+        col_dict[_PROFILE_KEY] = profiler.since(before)
     return col_dict
 
 def save_result(dicts, overwrite=False):
@@ -9,5 +9,6 @@ import ldt
 
 if __name__ == "__main__":
 
+    ldt.check_version()
     if len(sys.argv) == 1:
         ldt.experiments.default_workflow()
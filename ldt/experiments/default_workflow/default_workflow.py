@@ -22,21 +22,33 @@ import ruamel.yaml as yaml
 
 import ldt
 from ldt.load_config import config
+from ldt.experiments.scheduler import schedule_experiments
 import ruamel.yaml as yaml
 
 def default_workflow(experiment_name=
                      config["experiments"]["experiment_name"],
                      overwrite=config["experiments"]["overwrite"],
-                     top_n=config["experiments"]["top_n"]):
+                     top_n=config["experiments"]["top_n"],
+                     workers=config["experiments"].get("workflow_workers", 1)):
     """Full LDT default_workflow for English, with most LDT resources used for
     analysis of relations (except BabelNet). Modify this script as needed.
     Descriptions of available settings for all resources are available in
-    their respective documentation."""
+    their respective documentation.
+
+    The stages are run per embedding (see :mod:`ldt.experiments.scheduler`):
+    the annotation of a model starts as soon as its neighborhoods are
+    extracted, while the neighborhoods of the next models are extracted in
+    *workers* threads, and each model is scored as soon as it is annotated.
+    If the annotation uses several processes, the other stages are paused
+    while a model is annotated. If *workers* is 0, everything runs in the
+    main thread."""
 
     #getting vector neighborhoods
     neighborhoods = ldt.experiments.VectorNeighborhoods(
         experiment_name=experiment_name, overwrite=overwrite, top_n=top_n)
-    neighborhoods.get_results()
+    # the next stages read the metadata of the previous ones on
+    # initialization
+    neighborhoods.save_metadata()
 
     #setting up ldt resources for annotation with default settings: English,
     # custom derivational analysis, no BabelNet
@@ -55,9 +67,12 @@ def default_workflow(experiment_name=
     annotation = ldt.experiments.AnnotateVectorNeighborhoods(
         experiment_name=experiment_name, overwrite=overwrite,
         ld_scores="main", debugging=True, ldt_analyzer=analyzer)
-    annotation.get_results()
+    annotation.save_metadata()
 
     # analysing the results
     scoring = ldt.experiments.LDScoring(experiment_name=experiment_name,
                                         overwrite=overwrite, ld_scores="main")
-    scoring.get_results()
+
+    scheduler = schedule_experiments(neighborhoods, annotation, scoring,
+                                     workers=workers)
+    return scheduler.run()
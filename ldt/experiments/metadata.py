@@ -22,6 +22,7 @@ import os
 import datetime
 import abc
 import uuid
+import contextlib
 
 import json
 from vecto.utils.data import load_json, save_json
@@ -167,23 +168,34 @@ class Experiment(metaclass=abc.ABCMeta):
             return None
 
         for i in self.embeddings:
-            emb_uuid = self._check_uuid_in_metadata(field="embeddings", path=i)
-            if emb_uuid:
-                self.metadata["timestamp"][emb_uuid] = {}
-                self.metadata["timestamp"][emb_uuid]["start_time"] = \
-                    datetime.datetime.now().isoformat()
-            else:
-                self.metadata["timestamp"][i] = {}
-                self.metadata["timestamp"][i]["start_time"] = \
-                    datetime.datetime.now().isoformat()
-
-            self._process(embeddings_path=i)
-            if emb_uuid:
-                self.metadata["timestamp"][emb_uuid]["end_time"] = \
-                    datetime.datetime.now().isoformat()
-            else:
-                self.metadata["timestamp"][i]["end_time"] = \
-                    datetime.datetime.now().isoformat()
+            self.process_embedding(i)
+
+    def process_embedding(self, embeddings_path, lock=None):
+        """Processing one embedding, and saving the timestamps of when it was
+        started and finished.
+
+        Args:
+            embeddings_path (str): the path to the embedding
+            lock (threading.Lock): if the embeddings are processed in
+                parallel threads, the lock guarding the metadata of the
+                experiment
+
+        Returns:
+            None
+        """
+        lock = lock or contextlib.nullcontext()
+        emb_uuid = self._check_uuid_in_metadata(field="embeddings",
+                                                path=embeddings_path)
+        key = emb_uuid or embeddings_path
+        with lock:
+            self.metadata["timestamp"][key] = {}
+            self.metadata["timestamp"][key]["start_time"] = \
+                datetime.datetime.now().isoformat()
+
+        self._process(embeddings_path=embeddings_path)
+        with lock:
+            self.metadata["timestamp"][key]["end_time"] = \
+                datetime.datetime.now().isoformat()
             self._postprocess_metadata()
             self.save_metadata()
 
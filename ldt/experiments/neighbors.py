@@ -31,6 +31,7 @@ from ldt import load_resource
 from ldt import __version__
 from ldt.load_config import config
 from ldt.experiments.metadata import Experiment
+from ldt.helpers.tables import check_format, write_table
 
 
 
@@ -48,7 +49,10 @@ class VectorNeighborhoods(Experiment):
                  embeddings=config["experiments"]["embeddings"],
                  output_dir=os.path.join(config["path_to_resources"],
                                          "experiments"),
-                 dataset=config["experiments"]["vocab_sample"]):
+                 dataset=config["experiments"]["vocab_sample"],
+                 output_format=config["experiments"].get("output_format",
+                                                         "tsv"),
+                 export_tsv=False):
 
         """ Retrieving top *n* neighbors for a given vocab sample
 
@@ -73,6 +77,10 @@ class VectorNeighborhoods(Experiment):
                 for each word.
             normalize (bool): whether the input embeddings should be
                 normalized.
+            output_format (str): the format of the neighbors files: "tsv"
+                or "parquet" (see :mod:`ldt.helpers.tables`)
+            export_tsv (bool): if True, the parquet files are also saved
+                as tsv.
 
         Returns:
             (None): the neighbors file will be written to disk
@@ -97,6 +105,9 @@ class VectorNeighborhoods(Experiment):
         self._load_dataset(dataset=dataset)
         self._normalize = normalize
         self._top_n = top_n
+        self._output_format = check_format(output_format)
+        self._export_tsv = export_tsv
+        self.metadata["output_format"] = output_format
 
     def _load_dataset(self, dataset):
         """Loading the vocabulary file from the location specified in the
@@ -142,7 +153,7 @@ class VectorNeighborhoods(Experiment):
 
     def _process(self, embeddings_path):
         """Extracting top_n neighbors from each of the embeddings,
-        saving the results as tab-separated file in the output directory.
+        saving the results as a table in the output directory.
 
         Args:
             embeddings_path (str): the full path to a folder containing one
@@ -171,10 +182,9 @@ class VectorNeighborhoods(Experiment):
             res = pd.DataFrame(neighbors, columns=["Target", "Rank",
                                                    "Neighbor",
                                                    "Similarity"])
-            res.to_csv(path_or_buf=os.path.join(self.output_dir,
-                                                embeddings.metadata[
-                                                    "model"]+".tsv"),
-                       header=True, index=False, sep="\t")
+            write_table(res, os.path.join(self.output_dir,
+                                          embeddings.metadata["model"]),
+                        fmt=self._output_format, export_tsv=self._export_tsv)
             embeddings = None
 
 # if __name__ == '__main__':
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""Scheduling the stages of ldt experiments.
+
+A full ldt experiment has three stages: the extraction of vector
+neighborhoods (:class:`~ldt.experiments.neighbors.VectorNeighborhoods`),
+their annotation
+(:class:`~ldt.experiments.annotate.AnnotateVectorNeighborhoods`) and the
+computation of ld scores (:class:`~ldt.experiments.analyze.LDScoring`).
+Each stage can be run for all the embeddings before the next one starts,
+but the stages only depend on each other for the same embedding: the
+annotation of a model can start as soon as its neighborhoods are
+extracted, and it can be scored as soon as it is annotated.
+
+This module treats the stages of each embedding as tasks in a dependency
+graph, and runs the tasks that are ready concurrently:
+
+ - the tasks of most stages run in a pool of threads. The neighbor
+   extraction spends most of its time in numpy (which releases the GIL), and
+   the scoring in pandas;
+ - the annotation runs in the main thread, one embedding at a time,
+   since it keeps its state in module globals and relies on signals for
+   the timeouts of individual pairs. If it runs in one process, it
+   overlaps with the extraction of neighbors for the next models. If it
+   forks its own worker processes (see the *multiprocessing* option of the
+   annotation), forking while other threads hold locks (e.g. in numpy or
+   pandas) could deadlock the workers, so the annotation is *exclusive*: it
+   waits for the running tasks to finish, and no other task starts until
+   it is done.
+
+When several tasks are ready, the ones of the later stages go first, so
+that the models are finished (and their memory is released) as early as
+possible.
+
+Examples:
+    >>> scheduler = ldt.experiments.scheduler.Scheduler(workers=2)
+    >>> scheduler.add_task("neighbors", "model_1", get_neighbors)
+    >>> scheduler.add_task("annotation", "model_1", annotate,
+    dependencies=[("neighbors", "model_1")], main_thread=True)
+    >>> scheduler.run()
+
+"""
+
+import os
+import time
+import functools
+import threading
+import concurrent.futures
+
+class Task(object):
+    """A unit of work: one stage of an experiment for one embedding."""
+
+    def __init__(self, stage, embedding, function, dependencies=(),
+                 main_thread=False, exclusive=False):
+        """Initializing the task.
+
+        Args:
+            stage (str): the name of the stage
+            embedding (str): the embedding processed by the task, or None
+                for the tasks that concern all embeddings
+            function (callable): the function to call (without arguments)
+            dependencies (list of tuples): the (stage, embedding) keys of
+                the tasks that have to be finished before this one starts
+            main_thread (bool): if True, the task is run in the main thread
+            exclusive (bool): if True, the task is run in the main thread
+                when no other tasks are running, e.g. because it forks
+                worker processes
+
+        """
+        #: (str): the name of the stage
+        self.stage = stage
+        #: (str): the embedding processed by the task
+        self.embedding = embedding
+        #: (callable): the function to call
+        self.function = function
+        #: (list of tuples): the keys of the tasks this one depends on
+        self.dependencies = list(dependencies)
+        #: (bool): whether the task has to run in the main thread
+        self.main_thread = main_thread or exclusive
+        #: (bool): whether no other tasks may run at the same time
+        self.exclusive = exclusive
+        #: the output of the function
+        self.result = None
+        #: (float): the duration of the task in seconds
+        self.seconds = None
+
+    @property
+    def key(self):
+        """The (stage, embedding) key of the task."""
+        return (self.stage, self.embedding)
+
+    def run(self):
+        """Calling the function of the task and timing it."""
+        start = time.perf_counter()
+        try:
+            self.result = self.function()
+        finally:
+            self.seconds = time.perf_counter() - start
+        return self.result
+
+class Scheduler(object):
+    """The executor of a graph of tasks, with limits on the number of tasks
+    of each stage that run at the same time."""
+
+    def __init__(self, workers=1, concurrency=None):
+        """Initializing the scheduler.
+
+        Args:
+            workers (int): the number of threads for the tasks that do not
+                run in the main thread. If 0, all tasks run in the main
+                thread one by one, in the order of their dependencies.
+            concurrency (dict): the maximum numbers of simultaneous tasks
+                by stage. The stages that are not listed are only limited
+                by the number of workers.
+
+        """
+        if workers < 0:
+            raise ValueError("The number of workers cannot be negative.")
+        #: (int): the number of threads
+        self.workers = workers
+        #: (dict): the limits of simultaneous tasks by stage
+        self.concurrency = dict(concurrency or {})
+        #: (dict): the tasks by their (stage, embedding) keys
+        self.tasks = {}
+        self._order = []
+        self._locks = {}
+
+    def add_task(self, stage, embedding, function, dependencies=(),
+                 main_thread=False, exclusive=False):
+        """Adding a task to the graph.
+
+        Args:
+            stage (str): the name of the stage
+            embedding (str): the embedding processed by the task, or None
+            function (callable): the function to call (without arguments)
+            dependencies (list of tuples): the (stage, embedding) keys of
+                the tasks that have to be finished before this one starts.
+                The keys of the tasks that are not in the graph are
+                considered finished (e.g. the stages that were completed in
+                a previous run).
+            main_thread (bool): if True, the task is run in the main thread
+            exclusive (bool): if True, the task is run in the main thread
+                when no other tasks are running (see :class:`Task`)
+
+        Returns:
+            (Task): the task
+        """
+        task = Task(stage, embedding, function, dependencies=dependencies,
+                    main_thread=main_thread, exclusive=exclusive)
+        if task.key in self.tasks:
+            raise ValueError("The task " + str(task.key) + " is already "
+                             "scheduled.")
+        if not stage in self._order:
+            self._order.append(stage)
+        self.tasks[task.key] = task
+        return task
+
+    def get_lock(self, stage):
+        """Retrieving the lock shared by the tasks of a stage, e.g. for
+        guarding the metadata of an experiment.
+
+        Args:
+            stage (str): the name of the stage
+
+        Returns:
+            (threading.Lock): the lock
+        """
+        return self._locks.setdefault(stage, threading.Lock())
+
+    def _check_graph(self):
+        """Helper for making sure that the dependencies do not form a
+        cycle."""
+        visited = {}
+
+        def visit(key):
+            if visited.get(key) == "done":
+                return
+            if visited.get(key) == "active":
+                raise ValueError("The tasks have circular dependencies: " +
+                                 str(key))
+            visited[key] = "active"
+            for dependency in self.tasks[key].dependencies:
+                if dependency in self.tasks:
+                    visit(dependency)
+            visited[key] = "done"
+
+        for key in self.tasks:
+            visit(key)
+
+    def _ready(self, pending, done, running):
+        """Helper for listing the tasks that can start now, the ones of the
+        later stages first."""
+        res = []
+        for key in pending:
+            task = self.tasks[key]
+            if not all(x in done or not x in self.tasks for x in
+                       task.dependencies):
+                continue
+            limit = self.concurrency.get(task.stage)
+            if limit is not None and running.get(task.stage, 0) >= limit:
+                continue
+            res.append(task)
+        res.sort(key=lambda x: -self._order.index(x.stage))
+        return res
+
+    def run(self):
+        """Running all the tasks.
+
+        If a task fails, no more tasks are started, and the error is
+        raised once the running tasks are finished.
+
+        Returns:
+            (dict): the durations of the tasks in seconds, by stage and
+            embedding
+        """
+        self._check_graph()
+        pending = [key for key in self.tasks]
+        done = set()
+        running = {}
+        futures = {}
+        error = None
+        executor = None
+        if self.workers:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.workers)
+        try:
+            while (pending and error is None) or futures:
+                started = False
+                if error is None:
+                    inline = [x for x in self._ready(pending, done, running)
+                              if x.main_thread or executor is None]
+                    # the pool is drained for an exclusive task
+                    exclusive = inline and inline[0].exclusive
+                    ready = [] if exclusive else \
+                        self._ready(pending, done, running)
+                    for task in ready:
+                        limit = self.concurrency.get(task.stage)
+                        if limit is not None and \
+                                running.get(task.stage, 0) >= limit:
+                            continue
+                        if task.main_thread or executor is None:
+                            continue
+                        if len(futures) >= self.workers:
+                            break
+                        pending.remove(task.key)
+                        running[task.stage] = running.get(task.stage, 0) + 1
+                        futures[executor.submit(task.run)] = task
+                        started = True
+
+                    if inline and not (exclusive and futures):
+                        task = inline[0]
+                        pending.remove(task.key)
+                        try:
+                            task.run()
+                            done.add(task.key)
+                        except Exception as err: #pylint: disable=broad-except
+                            error = err
+                        started = True
+
+                finished = [x for x in futures if x.done()]
+                if not finished and not started:
+                    if not futures:
+                        break
+                    finished, _ = concurrent.futures.wait(
+                        futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    task = futures.pop(future)
+                    running[task.stage] -= 1
+                    if future.exception() is not None:
+                        error = error or future.exception()
+                    else:
+                        done.add(task.key)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        if error is not None:
+            raise error
+        if pending:
+            raise ValueError("The following tasks could not be run: " +
+                             ", ".join(str(x) for x in pending))
+        return self.report()
+
+    def report(self):
+        """Summarizing the durations of the finished tasks.
+
+        Returns:
+            (dict): the durations in seconds, by stage and embedding
+        """
+        res = {}
+        for stage in self._order:
+            res[stage] = {}
+            for task in self.tasks.values():
+                if task.stage == stage and task.seconds is not None:
+                    res[stage][task.embedding] = round(task.seconds, 4)
+        return res
+
+def schedule_experiments(neighbors, annotation, scoring, workers=1,
+                         concurrency=None):
+    """Setting up the tasks of a full ldt experiment: for each embedding,
+    the neighbors are extracted, annotated and scored, and the ld scores of
+    all embeddings are saved when they are all scored.
+
+    The embeddings that were already processed in the neighbors and
+    annotation stages (if the experiments are not overwritten) are skipped
+    in these stages.
+
+    Args:
+        neighbors (VectorNeighborhoods): the neighbors experiment
+        annotation (AnnotateVectorNeighborhoods): the annotation experiment
+        scoring (LDScoring): the scoring experiment
+        workers (int): the number of threads for neighbor extraction and
+            scoring
+        concurrency (dict): the maximum numbers of simultaneous tasks by
+            stage ("neighbors" and "scoring"). The annotation always
+            processes one embedding at a time, and if it uses several
+            processes, no other tasks run at the same time.
+
+    Returns:
+        (Scheduler): the scheduler, to be started with :meth:`Scheduler.run`
+    """
+    scheduler = Scheduler(workers=workers, concurrency=concurrency)
+    scheduler.concurrency["annotation"] = 1
+    # the annotation in several processes forks its workers
+    exclusive = annotation.metadata["multiprocessing"] > 1
+
+    neighbors._start_experiment() #pylint: disable=protected-access
+    for embedding in neighbors.embeddings or []:
+        scheduler.add_task(
+            "neighbors", embedding, _process_with_lock(
+                neighbors, embedding, scheduler.get_lock("neighbors")))
+
+    annotation._start_experiment() #pylint: disable=protected-access
+    for embedding in annotation.embeddings or []:
+        scheduler.add_task(
+            "annotation", embedding, _process_with_lock(
+                annotation, embedding, scheduler.get_lock("annotation")),
+            dependencies=[("neighbors", embedding)], main_thread=True,
+            exclusive=exclusive)
+
+    finished = os.path.isfile(os.path.join(scoring.output_dir,
+                                           "ld_scores.tsv"))
+    if scoring._overwrite or not finished: #pylint: disable=protected-access
+        embeddings = list(scoring.embeddings)
+        for embedding in embeddings:
+            scheduler.add_task(
+                "scoring", embedding, functools.partial(
+                    scoring.score_embedding, embedding),
+                dependencies=[("annotation", embedding)])
+
+        def save_scores():
+            """Saving the scores of all the embeddings."""
+            scoring.save_scores([scheduler.tasks[("scoring", x)].result for x
+                                 in embeddings])
+
+        scheduler.add_task("ld_scores", None, save_scores,
+                           dependencies=[("scoring", x) for x in embeddings])
+    return scheduler
+
+def _process_with_lock(experiment, embedding, lock):
+    """Helper for processing an embedding in an experiment that may be
+    running in several threads."""
+    return functools.partial(experiment.process_embedding, embedding,
+                             lock=lock)
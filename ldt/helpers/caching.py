@@ -0,0 +1,573 @@
+# -*- coding: utf-8 -*-
+"""In-memory caches of ldt lookups, with statistics and size budgets.
+
+Most ldt dictionaries cache the results of their lookups, as the same words
+are queried over and over in the experiments with multiple embeddings. This
+module provides the cache used for that purpose, together with a registry
+of all the caches in the process, which reports for each of them the number
+of hits, misses, entries, evictions and the approximate memory it takes.
+
+Each cache is named after the cached function (e.g.
+*ResourceDict.is_a_word*), and it can be given an eviction budget: the
+maximum number of entries, after which the least recently used ones are
+discarded. The budgets are set with the *cache_budgets* option of the ldt
+config file (a dictionary of cache names or glob patterns with the maximum
+sizes), or at runtime with :func:`set_cache_budget`. The caches without a
+budget are limited by the *cache_size* option.
+
+The :func:`cached` decorator replaces ``functools.lru_cache``: the
+decorated functions have the same *cache_info()* and *cache_clear()*
+methods. Unlike lru_cache, it does not key the cached methods on the
+object itself, but on its *resource identity* (see
+:func:`resource_identity`), so that:
+
+ - the caches do not keep the dictionaries alive;
+ - the equivalent dictionaries (e.g. two WordNet objects with the same
+   settings) share the cached entries;
+ - the copies of a dictionary sent to worker processes find the entries
+   cached before the workers were started.
+
+The entries can also expire after a given number of seconds (the
+*cache_ttl* option of the config file, or the *ttl* argument of
+:func:`cached`), and the caches of the slow web queries are also kept on
+disk if the *persistent_cache* option is on (see
+:mod:`ldt.helpers.persistent_cache`).
+
+Examples:
+    >>> ldt.helpers.caching.set_cache_budget("WordNet.*", 10000)
+    >>> ldt.helpers.caching.cache_report()["ResourceDict.is_a_word"]
+    {'hits': 3016, 'misses': 1203, 'hit_rate': 0.7149, 'entries': 1203,
+    'maxsize': None, 'evictions': 0, 'bytes': 221352}
+
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import inspect
+import fnmatch
+import threading
+import functools
+import collections
+
+from ldt.load_config import config
+from ldt.helpers.persistent_cache import PersistentCache, DEFAULT_FILENAME
+
+#: the statistics of a cache, in the format of functools.lru_cache
+CacheInfo = collections.namedtuple("CacheInfo",
+                                   ["hits", "misses", "maxsize", "currsize"])
+
+_MISSING = object()
+_KWARGS_MARK = object()
+_CONTAINERS = (dict, list, tuple, set, frozenset)
+_TOKEN = "_cache_token"
+
+def resource_identity(obj):
+    """Determining the identity of an ldt object for the purposes of
+    caching.
+
+    The classes whose lookups depend only on their settings define a
+    *cache_identity()* method, which returns a hashable tuple of these
+    settings (it should cover everything that affects the results of the
+    cached methods), or None if the object cannot be identified by its
+    settings. The identity of the other objects is a random token, which is
+    assigned on the first call of a cached method and kept in the object,
+    including its pickled and copied versions.
+
+    Args:
+        obj: the object
+
+    Returns:
+        (tuple): the identity
+    """
+    if isinstance(obj, type):
+        return (obj.__module__, obj.__qualname__)
+    identity = getattr(obj, "cache_identity", None)
+    if identity is not None:
+        identity = identity()
+        if identity is not None:
+            return identity
+    if not hasattr(obj, "__dict__"):
+        return (type(obj).__qualname__, obj)
+    token = obj.__dict__.get(_TOKEN)
+    if token is None:
+        token = obj.__dict__.setdefault(_TOKEN, uuid.uuid4().hex)
+    return (type(obj).__qualname__, token)
+
+def is_stable(obj):
+    """Checking whether the resource identity of an object is the same in
+    different runs (i.e. whether it is not a random token).
+
+    Args:
+        obj: the object
+
+    Returns:
+        (bool): True if the object defines its identity
+    """
+    if isinstance(obj, type):
+        return True
+    identity = getattr(obj, "cache_identity", None)
+    return identity is not None and identity() is not None
+
+def make_key(args, kwargs):
+    """Building a hashable cache key from the arguments of a call.
+
+    Args:
+        args (tuple): the positional arguments
+        kwargs (dict): the keyword arguments
+
+    Returns:
+        (tuple): the key
+    """
+    if kwargs:
+        return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    return args
+
+def estimate_size(obj, sample_size=100, seed=0):
+    """Estimating the memory taken by an object in bytes.
+
+    Unlike :func:`~ldt.helpers.loading.get_object_size`, this function does
+    not walk the whole object: for the containers with more than
+    *sample_size* items, only a random sample of items is measured, and the
+    result is extrapolated. Objects other than the builtin containers are
+    counted by their own size only, since they are usually shared with the
+    rest of the program (e.g. WordNet synsets or ldt dictionaries).
+
+    Args:
+        obj: the object to measure
+        sample_size (int): the maximum number of items measured in each
+            container
+        seed (int): the random seed for sampling
+
+    Returns:
+        (int): the approximate size of the object in bytes
+    """
+    return int(_estimate(obj, sample_size, random.Random(seed), set()))
+
+def _estimate(obj, sample_size, rng, seen):
+    """Helper for the recursive size estimation."""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if not isinstance(obj, _CONTAINERS) or not obj:
+        return size
+    items = list(obj.items()) if isinstance(obj, dict) else list(obj)
+    sample = items
+    if len(items) > sample_size:
+        sample = rng.sample(items, sample_size)
+    measured = sum(_estimate(item, sample_size, rng, seen)
+                   for item in sample)
+    return size + measured * len(items) / len(sample)
+
+class LRUCache(object):
+    """A thread-safe cache that discards the least recently used entries
+    when it exceeds its maximum size, and keeps statistics of its use."""
+
+    def __init__(self, name, maxsize=None, ttl=None):
+        """Initializing the cache.
+
+        Args:
+            name (str): the name of the cache in the registry
+            maxsize (int): the maximum number of entries. If None, the
+                cache is unbounded, and if 0, nothing is cached.
+            ttl (float): the number of seconds after which the entries
+                expire, or None if they do not
+
+        """
+        #: (str): the name of the cache
+        self.name = name
+        #: (int): the maximum number of entries
+        self.maxsize = maxsize
+        #: (float): the lifetime of the entries in seconds
+        self.ttl = ttl
+        #: (int): the number of lookups that found a cached value
+        self.hits = 0
+        #: (int): the number of lookups that did not
+        self.misses = 0
+        #: (int): the number of entries discarded to stay within the budget
+        self.evictions = 0
+        #: (int): the number of entries discarded on expiry
+        self.expirations = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=_MISSING):
+        """Looking up a key and counting the hit or miss.
+
+        Args:
+            key: the key
+            default: the value to return if the key is not cached
+
+        Returns:
+            the cached value, or the default
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING and entry[1] is not None and \
+                    entry[1] < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                entry = _MISSING
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        """Caching a value and evicting the oldest entries if the budget is
+        exceeded.
+
+        Args:
+            key: the key
+            value: the value
+
+        Returns:
+            None
+        """
+        if self.maxsize == 0:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        """Helper for discarding the entries over the budget."""
+        if self.maxsize is None:
+            return
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize):
+        """Changing the budget of the cache.
+
+        Args:
+            maxsize (int): the new maximum number of entries, or None
+
+        Returns:
+            None
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("The cache size cannot be negative.")
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        """Discarding all the entries and the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def items(self):
+        """Listing the cached entries.
+
+        Returns:
+            (list): the (key, value) tuples, the least recently used first
+        """
+        with self._lock:
+            return [(key, entry[0]) for key, entry in self._data.items()]
+
+    def info(self):
+        """Summarizing the statistics in the format of functools.lru_cache.
+
+        Returns:
+            (CacheInfo): hits, misses, maxsize and currsize
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize,
+                         len(self._data))
+
+    def stats(self, sample_size=100):
+        """Summarizing the statistics of the cache.
+
+        Args:
+            sample_size (int): the number of entries measured for the
+                memory estimate (see :func:`estimate_size`)
+
+        Returns:
+            (dict): hits, misses, hit rate, entries, maxsize, evictions,
+            expirations and the approximate size in bytes
+        """
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "entries": len(self._data), "maxsize": self.maxsize,
+                "evictions": self.evictions, "expirations": self.expirations,
+                "bytes": estimate_size(self._data, sample_size=sample_size)}
+
+_REGISTRY = {}
+_BUDGETS = {}
+
+def _find_setting(name, settings):
+    """Helper for looking up the setting of a cache by its name, or by the
+    first glob pattern that matches the name."""
+    if name in settings:
+        return settings[name]
+    for pattern in settings:
+        if fnmatch.fnmatchcase(name, pattern):
+            return settings[pattern]
+    return _MISSING
+
+def get_cache_budget(name):
+    """Determining the budget of a cache: the one set with
+    :func:`set_cache_budget`, the one in the *cache_budgets* option of ldt
+    config, or the *cache_size* option. The exact names take precedence over
+    the patterns.
+
+    Args:
+        name (str): the name of the cache
+
+    Returns:
+        (int): the maximum number of entries, or None if it is unbounded
+    """
+    for budgets in [_BUDGETS, config.get("cache_budgets") or {}]:
+        budget = _find_setting(name, budgets)
+        if budget is not _MISSING:
+            return budget
+    return config.get("cache_size")
+
+def get_cache_ttl(name):
+    """Determining the lifetime of the entries of a cache from the
+    *cache_ttl* option of ldt config (a dictionary of cache names or glob
+    patterns with the numbers of seconds).
+
+    Args:
+        name (str): the name of the cache
+
+    Returns:
+        (float): the number of seconds, or None if the entries do not expire
+    """
+    ttl = _find_setting(name, config.get("cache_ttl") or {})
+    return None if ttl is _MISSING else ttl
+
+def set_cache_budget(name, maxsize):
+    """Setting the budget of the caches, including the ones created later.
+
+    Args:
+        name (str): the name of a cache, or a glob pattern for the names
+            (e.g. "WordNet.*")
+        maxsize (int): the maximum number of entries, or None for no limit
+
+    Returns:
+        None
+    """
+    if maxsize is not None and maxsize < 0:
+        raise ValueError("The cache size cannot be negative.")
+    _BUDGETS[name] = maxsize
+    for cache_name, cache in _REGISTRY.items():
+        if fnmatch.fnmatchcase(cache_name, name):
+            cache.resize(get_cache_budget(cache_name))
+
+def register_cache(name, maxsize=_MISSING, ttl=_MISSING):
+    """Creating a cache, or retrieving the registered one with the same
+    name.
+
+    Args:
+        name (str): the name of the cache
+        maxsize (int): the maximum number of entries. If not specified, it
+            is determined by :func:`get_cache_budget`.
+        ttl (float): the lifetime of the entries in seconds. If not
+            specified, it is determined by :func:`get_cache_ttl`.
+
+    Returns:
+        (LRUCache): the cache
+    """
+    if not name in _REGISTRY:
+        if maxsize is _MISSING:
+            maxsize = get_cache_budget(name)
+        if ttl is _MISSING:
+            ttl = get_cache_ttl(name)
+        _REGISTRY[name] = LRUCache(name, maxsize=maxsize, ttl=ttl)
+    return _REGISTRY[name]
+
+def get_cache(name):
+    """Retrieving a registered cache.
+
+    Args:
+        name (str): the name of the cache
+
+    Returns:
+        (LRUCache): the cache, or None if there is no such cache
+    """
+    return _REGISTRY.get(name)
+
+def list_caches():
+    """Listing the names of the registered caches.
+
+    Returns:
+        (list of str): the names, in alphabetical order
+    """
+    return sorted(_REGISTRY)
+
+def clear_caches(pattern="*"):
+    """Emptying the registered caches and resetting their statistics.
+
+    Args:
+        pattern (str): a glob pattern for the names of the caches to clear
+
+    Returns:
+        None
+    """
+    for name, cache in _REGISTRY.items():
+        if fnmatch.fnmatchcase(name, pattern):
+            cache.clear()
+
+def cache_report(sample_size=100, used_only=True):
+    """Summarizing the statistics of the registered caches.
+
+    Args:
+        sample_size (int): the number of entries measured in each cache
+            for the memory estimate
+        used_only (bool): if True, the caches that were never queried are
+            not reported
+
+    Returns:
+        (dict): the statistics of each cache (see :meth:`LRUCache.stats`),
+        and their totals under the "total" key
+    """
+    res = {}
+    total = {"hits": 0, "misses": 0, "entries": 0, "evictions": 0,
+             "bytes": 0}
+    for name in list_caches():
+        cache = _REGISTRY[name]
+        if used_only and not cache.hits + cache.misses:
+            continue
+        res[name] = cache.stats(sample_size=sample_size)
+        for key in total:
+            total[key] += res[name][key]
+    lookups = total["hits"] + total["misses"]
+    total["hit_rate"] = round(total["hits"] / lookups, 4) if lookups else None
+    res["total"] = total
+    return res
+
+class _DiskCache(object):
+    """Helper for keeping the entries of a cache on disk, in the persistent
+    cache file of ldt. The file is only opened on the first lookup, if the
+    *persistent_cache* option is on."""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._store = None
+
+    def _connect(self):
+        """Helper for opening the persistent cache (again, if the cache
+        folder was changed in the config)."""
+        if not config.get("persistent_cache", False):
+            return None
+        path = os.path.join(config["path_to_cache"], DEFAULT_FILENAME)
+        if self._store is None or self._store.path != path:
+            self._store = PersistentCache(namespace="cached:" +
+                                          self.cache.name, path=path)
+        return self._store
+
+    @staticmethod
+    def _key(args, kwargs):
+        """Helper for serializing the arguments, or None if they are not
+        JSON-serializable."""
+        try:
+            return json.dumps([list(args), sorted(kwargs.items())])
+        except TypeError:
+            return None
+
+    def get(self, args, kwargs):
+        """Looking up the value for the arguments on disk."""
+        store = self._connect()
+        key = self._key(args, kwargs)
+        if store is None or key is None:
+            return _MISSING
+        entry = store.get(key)
+        if entry is None or (self.cache.ttl and
+                             time.time() - entry["time"] > self.cache.ttl):
+            return _MISSING
+        return entry["value"]
+
+    def set(self, args, kwargs, value):
+        """Saving the value for the arguments on disk, if it is
+        JSON-serializable."""
+        store = self._connect()
+        key = self._key(args, kwargs)
+        if store is None or key is None:
+            return
+        try:
+            store.set(key, {"value": value, "time": time.time()})
+        except TypeError:
+            pass
+
+def _is_method(function):
+    """Helper for determining whether a function is defined as a method."""
+    parameters = list(inspect.signature(function).parameters)
+    return bool(parameters) and parameters[0] == "self"
+
+def cached(name=None, maxsize=_MISSING, ttl=_MISSING, persistent=False,
+           cache_none=True):
+    """Decorator for caching the results of a function or method in a
+    registered :class:`LRUCache`. Like with ``functools.lru_cache``, the
+    arguments have to be hashable, and the decorated function has
+    *cache_info()* and *cache_clear()* methods. The methods are cached by the
+    :func:`resource_identity` of the object rather than the object itself.
+
+    Args:
+        name (str): the name of the cache. By default, the qualified name
+            of the function (e.g. "ResourceDict.is_a_word").
+        maxsize (int): the maximum number of entries. By default, it is
+            determined by :func:`get_cache_budget`.
+        ttl (float): the lifetime of the entries in seconds. By default, it
+            is determined by :func:`get_cache_ttl`.
+        persistent (bool): if True, the JSON-serializable results are also
+            saved to disk when the *persistent_cache* option is on. For
+            methods, this only applies to the objects that define their
+            identity (see :func:`is_stable`), since the random identities
+            of the other objects are not re-used in other runs. Note that
+            the tuples in the results come back from disk as lists.
+        cache_none (bool): if False, the None results are neither cached
+            nor saved, e.g. for the online queries that return None when
+            the resource could not be reached.
+    """
+    def decorator(function):
+        cache = register_cache(name or function.__qualname__, maxsize=maxsize,
+                               ttl=ttl)
+        method = _is_method(function)
+        disk = _DiskCache(cache) if persistent else None
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key_args = args
+            if method and args:
+                key_args = (resource_identity(args[0]),) + args[1:]
+            key = make_key(key_args, kwargs)
+            res = cache.get(key)
+            if res is not _MISSING:
+                return res
+            use_disk = disk is not None and (not method or is_stable(args[0]))
+            if use_disk:
+                res = disk.get(key_args, kwargs)
+                if res is not _MISSING:
+                    cache.set(key, res)
+                    return res
+            res = function(*args, **kwargs)
+            if res is None and not cache_none:
+                return res
+            cache.set(key, res)
+            if use_disk:
+                disk.set(key_args, kwargs, res)
+            return res
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
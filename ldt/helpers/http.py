@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""Shared HTTP client for the online resources.
+
+BabelNet and Wikisaurus are queried through web APIs, one word (or one
+BabelNet id) per request. This module provides the client that they share:
+
+ - the connections are pooled and kept alive between requests;
+ - many urls can be fetched concurrently with a thread pool
+   (:meth:`HTTPClient.fetch_many`), so that the data for a whole wordlist can
+   be prefetched ahead of annotation;
+ - the requests are rate-limited, to stay within the usage policies of the
+   resources;
+ - failed requests (connection errors, timeouts, HTTP 429 and 5xx
+   responses) are retried with exponential backoff. The client errors other
+   than 404 (e.g. an invalid key or an exhausted quota) are raised, so that
+   they are not taken for missing data;
+ - each process has its own client: the worker processes forked for the
+   annotation do not share the pooled connections of the parent.
+
+The number of parallel connections and the maximum number of requests per
+second are set with the *http_workers* and *http_rate_limit* config options.
+The prefetched responses are kept in the caches of
+:mod:`ldt.helpers.caching` (see :func:`prefetch_cache`), so they are
+bounded like the other caches of ldt.
+
+Examples:
+    >>> client = ldt.helpers.http.get_client()
+    >>> data = client.fetch_many(["https://en.wiktionary.org/w/api.php?"
+    "format=json&action=query&titles=" + word for word in ["cat", "dog"]])
+    >>> len(data)
+    2
+
+"""
+
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ldt.load_config import config
+from ldt.helpers.caching import get_cache_budget, register_cache
+
+#: the HTTP status codes which are worth retrying
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+#: the maximum number of prefetched responses kept for each resource, unless
+#: another budget is set for its cache
+PREFETCH_LIMIT = 100000
+
+class RateLimiter(object):
+    """Thread-safe limiter of the number of requests per second."""
+
+    def __init__(self, rate=None):
+        """Initializing the limiter.
+
+        Args:
+            rate (float): the maximum number of requests per second. If None,
+                the requests are not limited.
+
+        """
+        self.rate = rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        """Blocking until the next request is allowed."""
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + 1.0 / self.rate
+        if start > now:
+            time.sleep(start - now)
+
+class HTTPClient(object):
+    """Pooled, rate-limited HTTP client with retries."""
+
+    def __init__(self, max_workers=config.get("http_workers", 8),
+                 rate_limit=config.get("http_rate_limit", None), retries=3,
+                 backoff=0.5, timeout=30):
+        """Initializing the client.
+
+        Args:
+            max_workers (int): the maximum number of concurrent requests
+                (and of the pooled connections per host)
+            rate_limit (float): the maximum number of requests per second
+            retries (int): how many times a failed request is retried
+            backoff (float): the delay before the first retry, in seconds.
+                The delay doubles with every next attempt.
+            timeout (float): the timeout of a request, in seconds
+
+        """
+        if not max_workers or max_workers < 1:
+            raise ValueError("The number of workers should be a positive "
+                             "integer.")
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.limiter = RateLimiter(rate_limit)
+        #: (int): the number of requests sent by this client
+        self.requests = 0
+        #: (int): the id of the process that created the client
+        self.pid = os.getpid()
+
+        self._lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers,
+                              pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _count(self):
+        with self._lock:
+            self.requests += 1
+
+    def get_json(self, url, headers=None):
+        """Retrieving json data from a url.
+
+        Args:
+            url (str): the url to query
+            headers (dict): extra headers of the request
+
+        Returns:
+            the data loaded from the retrieved json, or None if it could not
+            be retrieved
+
+        Raises:
+            requests.exceptions.HTTPError: for the client errors other than
+                404 (e.g. 401 or 403 for an invalid key or an exhausted
+                quota)
+        """
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            self.limiter.wait()
+            self._count()
+            try:
+                response = self.session.get(url, headers=headers,
+                                            timeout=self.timeout)
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout):
+                continue
+            if response.status_code in RETRY_STATUSES:
+                continue
+            if response.status_code == 404:
+                return None
+            if 400 <= response.status_code < 500:
+                response.raise_for_status()
+            if response.status_code != 200:
+                print("The request to", urlsplit(url).netloc, "failed with "
+                      "HTTP status", response.status_code)
+                return None
+            try:
+                return response.json()
+            except ValueError:
+                return None
+        return None
+
+    def fetch_many(self, urls, headers=None):
+        """Retrieving json data from a number of urls concurrently.
+
+        Args:
+            urls (iterable): the urls to query
+            headers (dict): extra headers of the requests
+
+        Returns:
+            (dict): the urls with the retrieved data (None for the failed
+            requests)
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            data = executor.map(lambda url: self.get_json(url, headers),
+                                urls)
+            return dict(zip(urls, data))
+
+    def close(self):
+        """Closing the pooled connections."""
+        self.session.close()
+
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+def _reset_client():
+    """Helper for discarding the client inherited by a forked process (its
+    connections belong to the parent)."""
+    global _CLIENT, _CLIENT_LOCK #pylint: disable=global-statement
+    _CLIENT = None
+    _CLIENT_LOCK = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_client)
+
+def prefetch_cache(name):
+    """Registering the cache for the prefetched responses of a resource.
+    Unlike the other caches, it is bounded by :const:`PREFETCH_LIMIT` if no
+    budget is configured for it, since the prefetched data is only kept
+    until it is looked up.
+
+    Args:
+        name (str): the name of the cache (e.g. "BabelNet.prefetched")
+
+    Returns:
+        (LRUCache): the cache, keyed by url
+    """
+    budget = get_cache_budget(name)
+    return register_cache(name, maxsize=PREFETCH_LIMIT if budget is None else
+                          budget)
+
+def get_client():
+    """Returning the HTTP client shared by all ldt resources (and threads) of
+    the current process.
+
+    Returns:
+        (HTTPClient): the shared client
+    """
+    global _CLIENT #pylint: disable=global-statement
+    with _CLIENT_LOCK:
+        if _CLIENT is None or _CLIENT.pid != os.getpid():
+            _CLIENT = HTTPClient()
+        return _CLIENT
@@ -8,6 +8,7 @@ import ruamel.yaml as yaml
 from hurry.filesize import size
 
 from ldt.helpers.exceptions import ResourceError
+from ldt.helpers.caching import estimate_size
 from ldt.load_config import config
 
 def get_object_size(obj, seen=None):
@@ -225,7 +226,7 @@ def load_resource(path, format="infer", lowercasing=config["lowercasing"],
 
     if res:
         if not silent:
-            print(path, " loaded as ", size(get_object_size(res)))
+            print(path, " loaded as ~", size(estimate_size(res)))
         return res
 
 
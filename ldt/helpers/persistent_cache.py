@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""Persistent cache for expensive lookups.
+
+Some ldt resources (spellcheckers, derivational analysis, web queries) are
+expensive to query, and the same words are looked up in every experiment.
+This module provides a simple key-value store that keeps such results on
+disk between runs. It is based on SQLite, so it can be shared by
+the worker processes of multiprocessing experiments: each process opens
+its own connection to the same file.
+
+The values are stored as JSON, so only JSON-serializable values (strings,
+numbers, booleans, None, lists and dictionaries) can be cached. Tuples come
+back as lists.
+
+The cache files are created in the cache subfolder of the LDT resources
+directory, unless another path is specified.
+
+Examples:
+    >>> cache = ldt.helpers.persistent_cache.PersistentCache(namespace="test")
+    >>> cache.set("cat", ["noun"])
+    >>> cache.get("cat")
+    ['noun']
+    >>> "dog" in cache
+    False
+
+"""
+
+import os
+import json
+import sqlite3
+
+from ldt.load_config import config
+
+#: the default file for persistent cache
+DEFAULT_FILENAME = "persistent_cache.sqlite"
+
+_MISSING = object()
+
+class PersistentCache(object):
+    """A SQLite-backed persistent key-value store. Values of different
+    resources are kept apart by namespaces."""
+
+    def __init__(self, namespace="default", path=None):
+        """Initializing the cache.
+
+        Args:
+            namespace (str): the namespace of the cached values. It should
+                identify the resource and its settings, so that e.g. the
+                results of spellcheckers for different languages are not
+                mixed up.
+            path (str): the path to the SQLite file. If not specified, the
+                *persistent_cache.sqlite* file in the cache subfolder of the
+                ldt resources folder is used.
+
+        """
+        if not path:
+            path = os.path.join(config["path_to_cache"], DEFAULT_FILENAME)
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        #: (str): the path to the cache file
+        self.path = path
+        #: (str): the namespace of the cached values
+        self.namespace = namespace
+
+        self._connection = None
+        self._pid = None
+        self._connect()
+
+    def _connect(self):
+        """Helper for (re-)connecting to the database file. SQLite
+        connections cannot be shared by processes, so the connection is
+        re-opened if the object was copied to a forked worker process."""
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+        connection = sqlite3.connect(self.path, timeout=60,
+                                     isolation_level=None,
+                                     check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS cache (namespace "
+                           "TEXT, key TEXT, value TEXT, PRIMARY KEY "
+                           "(namespace, key))")
+        self._connection = connection
+        self._pid = os.getpid()
+        return connection
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_pid"] = None
+        return state
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key, default=None):
+        """Retrieving a cached value.
+
+        Args:
+            key (str): the key to look up
+            default: the value to return if the key is not in the cache
+
+        Returns:
+            the cached value, or the default
+        """
+        row = self._connect().execute(
+            "SELECT value FROM cache WHERE namespace=? AND key=?",
+            (self.namespace, key)).fetchone()
+        if row is None:
+            return default
+        return json.loads(row[0])
+
+    def get_many(self, keys):
+        """Retrieving the cached values for a number of keys at once.
+
+        Args:
+            keys (iterable): the keys to look up
+
+        Returns:
+            (dict): the keys found in the cache with their values
+        """
+        res = {}
+        keys = list(keys)
+        connection = self._connect()
+        # staying below the default SQLite limit for query variables
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i+500]
+            query = "SELECT key, value FROM cache WHERE namespace=? AND key " \
+                    "IN (" + ",".join(["?"]*len(chunk)) + ")"
+            for key, value in connection.execute(query,
+                                                 [self.namespace] + chunk):
+                res[key] = json.loads(value)
+        return res
+
+    def set(self, key, value):
+        """Saving a value to the cache.
+
+        Args:
+            key (str): the key
+            value: a JSON-serializable value
+
+        Returns:
+            None
+        """
+        self._connect().execute(
+            "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+            (self.namespace, key, json.dumps(value)))
+
+    def set_many(self, values):
+        """Saving a number of values to the cache in one transaction.
+
+        Args:
+            values (dict): the keys with their JSON-serializable values
+
+        Returns:
+            None
+        """
+        connection = self._connect()
+        connection.execute("BEGIN")
+        try:
+            connection.executemany(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                [(self.namespace, key, json.dumps(value)) for key, value in
+                 values.items()])
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def clear(self):
+        """Removing all the values in the namespace of this cache."""
+        self._connect().execute("DELETE FROM cache WHERE namespace=?",
+                                (self.namespace,))
+
+    def __len__(self):
+        return self._connect().execute(
+            "SELECT COUNT(*) FROM cache WHERE namespace=?",
+            (self.namespace,)).fetchone()[0]
+
+    def close(self):
+        """Closing the connection to the cache file."""
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._pid = None
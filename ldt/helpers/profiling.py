@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""Profiling the annotation of word pairs.
+
+The annotation of a word pair goes through many components (normalization,
+derivational analysis, lexicographic relations, ontology paths,
+associations), and most of them dispatch the queries to several resources
+(WordNet, Wiktionary, BabelNet, custom rules). This module provides the
+instrumentation that shows where the time goes: for each component, and
+for each resource within a component, the profiler records the number of
+calls, the cumulative wall time, the number of timeouts and the number of
+calls that were served from the in-memory caches.
+
+The profiling is disabled by default, and the instrumented methods then
+cost one attribute lookup more than before. It is enabled for annotation
+experiments with the *profiling* option of
+:class:`~ldt.experiments.annotate.AnnotateVectorNeighborhoods`, which saves
+the summary in the metadata of the experiment. Worker processes record
+their own statistics, which are sent back to the main process and merged.
+
+Note:
+
+    The time of the nested components is also included in the time of the
+    components that call them (e.g. the time of WordNet lookups is also a
+    part of the time of :meth:`ldt.relations.word.Word.analyze`).
+
+Examples:
+    >>> profiler = ldt.helpers.profiling.get_profiler()
+    >>> profiler.enable()
+    >>> ldt.relations.RelationsInPair().analyze("black", "white")
+    >>> profiler.summary()["MetaDictionary.get_relations"]["wordnet"]
+    {'calls': 2, 'seconds': 0.0132, 'timeouts': 0, 'cache_hits': 0}
+
+"""
+
+import time
+import functools
+
+import timeout_decorator
+
+#: the exceptions counted as timeouts
+_TIMEOUTS = (timeout_decorator.timeout_decorator.TimeoutError, TimeoutError)
+
+#: the name under which the calls of a whole component are recorded
+TOTAL = "total"
+
+_FIELDS = ("calls", "seconds", "timeouts", "cache_hits")
+
+def _find_cache(function):
+    """Helper for locating the cache statistics of an lru-cached function,
+    possibly wrapped in other decorators."""
+    while function is not None:
+        if hasattr(function, "cache_info"):
+            return function.cache_info
+        function = getattr(function, "__wrapped__", None)
+    return None
+
+class Profiler(object):
+    """The collector of call statistics per component and resource."""
+
+    def __init__(self):
+        #: (bool): whether the statistics are being collected
+        self.enabled = False
+        #: (dict): the statistics by (component, resource) keys, as lists
+        #: of calls, seconds, timeouts and cache hits
+        self.stats = {}
+
+    def enable(self):
+        """Starting the collection of statistics."""
+        self.enabled = True
+
+    def disable(self):
+        """Stopping the collection of statistics."""
+        self.enabled = False
+
+    def reset(self):
+        """Discarding the collected statistics."""
+        self.stats = {}
+
+    def _entry(self, component, resource):
+        """Helper for retrieving the counters of a component and resource."""
+        key = (component, resource or TOTAL)
+        if not key in self.stats:
+            self.stats[key] = [0, 0.0, 0, 0]
+        return self.stats[key]
+
+    def call(self, component, resource, function, *args, **kwargs):
+        """Calling a function and recording the call.
+
+        Args:
+            component (str): the name of the component
+            resource (str): the name of the resource, or None if the call
+                is recorded for the whole component
+            function (callable): the function to call. If it is
+                lru-cached, the calls that hit the cache are counted.
+            args, kwargs: the arguments of the function
+
+        Returns:
+            the output of the function
+        """
+        if not self.enabled:
+            return function(*args, **kwargs)
+        entry = self._entry(component, resource)
+        cache_info = _find_cache(function)
+        hits = cache_info().hits if cache_info else 0
+        entry[0] += 1
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except _TIMEOUTS:
+            entry[2] += 1
+            raise
+        finally:
+            entry[1] += time.perf_counter() - start
+            if cache_info and cache_info().hits > hits:
+                entry[3] += 1
+
+    def record_hit(self, component, resource=None):
+        """Counting a recorded call as a cache hit, for the caches other than
+        lru_cache (e.g. the pre-computed data of the dictionaries)."""
+        if self.enabled:
+            self._entry(component, resource)[3] += 1
+
+    def snapshot(self):
+        """Copying the current statistics.
+
+        Returns:
+            (dict): the statistics, to be passed to :meth:`since`
+        """
+        return {key: list(value) for key, value in self.stats.items()}
+
+    def since(self, snapshot):
+        """Computing the statistics collected since a snapshot.
+
+        Args:
+            snapshot (dict): the output of :meth:`snapshot`
+
+        Returns:
+            (dict): the differences of the counters that changed
+        """
+        res = {}
+        for key, value in self.stats.items():
+            old = snapshot.get(key, [0, 0.0, 0, 0])
+            if value[0] != old[0]:
+                res[key] = [x - y for x, y in zip(value, old)]
+        return res
+
+    def merge(self, stats):
+        """Adding the statistics collected elsewhere (e.g. in a worker
+        process).
+
+        Args:
+            stats (dict): the statistics in the format of :attr:`stats`
+
+        Returns:
+            None
+        """
+        for key, value in stats.items():
+            entry = self._entry(*key)
+            for i, counter in enumerate(value):
+                entry[i] += counter
+
+    def summary(self):
+        """Formatting the statistics for the experiment metadata.
+
+        Returns:
+            (dict): the counters of each component (the slowest first), by
+            resource
+        """
+        res = {}
+        components = {}
+        for (component, resource), value in self.stats.items():
+            components.setdefault(component, {})[resource] = \
+                dict(zip(_FIELDS, value))
+        for component in sorted(components, key=lambda x: -max(
+                y["seconds"] for y in components[x].values())):
+            res[component] = {}
+            for resource in sorted(components[component]):
+                counters = components[component][resource]
+                counters["seconds"] = round(counters["seconds"], 4)
+                res[component][resource] = counters
+        return res
+
+_PROFILER = Profiler()
+
+def get_profiler():
+    """Returning the profiler shared by all the instrumented components of
+    ldt in this process.
+
+    Returns:
+        (Profiler): the profiler
+    """
+    return _PROFILER
+
+def profiled(component, resource=None):
+    """Decorator for recording the calls of a function or method with the
+    shared profiler. It can be applied on top of lru_cache, and the cache
+    methods remain available.
+
+    Args:
+        component (str): the name of the component
+        resource (str): the name of the resource, if any
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _PROFILER.enabled:
+                return function(*args, **kwargs)
+            return _PROFILER.call(component, resource, function, *args,
+                                  **kwargs)
+        if hasattr(function, "cache_info"):
+            wrapper.cache_info = function.cache_info
+            wrapper.cache_clear = function.cache_clear
+        return wrapper
+    return decorator
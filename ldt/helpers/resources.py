@@ -11,12 +11,16 @@ Todo:
 """
 
 import os
+import functools
 
 from nltk.corpus import stopwords
-from ldt.load_config import config
+from ldt.load_config import config, nltk_download
 from ldt.helpers.exceptions import LanguageError
 from ldt.helpers.loading import load_resource
 
+#: the table of the supported languages and their 2-letter codes
+LANGUAGE_CODES_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                   "generic_files", "language_codes.yaml")
 
 def lookup_language_by_code(language, reverse=False):
     """
@@ -35,7 +39,8 @@ def lookup_language_by_code(language, reverse=False):
         language (str): the canonical name of the language, or a `2-letter
         language code <https://en.wiktionary.org/wiki/Wiktionary
         :List_of_languages#Two-letter_codes>`_
-        reverse (bool): if True, returns the language code for the language
+        reverse (bool): if True, returns the language code for the language.
+            If the input is already a language code, it is returned as is.
 
     Returns:
         (str): the canonical name of that language or its 2-letter code
@@ -43,28 +48,35 @@ def lookup_language_by_code(language, reverse=False):
     Raises:
         LanguageError: the language was not found
     """
-    # lang_dict = ldt.helpers.loading.load_resource(path=os.path.join(
-    #     config["path_to_resources"], "language_codes.yaml"), lowercasing=False,
-    #     format="yaml")
-    file_path = os.path.join(os.path.dirname(os.path.realpath(__file__)),
-                             "generic_files/language_codes.yaml")
-    lang_dict = load_resource(file_path, lowercasing=False, format="yaml",
-                              silent=True)
-    error_message = language + ": no such language was found. If it is " \
-                               "supposed to be supported, check the " \
-                               "definition in the file " + file_path
+    codes, names = _language_codes()
     if not reverse:
-        try:
-            return lang_dict[language]
-        except KeyError:
-            raise LanguageError(error_message)
+        if language in codes:
+            return codes[language]
     else:
-        if not language[0].isupper():
+        # the fast path for the codes that are already normalized
+        if language in codes:
+            return language
+        if not language[:1].isupper():
             language = language.capitalize()
-        for k in lang_dict.keys():
-            if lang_dict[k] == language:
-                return k
-        raise LanguageError(error_message)
+        if language in names:
+            return names[language]
+    raise LanguageError(language + ": no such language was found. If it is "
+                                   "supposed to be supported, check the "
+                                   "definition in the file " +
+                        LANGUAGE_CODES_PATH)
+
+@functools.lru_cache(maxsize=None)
+def _language_codes():
+    """Helper for :func:`lookup_language_by_code`: loading the table of
+    language codes once, as the forward (code to name) and reverse (name to
+    code) dictionaries."""
+    lang_dict = load_resource(LANGUAGE_CODES_PATH, lowercasing=False,
+                              format="yaml", silent=True)
+    forward = dict(lang_dict)
+    reverse = {}
+    for code, name in forward.items():
+        reverse.setdefault(name, code)
+    return forward, reverse
 
 def load_stopwords(language):
 
@@ -81,6 +93,7 @@ def load_stopwords(language):
         (frozenset): the set of stopwords
     """
 
+    nltk_download()
     if len(language) == 2:
         language = lookup_language_by_code(language).lower()
     try:
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""Read-only resources shared by worker processes.
+
+The lookup resources of ldt (names, numbers, associations, google
+dependencies, corpus cooccurrence and frequency data, the cached lists of
+Wiktionary titles) are loaded as Python sets and dictionaries, and every
+worker process of a multiprocessing experiment would end up with its own
+copy of them. This module provides an alternative: each resource is
+converted once to a compact file, which is then memory-mapped by every
+process that needs it. The operating system keeps only one copy of the
+mapped pages in memory, no matter how many workers use them.
+
+In the compact files, the keys are sorted and looked up with binary search.
+The values of dictionary resources are stored as JSON and decoded on
+access. Set values come back as frozensets.
+
+The compact files are kept in the *shared* subfolder of the cache folder
+in ldt resources directory, and they are rebuilt automatically if the
+source file changes.
+
+Examples:
+    >>> registry = ldt.helpers.shared_resources.get_registry()
+    >>> names = registry.get("names.vocab", lambda: ldt.load_resource(
+    "names.vocab"))
+    >>> "Alice" in names
+    True
+
+"""
+
+import os
+import json
+import mmap
+import struct
+import hashlib
+import tempfile
+
+from ldt.load_config import config
+
+_MAGIC = b"LDTR"
+_HEADER = struct.Struct("<4sccxxQ")
+_OFFSET = struct.Struct("<Q")
+
+def _encode_value(value):
+    """Helper for encoding the values of dictionary resources."""
+    if isinstance(value, (set, frozenset)):
+        return b"s" + json.dumps(sorted(value)).encode("utf-8")
+    return b"j" + json.dumps(value).encode("utf-8")
+
+def _decode_value(value):
+    """Helper for decoding the values of dictionary resources."""
+    if value[:1] == b"s":
+        return frozenset(json.loads(value[1:].decode("utf-8")))
+    return json.loads(value[1:].decode("utf-8"))
+
+def _pack(items):
+    """Helper for packing a list of byte strings as an offset table
+    followed by the concatenated strings."""
+    offsets = [0]
+    for item in items:
+        offsets.append(offsets[-1] + len(item))
+    return b"".join(_OFFSET.pack(offset) for offset in offsets) + \
+           b"".join(items)
+
+def write_compact(data, path):
+    """Saving a set or a dictionary resource as a compact file.
+
+    The file is written to a temporary location first and then moved into
+    place, so that other processes never see a partially written file.
+
+    Args:
+        data (set or dict): the resource. The keys are converted to strings.
+        path (str): the path to the compact file
+
+    Returns:
+        None
+    """
+    is_dict = isinstance(data, dict)
+    keys = sorted(str(key).encode("utf-8") for key in data)
+    if is_dict:
+        str_data = {str(key): value for key, value in data.items()}
+        values = [_encode_value(str_data[key.decode("utf-8")]) for key in keys]
+    kind = b"d" if is_dict else b"s"
+    directory = os.path.dirname(path)
+    handle, tmp_path = tempfile.mkstemp(dir=directory or None)
+    try:
+        with os.fdopen(handle, "wb") as stream:
+            stream.write(_HEADER.pack(_MAGIC, b"1", kind, len(keys)))
+            stream.write(_pack(keys))
+            if is_dict:
+                stream.write(_pack(values))
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+class _Section(object):
+    """A memory-mapped table of byte strings."""
+
+    def __init__(self, buffer, start, length):
+        self._buffer = buffer
+        self._offsets = start
+        self._data = start + (length + 1) * _OFFSET.size
+        self.length = length
+        self.end = self._data + self._offset(length)
+
+    def _offset(self, i):
+        return _OFFSET.unpack_from(self._buffer, self._offsets +
+                                   i * _OFFSET.size)[0]
+
+    def __getitem__(self, i):
+        return self._buffer[self._data + self._offset(i):
+                            self._data + self._offset(i + 1)]
+
+class SharedVocabulary(object):
+    """A read-only, memory-mapped set of strings."""
+
+    def __init__(self, path):
+        """Opening a compact file.
+
+        Args:
+            path (str): the path to a file created with :func:`write_compact`
+
+        """
+        #: (str): the path to the compact file
+        self.path = path
+        with open(path, "rb") as stream:
+            self._buffer = mmap.mmap(stream.fileno(), 0,
+                                     access=mmap.ACCESS_READ)
+        magic, _, kind, length = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC:
+            raise ValueError(path + " is not a compact ldt resource file.")
+        self._kind = kind
+        self._keys = _Section(self._buffer, _HEADER.size, length)
+
+    def _find(self, key):
+        """Helper for the binary search of a key. Returns the index of the
+        key, or -1 if it is not found."""
+        if not isinstance(key, str):
+            return -1
+        key = key.encode("utf-8")
+        low, high = 0, self._keys.length
+        while low < high:
+            middle = (low + high) // 2
+            if self._keys[middle] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._keys.length and self._keys[low] == key:
+            return low
+        return -1
+
+    def __contains__(self, key):
+        return self._find(key) != -1
+
+    def __len__(self):
+        return self._keys.length
+
+    def __iter__(self):
+        for i in range(self._keys.length):
+            yield self._keys[i].decode("utf-8")
+
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
+
+class SharedDictionary(SharedVocabulary):
+    """A read-only, memory-mapped dictionary with string keys and
+    JSON-serializable values."""
+
+    def __init__(self, path):
+        super(SharedDictionary, self).__init__(path)
+        if self._kind != b"d":
+            raise ValueError(path + " does not contain a dictionary.")
+        self._values = _Section(self._buffer, self._keys.end,
+                                self._keys.length)
+
+    def __getitem__(self, key):
+        i = self._find(key)
+        if i == -1:
+            raise KeyError(key)
+        return _decode_value(self._values[i])
+
+    def get(self, key, default=None):
+        """Retrieving the value of a key, or the default if it is missing."""
+        i = self._find(key)
+        if i == -1:
+            return default
+        return _decode_value(self._values[i])
+
+    def keys(self):
+        """Iterating over the keys."""
+        return iter(self)
+
+    def items(self):
+        """Iterating over the (key, value) pairs."""
+        for i in range(self._keys.length):
+            yield self._keys[i].decode("utf-8"), \
+                  _decode_value(self._values[i])
+
+def open_compact(path):
+    """Opening a compact file as a read-only set or dictionary view.
+
+    Args:
+        path (str): the path to a file created with :func:`write_compact`
+
+    Returns:
+        (SharedVocabulary or SharedDictionary): the view of the resource
+    """
+    view = SharedVocabulary(path)
+    if view._kind == b"d": #pylint: disable=protected-access
+        return SharedDictionary(path)
+    return view
+
+class ResourceRegistry(object):
+    """The registry of compact resource files. Each resource is converted
+    once, and every process gets a read-only view of the same file."""
+
+    def __init__(self, path=None):
+        """Initializing the registry.
+
+        Args:
+            path (str): the folder for the compact files. If not specified,
+                the *shared* subfolder of the ldt cache folder is used.
+
+        """
+        if not path:
+            path = os.path.join(config["path_to_cache"], "shared")
+        if not os.path.exists(path):
+            os.makedirs(path)
+        #: (str): the folder with the compact files
+        self.path = path
+        self._views = {}
+
+    def _filename(self, source, options):
+        """Helper for naming the compact file of a resource: the name
+        depends on the source file, its size and modification time, and the
+        loading options."""
+        stat = os.stat(source)
+        key = json.dumps([os.path.abspath(source), stat.st_size,
+                          stat.st_mtime, sorted(options.items())])
+        digest = hashlib.md5(key.encode("utf-8")).hexdigest()
+        name = os.path.basename(source).split(".")[0]
+        return os.path.join(self.path, name + "_" + digest + ".ldtr")
+
+    def get(self, source, loader, **options):
+        """Retrieving the shared view of a resource.
+
+        Args:
+            source (str): the path to the source file of the resource
+            loader (callable): the function returning the resource as a set
+                or a dictionary. It is only called if the compact file does
+                not exist yet.
+            options: any loading options that affect the contents of the
+                resource (e.g. lowercasing); they must be JSON-serializable
+
+        Returns:
+            (SharedVocabulary or SharedDictionary): a read-only view of the
+            resource
+        """
+        path = self._filename(source, options)
+        if path in self._views:
+            return self._views[path]
+        if not os.path.isfile(path):
+            data = loader()
+            if data is None:
+                return None
+            write_compact(data, path)
+        view = open_compact(path)
+        self._views[path] = view
+        return view
+
+_REGISTRY = None
+
+def get_registry():
+    """Returning the resource registry shared by all ldt resources. If
+    the resources are loaded before the worker processes are forked, the
+    workers inherit the open views.
+
+    Returns:
+        (ResourceRegistry): the shared registry
+    """
+    global _REGISTRY #pylint: disable=global-statement
+    if _REGISTRY is None:
+        _REGISTRY = ResourceRegistry()
+    return _REGISTRY
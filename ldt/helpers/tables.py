@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""Saving and loading the data tables of ldt experiments.
+
+The stages of an ldt experiment (vector neighborhoods, their annotation
+and the ld scores analysis) pass their data to each other as tables, one
+file per embedding model. Two formats are supported:
+
+ - *tsv*: the tab-separated text files, human-readable and compatible with
+   any spreadsheet software. This is the default;
+ - *parquet*: compressed columnar files, in which the columns with
+   repetitive values (targets and neighbors) are dictionary-encoded, and the
+   dtypes are preserved. Reading only some of the columns is much cheaper
+   than for a tsv file, which has to be parsed in full.
+
+The parquet format requires `pyarrow <https://arrow.apache.org/>`_
+library, which is an optional dependency of ldt (``pip install
+ldt[parquet]``). The parquet tables can still be exported as tsv.
+
+The tables are addressed by their path without extension, and the format is
+determined by the extension of the existing file. When a table is saved, its
+file in the other format (left over from a run with a different format) is
+removed, unless it is exported on purpose. If the format of a table is known,
+it should be passed to :func:`find_table`, otherwise the parquet file is
+preferred.
+
+Examples:
+    >>> path = ldt.helpers.tables.write_table(df, "/tmp/neighbors",
+    fmt="parquet")
+    >>> ldt.helpers.tables.read_table(path, columns=["Target", "Neighbor"])
+
+"""
+
+import os
+
+import pandas as pd
+
+#: the supported table formats, in the order of preference for reading
+FORMATS = ("parquet", "tsv")
+
+def check_format(fmt):
+    """Making sure that the table format is supported, and that the
+    libraries it needs are installed.
+
+    Args:
+        fmt (str): "tsv" or "parquet"
+
+    Returns:
+        (str): the format
+    """
+    if not fmt in FORMATS:
+        raise ValueError("The table format "+str(fmt)+" is not supported. "
+                         "Please use one of the following: " +
+                         ", ".join(FORMATS))
+    if fmt == "parquet":
+        _import_pyarrow()
+    return fmt
+
+def _import_pyarrow():
+    """Helper for importing the optional pyarrow library."""
+    try:
+        import pyarrow.parquet #pylint: disable=import-outside-toplevel
+    except ImportError:
+        raise ImportError("The parquet format requires pyarrow library. "
+                          "Please install it (pip install pyarrow), or use "
+                          "the tsv format.")
+    return pyarrow.parquet
+
+def get_format(path):
+    """Determining the format of a table file by its extension."""
+    fmt = os.path.splitext(path)[1].lstrip(".")
+    return check_format(fmt)
+
+def find_table(stem, fmt=None):
+    """Locating the file of a table.
+
+    Args:
+        stem (str): the path to the table without extension
+        fmt (str): the format in which the table was saved. If specified,
+            the files in other formats are ignored; otherwise the formats
+            are tried in the order of :data:`FORMATS`.
+
+    Returns:
+        (str): the path to the table file, or None if it does not exist
+    """
+    formats = FORMATS if fmt is None else [check_format(fmt)]
+    for fmt in formats:
+        path = stem + "." + fmt
+        if os.path.isfile(path):
+            return path
+    return None
+
+def list_tables(directory):
+    """Listing the tables in a directory (one file per table, even if it is
+    saved in both formats).
+
+    Args:
+        directory (str): the directory to list
+
+    Returns:
+        (dict): the table names with the paths to their files
+    """
+    res = {}
+    for fmt in reversed(FORMATS):
+        for filename in sorted(os.listdir(directory)):
+            name, extension = os.path.splitext(filename)
+            if extension == "." + fmt:
+                res[name] = os.path.join(directory, filename)
+    return res
+
+def write_table(input_df, stem, fmt="tsv", export_tsv=False):
+    """Saving a table. Its file in the other format, if any, is removed
+    (unless the tsv copy is exported).
+
+    Args:
+        input_df (pd.DataFrame): the table to save. The index is not saved.
+        stem (str): the path to the table without extension
+        fmt (str): "tsv" or "parquet"
+        export_tsv (bool): if True, a parquet table is also saved as tsv
+
+    Returns:
+        (str): the path to the saved file
+    """
+    check_format(fmt)
+    path = stem + "." + fmt
+    if fmt == "parquet":
+        # pyarrow dictionary-encodes all columns with repetitive values
+        input_df.to_parquet(path, engine="pyarrow", compression="zstd",
+                            index=False)
+    if fmt == "tsv" or export_tsv:
+        input_df.to_csv(stem + ".tsv", index=False, sep="\t", header=True)
+    # a file in another format would be a stale copy of the table
+    for other in FORMATS:
+        if other != fmt and not (other == "tsv" and export_tsv) and \
+                os.path.isfile(stem + "." + other):
+            os.remove(stem + "." + other)
+    return path
+
+def get_columns(path):
+    """Retrieving the column names of a table without loading it.
+
+    Args:
+        path (str): the path to the table file
+
+    Returns:
+        (list): the column names
+    """
+    if get_format(path) == "parquet":
+        return list(_import_pyarrow().read_schema(path).names)
+    return list(pd.read_csv(path, header=0, sep="\t", nrows=0).columns)
+
+def read_table(path, columns=None, dtype=None):
+    """Loading a table.
+
+    Args:
+        path (str): the path to the table file
+        columns (list of str): if specified, only these columns are loaded
+            (the ones missing in the table are skipped)
+        dtype (dict): the dtypes of the columns. For tsv files they are
+            used for parsing, and parquet columns are converted to them.
+
+    Returns:
+        (pd.DataFrame): the table
+    """
+    if columns is not None:
+        available = get_columns(path)
+        columns = [x for x in available if x in columns]
+    if get_format(path) == "parquet":
+        res = pd.read_parquet(path, engine="pyarrow", columns=columns)
+        return _convert(res, dtype)
+    return pd.read_csv(path, header=0, sep="\t", usecols=columns, dtype=dtype)
+
+def read_table_chunks(path, chunksize, columns=None, dtype=None):
+    """Loading a table in chunks of rows, without holding the whole table
+    in memory.
+
+    Args:
+        path (str): the path to the table file
+        chunksize (int): the number of rows in a chunk
+        columns (list of str): if specified, only these columns are loaded
+            (the ones missing in the table are skipped)
+        dtype (dict): the dtypes of the columns
+
+    Yields:
+        (pd.DataFrame): the chunks of the table
+    """
+    if columns is not None:
+        available = get_columns(path)
+        columns = [x for x in available if x in columns]
+    if get_format(path) == "parquet":
+        parquet_file = _import_pyarrow().ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize,
+                                               columns=columns):
+            yield _convert(batch.to_pandas(), dtype)
+    else:
+        for chunk in pd.read_csv(path, header=0, sep="\t", usecols=columns,
+                                 dtype=dtype, chunksize=chunksize):
+            yield chunk
+
+def _convert(input_df, dtype):
+    """Helper for converting the loaded columns to the requested dtypes."""
+    if not dtype:
+        return input_df
+    return input_df.astype({x: dtype[x] for x in dtype if x in
+                            input_df.columns})
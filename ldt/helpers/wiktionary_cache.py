@@ -33,6 +33,7 @@ import gzip
 
 
 from ldt.load_config import config
+from ldt.helpers.shared_resources import get_registry
 from ldt.helpers.loading import load_resource
 
 def find_vocab_file(language, path_to_cache, wikisaurus=False):
@@ -114,7 +115,7 @@ def get_timestamped_vocab_filenames(filename, language=config[
         return res
 
 def update_wiktionary_cache(language=config["default_language"],
-                            path_to_cache=config["path_to_resources"],
+                            path_to_cache=None,
                             wikisaurus=False):
     ''' The main wiktionary cache updating function.
 
@@ -192,22 +193,28 @@ def update_wiktionary_cache(language=config["default_language"],
 
 def load_wiktionary_cache(language=config["default_language"],
                           lowercasing=config["lowercasing"],
-                          path_to_cache=config["path_to_resources"],
-                          wikisaurus =False, silent=True):
+                          path_to_cache=None,
+                          wikisaurus =False, silent=True,
+                          shared=config.get("shared_resources", False)):
     '''
 
     Args:
         language (str): a `2-letter language code <https://en.wiktionary.org/wiki/Wiktionary:List_of_languages#Two-letter_codes>`_
         lowercasing (bool): if not set, the global config variable is used.
             True (default) lowercases all vocab.
-        path_to_cache (str): the path to ldt resources folder specified in
-            config. The cache files are saved in "cache" subfolder.
+        path_to_cache (str): the path to ldt resources folder (by default,
+            the one specified in config). The cache files are saved in
+            "cache" subfolder.
         wikisaurus (bool): if False, Wiktionary entry namespace is cached,
             otherwise Wiktionary thesaurus entries are cached.
+        shared (bool): if True, the vocab list is memory-mapped from a
+            compact file shared by all processes (see
+            :mod:`ldt.helpers.shared_resources`)
 
     Returns:
         (set): vocab list for the corresponding language, lowercased or not
-            according to the global or local lowercasing option
+            according to the global or local lowercasing option (a
+            read-only set-like view if *shared* is True)
 
     Todo:
         update the error message
@@ -232,25 +239,31 @@ def load_wiktionary_cache(language=config["default_language"],
 
     path = os.path.join(path_to_cache, filename)
 
-    if not lowercasing:
-        wiktionary_cache = load_resource(path=path, format="vocab",
-                                         lowercasing=False)
-    else:
-        wiktionary_cache = load_resource(path=path, format="vocab")
-    return wiktionary_cache
+    def load():
+        """Loading the vocab list from the cache file."""
+        if not lowercasing:
+            return load_resource(path=path, format="vocab", lowercasing=False)
+        return load_resource(path=path, format="vocab")
+
+    if shared:
+        return get_registry().get(path, load, lowercasing=bool(lowercasing))
+    return load()
 
-def get_cache_dir(path_to_cache=config["path_to_resources"]):
+def get_cache_dir(path_to_cache=None):
     """Helper function that formats the path to cache and creates it,
     if necessary.
 
     Args:
         path_to_cache (str): the path to resource directory. If "cache"
-        subfolder does not exist. it will be created.
+        subfolder does not exist. it will be created. If None, the
+        path_to_resources folder of the current config is used.
 
     Returns:
         (str): the path to the cache directory.
 
     """
+    if path_to_cache is None:
+        path_to_cache = config["path_to_resources"]
     if not path_to_cache.endswith("/cache"):
         path_to_cache = os.path.join(path_to_cache, "cache")
     if not os.path.exists(path_to_cache):
@@ -11,27 +11,44 @@ import os
 import warnings
 import sys
 import shutil
+import functools
 import ruamel.yaml as yaml
-import nltk
-import outdated
 
 from ldt.helpers.exceptions import ResourceError
 from ldt._version import __version__
 
 warnings.simplefilter('ignore', yaml.error.UnsafeLoaderWarning)
 
-try:
-    is_outdated, latest_version = outdated.check_outdated('ldt', __version__)
-    if is_outdated:
-        print("You are using ldt v."+__version__+". Upgrade to v."+latest_version,
-              "with \n   pip install --upgrade ldt\nSee what's new: "
-              "https://github.com/annargrs/ldt/blob/master/CHANGES.txt")
-except ValueError:
-    print("This is LDT", __version__, "- an unpublished development version.")
-
+def check_version():
+    """Checking whether a newer version of ldt is available. This requires
+    a network query, so it is not performed at import time: the command-line
+    interface calls it on startup, and it can be called explicitly.
 
+    Returns:
+        (bool): True if the installed version is outdated
+    """
+    import outdated #pylint: disable=import-outside-toplevel
+    try:
+        is_outdated, latest_version = outdated.check_outdated('ldt',
+                                                              __version__)
+        if is_outdated:
+            print("You are using ldt v."+__version__+". Upgrade to v." +
+                  latest_version, "with \n   pip install --upgrade ldt\nSee "
+                  "what's new: "
+                  "https://github.com/annargrs/ldt/blob/master/CHANGES.txt")
+        return is_outdated
+    except ValueError:
+        print("This is LDT", __version__, "- an unpublished development "
+                                          "version.")
+        return False
+
+@functools.lru_cache(maxsize=None)
 def nltk_download():
-    """Downloading the necessary NLTK resources if they are missing."""
+    """Downloading the necessary NLTK resources if they are missing. The
+    check is performed only once per process, on the first use of a
+    resource that relies on NLTK data (see
+    :class:`~ldt.dicts.dictionary.Dictionary`)."""
+    import nltk #pylint: disable=import-outside-toplevel
     try:
         nltk.data.find('tokenizers/punkt')
     except LookupError:
@@ -45,8 +62,6 @@ def nltk_download():
     except LookupError:
         nltk.download('stopwords')
 
-nltk_download()
-
 TESTFILE = os.path.dirname(os.path.realpath(__file__))
 TESTFILE = os.path.join(TESTFILE, "tests/sample_files/.ldt-config.yaml")
 
@@ -14,7 +14,8 @@ class DistributionDict():
     Args:
         language (str): the language of the resource
         corpus (str): the corpus, for which the distributional information is
-            to be retrieved
+            to be retrieved. If None, the corpus specified in the current
+            config is used.
         gdeps (bool): whether to use google dependency resource
             (memory-intensive)
         cooccurrence (bool): whether to use cooccurrence information
@@ -28,11 +29,14 @@ class DistributionDict():
     """
 
     def __init__(self, language=config["default_language"],
-                 corpus=config["corpus"], frequencies=True, gdeps=False,
+                 corpus=None, frequencies=True, gdeps=False,
                  cooccurrence=False, cooccurrence_freq=False, wordlist=None):
 
         super(DistributionDict, self).__init__()
 
+        if corpus is None:
+            corpus = config["corpus"]
+
         #: str: the language of the resource
         self.language = language
 
@@ -75,8 +79,11 @@ class DistributionDict():
 
         if hasattr(self, "gdeps"):
             self.gdeps.data = _filter_by_list(self.gdeps.data, wordlist)
+            # the filtered data no longer matches the file
+            self.gdeps._identity = None #pylint: disable=protected-access
         if hasattr(self, "cooccurrence"):
             self.gdeps.data = _filter_by_list(self.cooccurrence.data, wordlist)
+            self.gdeps._identity = None #pylint: disable=protected-access
 
     def frequency_in_corpus(self, word):
         """Wrapper method for retrieving word frequency.
@@ -12,14 +12,13 @@ Examples:
 
 
 import timeout_decorator
-import functools
 
 from nltk.corpus import wordnet as wn
-from ldt.load_config import config
+from ldt.helpers.caching import cached
 
 
 @timeout_decorator.timeout(10, use_signals=False)
-@functools.lru_cache(maxsize=config["cache_size"])
+@cached()
 def _get_wn_paths(word1, word2):
     """Getting the minimal path similarity between a pair of words in wordnet
     _ontodict.
@@ -54,7 +53,7 @@ def _get_wn_paths(word1, word2):
         shortest = 0
     return shortest
 
-@functools.lru_cache(maxsize=config["cache_size"])
+@cached()
 def get_shortest_path(word1, word2):
     """Wrapper for `:func:_get_wn_paths` that enables the use of timeout
     decorator.
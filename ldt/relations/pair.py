@@ -21,7 +21,6 @@ Todo:
 
 """
 
-import functools
 import timeout_decorator
 
 from ldt.dicts.dictionary import Dictionary
@@ -31,8 +30,15 @@ from ldt.dicts.semantics.metadictionary import MetaDictionary
 from ldt.relations.word import Word
 from ldt.relations.ontology_path.ontodict import OntoDict
 from ldt.load_config import config
+from ldt.helpers.profiling import get_profiler, profiled
 from ldt.dicts.resources import AssociationDictionary
 from ldt.relations.distribution import DistributionDict
+from ldt.helpers.caching import cached, resource_identity
+
+#: the word categories for which dictionaries are not queried
+#: (see :meth:`ldt.relations.word.Word.analyze`)
+_NO_LOOKUP = {"Numbers", "ProperNouns", "Noise", "URLs", "Filenames",
+              "ForeignWords"}
 
 class RelationsInPair(Dictionary):
     """This class implements analyzer for all possible relation types in a word
@@ -114,10 +120,66 @@ class RelationsInPair(Dictionary):
     def is_a_word(self, word):
         raise NotImplementedError
 
+    def cache_identity(self):
+        """The identity of the analyzer for caching (see
+        :func:`ldt.helpers.caching.resource_identity`): the analyzers with
+        the same resources share the analyzed pairs."""
+        return (type(self).__qualname__, self.language, self.lowercasing) + \
+               tuple(resource_identity(x) for x in
+                     [self.OntoDict, self.AssociationDictionary,
+                      self._normalizer, self._derivation_dict, self._lex_dict])
+
+    def prefetch(self, words, n_jobs=1):
+        """Resolving the normalization, derivation and lexicographic
+        relations for a whole wordlist up front, so that the subsequent
+        :meth:`analyze` calls for the pairs of these words are served from
+        memory.
+
+        The words are normalized with
+        :meth:`~ldt.dicts.normalize.Normalization.normalize_many`, and the
+        lemmas (or the original forms of the words without lemmas) are then
+        analyzed with
+        :meth:`~ldt.dicts.derivation.meta.DerivationAnalyzer.analyze_many`,
+        both in *n_jobs* processes. The lexicographic relations of the lemmas
+        are retrieved with
+        :meth:`~ldt.dicts.semantics.metadictionary.MetaDictionary.prefetch`.
+        The resources without batch interfaces are skipped.
+
+        Args:
+            words (iterable): the words to look up
+            n_jobs (int): the number of processes to use
+
+        Returns:
+            (int): the number of unique prefetched words
+        """
+        words = list(dict.fromkeys([str(word) for word in words]))
+        if not hasattr(self._normalizer, "normalize_many"):
+            return 0
+        table = self._normalizer.normalize_many(words, n_jobs=n_jobs)
+        self._normalizer.preload(table)
+
+        to_derive = []
+        lemmas = []
+        for categories, word_lemmas, word in zip(table["Categories"],
+                                                 table["Lemmas"],
+                                                 table["Word"]):
+            if set(categories).intersection(_NO_LOOKUP):
+                continue
+            to_derive += word_lemmas or [word]
+            lemmas += word_lemmas
+
+        if hasattr(self._derivation_dict, "analyze_many"):
+            self._derivation_dict.analyze_many(list(dict.fromkeys(to_derive)),
+                                               n_jobs=n_jobs)
+        if hasattr(self._lex_dict, "prefetch"):
+            self._lex_dict.prefetch(list(dict.fromkeys(lemmas)))
+        return len(words)
+
     # @timeout_decorator.timeout(config["experiments"]["timeout"], use_signals=False)
+    @profiled("RelationsInPair._analyze")
     @timeout_decorator.timeout(config["experiments"]["timeout"],
                                use_signals=True)
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @cached()
     def _analyze(self, target, neighbor, silent=True, distr_data=True):
         """The main function for analyzing the input strings and identifying
         any relations the two words may share.
@@ -155,18 +217,23 @@ class RelationsInPair(Dictionary):
                 res[rel] = True
 
             paths = []
+            profiler = get_profiler()
 
             for target_lemma in target.info["Lemmas"]:
                 for neighbor_lemma in neighbor.info["Lemmas"]:
-                        paths.append(self.OntoDict.get_shortest_path(
-                            target_lemma, neighbor_lemma))
+                        paths.append(profiler.call(
+                            "RelationsInPair._analyze", "ontodict",
+                            self.OntoDict.get_shortest_path, target_lemma,
+                            neighbor_lemma))
             if paths:
                 res["ShortestPath"] = min(paths)
 
             for target_lemma in target.info["Lemmas"]:
                 for neighbor_lemma in neighbor.info["Lemmas"]:
-                    if self.AssociationDictionary.are_related(target_lemma,
-                                                              neighbor_lemma):
+                    if profiler.call("RelationsInPair._analyze",
+                                     "associations",
+                                     self.AssociationDictionary.are_related,
+                                     target_lemma, neighbor_lemma):
                         res["Associations"] = True
                         break
         # if distr_data:
@@ -57,12 +57,12 @@ Todo:
 
 """
 
-import functools
 
 from ldt.dicts.normalize import Normalization as Normalizer
 from ldt.dicts.derivation.meta import DerivationAnalyzer
 from ldt.dicts.semantics.metadictionary import MetaDictionary
-from ldt.load_config import config
+from ldt.helpers.profiling import profiled
+from ldt.helpers.caching import cached
 
 class Word(object):
     """Class that binds together all linguistic information about a word from
@@ -104,7 +104,8 @@ class Word(object):
             self._lex_dict = lex_dict
         self.analyze(self.original_spelling)
 
-    @functools.lru_cache(maxsize=config["cache_size"])
+    @profiled("Word.analyze")
+    @cached()
     def analyze(self, word):
         self.info = {}
         self._normalize()
@@ -119,6 +120,7 @@ class Word(object):
             self._analyze_derivation()
             self._get_lex_relations()
 
+    @profiled("Word.analyze", "normalization")
     def _normalize(self):
         """Bringing in the information from the _normalizer class."""
 
@@ -165,6 +167,7 @@ class Word(object):
                 self.info["POS"] = frozenset()
 
 
+    @profiled("Word.analyze", "derivation")
     def _analyze_derivation(self):
         """Query the morphological metadictionary for the information on
         semantic relations of the target word.
@@ -202,6 +205,7 @@ class Word(object):
                 if not i in self.info:
                     self.info[i] = frozenset()
 
+    @profiled("Word.analyze", "lex_relations")
     def _get_lex_relations(self):
         """Query the lexicographic metadictionary for the information on
         semantic relations of the target word.
@@ -0,0 +1,96 @@
+import unittest
+import os
+import json
+import tempfile
+
+os.environ["TESTING_LDT"] = "TRUE"
+
+from ldt.load_config import config
+from ldt.helpers.loading import load_resource
+from ldt.relations.distribution import DistributionDict
+from ldt.benchmarks.synthetic import make_words, make_benchmark_data
+from ldt.benchmarks.pipeline import run_benchmark, SyntheticAnalyzer, \
+    benchmark_config
+
+class Tests(unittest.TestCase):
+    """
+    The tests in this block inspect the benchmarks on synthetic data.
+    """
+
+    def test_make_words(self):
+        words = make_words(500, seed=1, real_words=["cat", "dog", "cat"])
+        self.assertEqual(len(words), 500)
+        self.assertEqual(len(set(words)), 500)
+        self.assertIn("dog", words)
+        self.assertEqual(words, make_words(500, seed=1,
+                                           real_words=["cat", "dog"]))
+
+    def test_data(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = make_benchmark_data(tmp, vocab_size=200, sample_size=10,
+                                           models=2, dimensions=5,
+                                           real_words=0)
+            self.assertEqual(len(manifest["embeddings"]), 2)
+            with open(os.path.join(manifest["embeddings"][0],
+                                   "vectors.txt")) as stream:
+                lines = stream.readlines()
+            self.assertEqual(len(lines), 200)
+            self.assertEqual(len(lines[0].split()), 6)
+            sample = load_resource(os.path.join(
+                tmp, "experiments", "vocab_samples", "synthetic_sample",
+                "synthetic_sample.vocab"), format="vocab")
+            self.assertEqual(len(sample), 10)
+            frequencies = load_resource(manifest["resources"]["freqdict"],
+                                        format="freqdict")
+            self.assertEqual(len(frequencies), 200)
+
+    def test_data_error(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(ValueError):
+                make_benchmark_data(tmp, vocab_size=10, sample_size=20)
+
+    def test_config(self):
+        path = config["path_to_resources"]
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = make_benchmark_data(tmp, vocab_size=100, sample_size=5,
+                                           models=1, dimensions=5,
+                                           real_words=0)
+            with benchmark_config(manifest):
+                self.assertEqual(config["corpus"], "synthetic")
+                analyzer = SyntheticAnalyzer()
+                word = sorted(analyzer.namedict.data)[0]
+                res = analyzer.analyze(word, word)
+                self.assertTrue(res["ProperNouns"])
+                # the default corpus is read from the config at runtime
+                distr_dict = DistributionDict()
+                self.assertTrue(distr_dict.freqdict.path.startswith(tmp))
+        self.assertEqual(config["path_to_resources"], path)
+
+    def test_pipeline(self):
+        report = run_benchmark(vocab_size=300, sample_size=10, models=2,
+                               dimensions=10, top_n=3,
+                               dictionaries=("names", "associations",
+                                             "freqdict"), profiling=True)
+        json.dumps(report)
+        stages = report["stages"]
+        self.assertEqual(list(stages), ["neighbors", "dictionaries",
+                                        "annotation", "scoring"])
+        for stage in ["neighbors", "annotation", "scoring"]:
+            self.assertEqual(stages[stage]["pairs"], 60)
+            self.assertGreater(stages[stage]["pairs_per_sec"], 0)
+        self.assertEqual(set(stages["dictionaries"]),
+                         {"names", "associations", "freqdict"})
+        caches = stages["dictionaries"]["names"]["caches"]
+        self.assertEqual(caches["total"]["hits"] + caches["total"]["misses"],
+                         120)
+        self.assertIn("ResourceDict.is_a_word",
+                      stages["annotation"]["caches"])
+        self.assertIn("AnnotateVectorNeighborhoods.add_distr_data",
+                      stages["annotation"]["profile"])
+
+    def test_analyzer_error(self):
+        with self.assertRaises(ValueError):
+            run_benchmark(analyzer="online")
+
+if __name__ == '__main__':
+    unittest.main()
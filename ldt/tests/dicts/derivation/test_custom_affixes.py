@@ -52,6 +52,17 @@ class Tests(unittest.TestCase):
         res = test_dict.check_exceptions("bleed")
         self.assertIn("blood", res["roots"])
 
+    @ignore_warnings
+    def test_dict_exceptions_many(self):
+        noise = ldt.dicts.base.wordnet.en.BaseWordNet()
+        morph = ldt.dicts.morphology.wordnet.en.MorphWordNet()
+        test_dict = ldt.dicts.derivation.custom.en.EnglishDerivation(
+            language="en", dictionary=noise, morph_dictionary=morph)
+        res = test_dict.check_exceptions_many(["blood", "bleed", "cat"])
+        worked = "cat" not in res and \
+                 res["bleed"] == test_dict.check_exceptions("bleed")
+        self.assertTrue(worked)
+
     @ignore_warnings
     def test_dict_sion(self):
         noise = ldt.dicts.base.wordnet.en.BaseWordNet()
@@ -154,5 +165,43 @@ class Tests(unittest.TestCase):
         res = test_dict.analyze_affixes("anti-intellectual")
         self.assertIn("intellect", res["roots"])
 
+    @ignore_warnings
+    def test_matching_suffixes(self):
+        noise = ldt.dicts.base.wordnet.en.BaseWordNet()
+        morph = ldt.dicts.morphology.wordnet.en.MorphWordNet()
+        test_dict = ldt.dicts.derivation.custom.en.EnglishDerivation(
+            language="en", dictionary=noise, morph_dictionary=morph)
+        res = test_dict._matching_suffixes("kindness")
+        expected = [x for x in test_dict.suffixes if "kindness".endswith(x)]
+        self.assertEqual(res, expected)
+
+    @ignore_warnings
+    def test_suffixes_matched_once(self):
+        noise = ldt.dicts.base.wordnet.en.BaseWordNet()
+        morph = ldt.dicts.morphology.wordnet.en.MorphWordNet()
+        test_dict = ldt.dicts.derivation.custom.en.EnglishDerivation(
+            language="en", dictionary=noise, morph_dictionary=morph)
+        calls = []
+        matching_suffixes = test_dict._matching_suffixes
+
+        def count(word):
+            calls.append(word)
+            return matching_suffixes(word)
+
+        test_dict._matching_suffixes = count
+        res = test_dict.decompose_suffixes("historic")
+        self.assertIn("history", res["roots"])
+        self.assertEqual(calls, ["historic"])
+
+    @ignore_warnings
+    def test_matching_prefixes(self):
+        noise = ldt.dicts.base.wordnet.en.BaseWordNet()
+        morph = ldt.dicts.morphology.wordnet.en.MorphWordNet()
+        test_dict = ldt.dicts.derivation.custom.en.EnglishDerivation(
+            language="en", dictionary=noise, morph_dictionary=morph)
+        test_dict.prefixes = ["un", "under", "re", "un"]
+        res = test_dict._matching_prefixes("underestimate")
+        self.assertEqual(res, ["un", "under", "un"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -55,6 +55,22 @@ class Tests(unittest.TestCase):
         res = test_dict.split_compound("tomcat", filtering="min_split_3")
         self.assertEqual([['tom', 'cat']], res)
 
+    @ignore_warnings
+    def test_split_compounds_pruning(self, test_dict=test_dict):
+        """Test that pruned splitting yields the same analyses as
+        filtering all of them"""
+        res = test_dict.split_compound("sunflowerhouseboat", filtering=None)
+        filtered = ldt.dicts.derivation.custom.compounds.filter_by_min_length(
+            [i for i in res if i], 4)
+        pruned = test_dict.split_compound("sunflowerhouseboat",
+                                          filtering="min_split_4")
+        self.assertEqual(filtered, pruned)
+
+    @ignore_warnings
+    def test_max_short_subwords(self):
+        max_short = ldt.dicts.derivation.custom.compounds._max_short_subwords
+        self.assertEqual([max_short(30, 3), max_short(31, 3)], [0, 1])
+
     @ignore_warnings
     def test_leave_known_word_alone(self, test_dict=test_dict):
         res = test_dict.decompose_compound("catwalk", split_known_words=False)
@@ -3,6 +3,7 @@
 import unittest
 import time
 import os
+import tempfile
 
 os.environ["TESTING_LDT"] = "TRUE"
 
@@ -55,5 +56,40 @@ class Tests(unittest.TestCase):
     #         "related_words"]
     #     self.assertTrue(worked)
 
+    @ignore_warnings
+    def test_persistent_store(self):
+        path = os.path.join(tempfile.mkdtemp(), "cache.sqlite")
+        test_dict = ldt.dicts.derivation.meta.DerivationAnalyzer(
+            language="en", persistent_cache=path)
+        res = test_dict.analyze("kindness")
+        reloaded = ldt.dicts.derivation.meta.DerivationAnalyzer(
+            language="en", persistent_cache=path)
+        reloaded._analyze = None
+        self.assertEqual(reloaded.analyze("kindness"), res)
+
+    @ignore_warnings
+    def test_analyze_many(self):
+        res = self.test_dict.analyze_many(["kindness", "kindness"])
+        worked = list(res.keys()) == ["kindness"] and \
+                 self.test_dict.analyze("kindness") == res["kindness"]
+        self.test_dict._analyzed = {}
+        self.assertTrue(worked)
+
+    @ignore_warnings
+    def test_analyze_many_order(self):
+        path = os.path.join(tempfile.mkdtemp(), "cache.sqlite")
+        test_dict = ldt.dicts.derivation.meta.DerivationAnalyzer(
+            language="en", persistent_cache=path)
+        test_dict.analyze("kindness")
+        words = ["toothpaste", "kindness", "toothpaste", "rethink"]
+        res = test_dict.analyze_many(words, n_jobs=2)
+        self.assertEqual(list(res.keys()), ["toothpaste", "kindness",
+                                            "rethink"])
+        self.assertIn("tooth", res["toothpaste"]["roots"])
+
+    @ignore_warnings
+    def test_resource_version(self):
+        self.assertEqual(len(self.test_dict.resource_version()), 12)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
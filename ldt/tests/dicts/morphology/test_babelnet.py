@@ -1,5 +1,7 @@
 import unittest
 import os
+import shutil
+import tempfile
 
 os.environ["TESTING_LDT"] = "TRUE"
 
@@ -18,6 +20,20 @@ class Tests(unittest.TestCase):
             test_dict = ldt.dicts.morphology.babelnet.MorphBabelNet(
                 language="english", babelnet_key=None)
 
+    def test_pos_offline(self):
+        tmpdir = tempfile.mkdtemp()
+        store = ldt.dicts.base.babelnet.BabelNetStore(
+            os.path.join(tmpdir, "babelnet.sqlite"))
+        store.add_synset("bn:00015267n", ["cat"], language="EN")
+        store.add_synset("bn:00083181v", ["cat"], language="EN")
+        store.add_synset("bn:00098335a", ["cat"], language="EN")
+        test_dict = ldt.dicts.morphology.babelnet.MorphBabelNet(
+            language="english", babelnet_key=None, babelnet_store=store)
+        res = test_dict.get_pos("cat")
+        store._cache.close()
+        shutil.rmtree(tmpdir)
+        self.assertEqual(res, {"noun": 1, "verb": 1, "adjective": 1})
+
     # def test_dict_initialization(self):
     #     test_dict = ldt.dicts.morphology.babelnet.MorphBabelNet(
     #         language="english")
@@ -39,5 +39,35 @@ class Tests(unittest.TestCase):
         worked = len(res) == 1 and "cat" in res
         self.assertTrue(worked)
 
+    @ignore_warnings
+    def test_build_index(self):
+        test_dict = ldt.dicts.morphology.wordnet.en.MorphWordNet()
+        index = test_dict.build_index(["cats", "mice", "catz"])
+        test_dict.clear_index()
+        self.assertEqual(index["cats"]["lemmas"], ["cat"])
+        # "mice" is found via the exception list
+        self.assertIn("noun", index["mice"]["pos"])
+        self.assertEqual(index["catz"], {"lemmas": [], "pos": {}})
+
+    @ignore_warnings
+    def test_index_matches_wordnet(self):
+        test_dict = ldt.dicts.morphology.wordnet.en.MorphWordNet()
+        words = ["cats", "mice", "ran", "better", "walking", "catz"]
+        index = test_dict.build_index(words)
+        test_dict.clear_index()
+        for word in words:
+            self.assertEqual(sorted(index[word]["lemmas"]),
+                             sorted(test_dict._lemmatize(word)))
+            self.assertEqual(index[word]["pos"], test_dict._get_pos(word))
+
+    @ignore_warnings
+    def test_index_lookup(self):
+        test_dict = ldt.dicts.morphology.wordnet.en.MorphWordNet()
+        pos = test_dict.get_pos("cat")
+        test_dict.build_index(["cat"])
+        res = test_dict.get_pos("cat")
+        test_dict.clear_index()
+        self.assertEqual(pos, res)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
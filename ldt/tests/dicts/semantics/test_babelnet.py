@@ -1,5 +1,8 @@
 import unittest
 import os
+import json
+import shutil
+import tempfile
 
 os.environ["TESTING_LDT"] = "TRUE"
 
@@ -14,6 +17,82 @@ class Tests(unittest.TestCase):
     updated.
     '''
 
+    @classmethod
+    def setUpClass(cls):
+        """Setting up a local BabelNet store for offline tests"""
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.store = ldt.dicts.base.babelnet.BabelNetStore(
+            os.path.join(cls.tmpdir, "babelnet.sqlite"))
+        cls.store.add_synset("bn:00016874n", ["Senator"], language="EN",
+                             edges=[("is-a", "HYPERNYM", "bn:00050695n")])
+        cls.store.add_synset("bn:00050695n", ["legislator", "lawmaker"],
+                             language="EN")
+        cls.test = ldt.dicts.semantics.BabelNet(language="English",
+                                                babelnet_key=None,
+                                                babelnet_store=cls.store)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Cleaning up the local store"""
+        cls.store._cache.close()
+        shutil.rmtree(cls.tmpdir)
+
+    def test_babelnet_offline_ids(self):
+        res = self.test.get_ids("Senator")
+        self.assertEqual(res, ["bn:00016874n"])
+
+    def test_babelnet_offline_is_word(self):
+        self.assertFalse(self.test.is_a_word("catttttt"))
+
+    def test_babelnet_offline_lemmas(self):
+        res = self.test.get_lemmas("bn:00050695n")
+        self.assertEqual(sorted(res), ["lawmaker", "legislator"])
+
+    def test_babelnet_offline_edges(self):
+        res = self.test.get_edges("bn:00016874n")
+        self.assertIn("bn:00050695n", res["hypernyms"])
+
+    def test_babelnet_offline_relations(self):
+        res = self.test.get_relations("Senator", relations=("hypernyms",))
+        self.assertIn("legislator", res["hypernyms"])
+
+    def test_babelnet_import_jsonl(self):
+        path = os.path.join(self.tmpdir, "responses.jsonl")
+        record = {"service": "getSynsetIds",
+                  "params": {"lemma": "kitty", "searchLang": "EN",
+                             "key": "secret"},
+                  "response": [{"id": "bn:00516031n", "pos": "NOUN"}]}
+        with open(path, "w", encoding="utf-8") as jsonl:
+            jsonl.write(json.dumps(record) + "\n")
+        self.assertEqual(self.store.import_jsonl(path), 1)
+        self.assertIn("bn:00516031n", self.test.get_ids("kitty"))
+
+    def test_babelnet_record_requires_store(self):
+        with self.assertRaises(ValueError):
+            ldt.dicts.semantics.BabelNet(babelnet_key="key", record=True)
+
+    def test_babelnet_record_fresh_store(self):
+        store = ldt.dicts.base.babelnet.BabelNetStore(
+            os.path.join(self.tmpdir, "recorded.sqlite"))
+        self.assertEqual(len(store), 0)
+        test = ldt.dicts.semantics.BabelNet(language="English",
+                                            babelnet_key="key",
+                                            babelnet_store=store, record=True)
+        test.query = lambda url: [{"id": "bn:00015267n", "pos": "NOUN"}]
+        self.assertEqual(test.get_ids("cat"), ["bn:00015267n"])
+        self.assertEqual(len(store), 1)
+        store._cache.close()
+
+    def test_babelnet_empty_store(self):
+        store = ldt.dicts.base.babelnet.BabelNetStore(
+            os.path.join(self.tmpdir, "empty.sqlite"))
+        test = ldt.dicts.semantics.BabelNet(language="English",
+                                            babelnet_key=None,
+                                            babelnet_store=store)
+        test.query = None
+        self.assertEqual(test.get_ids("cat"), [])
+        store._cache.close()
+
     # def test_babelnet_initialization(self):
     #     test = ldt.dicts.semantics.BabelNet()
     #     test.language = "Italian"
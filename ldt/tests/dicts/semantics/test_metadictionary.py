@@ -77,5 +77,16 @@ class Tests(unittest.TestCase):
         worked = "unclean" in res and "nonwhite" in res
         self.assertTrue(worked)
 
+    @ignore_warnings
+    def test_metadictionary_prefetch(self):
+        test_dict = ldt.dicts.semantics.metadictionary.MetaDictionary(
+            order=("wordnet",), language="English", cache=False)
+        res = test_dict.prefetch(["cat", "cat", "dog"])
+        self.assertEqual(sorted(res), ["cat", "dog"])
+        res["cat"]["synonyms"].append("dog")
+        res = test_dict.get_relations("cat")
+        self.assertIn("true_cat", res["synonyms"])
+        self.assertNotIn("dog", res["synonyms"])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,9 +1,13 @@
 import unittest
+from unittest import mock
 
 import ldt
 import os
 import time
 
+import requests
+from wiktionaryparser import WiktionaryParser
+
 os.environ["TESTING_LDT"] = "TRUE"
 
 from ldt.helpers.ignore import ignore_warnings
@@ -65,5 +69,34 @@ class Tests(unittest.TestCase):
         res = test_dict.get_relation("white", relation="antonyms")
         self.assertIn("black", res)
 
+    @ignore_warnings
+    def test_query_title_cache(self):
+        page = [{"definitions": []}]
+        ldt.dicts.base.wiktionary.BaseWiktionary._fetch.cache_clear()
+        with mock.patch.object(WiktionaryParser, "fetch",
+                               return_value=page) as fetch:
+            with_titles = ldt.dicts.semantics.Wiktionary(cache=False)
+            with_titles.cache = {"cat"}
+            self.assertIsNone(with_titles.query("dog"))
+            fetch.assert_not_called()
+            # the missing title is not cached for the dictionaries
+            # without the cache of titles
+            test_dict = ldt.dicts.semantics.Wiktionary(cache=False)
+            self.assertEqual(test_dict.query("dog"), page)
+            self.assertEqual(fetch.call_count, 1)
+
+    @ignore_warnings
+    def test_query_failure(self):
+        page = [{"definitions": []}]
+        ldt.dicts.base.wiktionary.BaseWiktionary._fetch.cache_clear()
+        test_dict = ldt.dicts.semantics.Wiktionary(cache=False)
+        with mock.patch.object(
+                WiktionaryParser, "fetch",
+                side_effect=requests.exceptions.ConnectionError):
+            self.assertIsNone(test_dict.query("dog"))
+        with mock.patch.object(WiktionaryParser, "fetch",
+                               return_value=page):
+            self.assertEqual(test_dict.query("dog"), page)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
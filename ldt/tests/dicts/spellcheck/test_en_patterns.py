@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 import unittest
+import os
+import tempfile
 
 import ldt
 
@@ -81,5 +83,21 @@ class Tests(unittest.TestCase):
             worked = False
         self.assertTrue(worked)
 
+    def test_persistent_cache(self):
+        path = os.path.join(tempfile.mkdtemp(), "cache.sqlite")
+        cached_dict = ldt.dicts.spellcheck.en.SpellcheckerEn(
+            persistent_cache=path)
+        res = cached_dict.spelling_nazi("abillity")
+        reloaded = ldt.dicts.spellcheck.en.SpellcheckerEn(
+            persistent_cache=path)
+        reloaded.target = None
+        self.assertEqual(reloaded.spelling_nazi("abillity"), res)
+
+    def test_persistent_cache_namespace(self):
+        path = os.path.join(tempfile.mkdtemp(), "cache.sqlite")
+        cached_dict = ldt.dicts.spellcheck.en.SpellcheckerEn(
+            persistent_cache=path, foreign_languages=("french",))
+        self.assertIn("fr", cached_dict.persistent_cache.namespace)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
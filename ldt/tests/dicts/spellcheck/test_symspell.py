@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import os
+import tempfile
+
+import ldt
+from ldt.dicts.spellcheck.symspell import SymSpell
+
+test_symspell = SymSpell({"grammar": 10, "grammars": 2, "magic": 5,
+                          "arbitrary": 1, "apple": 3, "ample": 7})
+
+
+class Tests(unittest.TestCase):
+    """
+    The tests in this block inspect the symmetric-delete spelling candidate
+    generator and its use as a spellchecker backend.
+
+    """
+
+    def test_missing_letter(self):
+        self.assertEqual(test_symspell.suggest("gramar"), ["grammar"])
+
+    def test_replacement(self):
+        self.assertEqual(test_symspell.suggest("magik"), ["magic"])
+
+    def test_misplaced_letter(self):
+        self.assertEqual(test_symspell.suggest("abritrary"), ["arbitrary"])
+
+    def test_frequency_order(self):
+        self.assertEqual(test_symspell.suggest("aple"), ["ample", "apple"])
+
+    def test_distance(self):
+        self.assertNotIn("grammars", test_symspell.suggest("gramar"))
+
+    def test_backend(self):
+        test_dict = ldt.dicts.spellcheck.en.SpellcheckerEn(
+            backend="symspell", vocabulary=["arbitrary", "ability"])
+        res = test_dict.spelling_nazi("abritrary")
+        self.assertEqual(res, "arbitrary")
+
+    def test_fingerprint(self):
+        self.assertEqual(SymSpell(["magic", "apple"]).fingerprint(),
+                         SymSpell(["apple", "magic"]).fingerprint())
+        self.assertNotEqual(SymSpell(["magic", "apple"]).fingerprint(),
+                            SymSpell(["magic", "ample"]).fingerprint())
+
+    def test_backend_cache_namespace(self):
+        path = os.path.join(tempfile.mkdtemp(), "cache.sqlite")
+        namespaces = []
+        for vocabulary in [["arbitrary", "ability"], ["arbitrary"]]:
+            test_dict = ldt.dicts.spellcheck.en.SpellcheckerEn(
+                backend="symspell", vocabulary=vocabulary,
+                persistent_cache=path)
+            namespaces.append(test_dict.persistent_cache.namespace)
+        self.assertNotEqual(namespaces[0], namespaces[1])
+
+    def test_wordnet_vocabulary(self):
+        vocab = ldt.dicts.spellcheck.en.en.load_wordnet_vocabulary()
+        self.assertIn("cat", vocab)
+        self.assertFalse([word for word in vocab if "_" in word])
+
+    def test_backend_error(self):
+        with self.assertRaises(ValueError):
+            ldt.dicts.spellcheck.en.SpellcheckerEn(backend="hunspell")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -130,5 +130,44 @@ class Tests(unittest.TestCase):
         worked = "known" in res["lemmas"] and "issue" in res["lemmas"]
         self.assertTrue(worked)
 
+    @ignore_warnings
+    def test_normalize_many(self):
+        words = ["cats", "^*&%*2", "cats", "grammar.com"]
+        res = self.test_dict.normalize_many(words)
+        worked = (list(res["Word"]) == ["cats", "^*&%*2", "grammar.com"] and
+                  res["Categories"][1] == ["Noise"] and
+                  res["Categories"][2] == ["URLs"])
+        self.assertTrue(worked)
+
+    @ignore_warnings
+    def test_normalize_many_same_as_normalize(self):
+        res = self.test_dict.normalize_many(["cats"])
+        self.assertEqual(res["Lemmas"][0],
+                         self.test_dict.normalize("cats")["lemmas"])
+
+    @ignore_warnings
+    def test_normalize_many_resources(self):
+        words = ["grammar.com", "cats.jpg", "2,000"]
+        res = self.test_dict.normalize_many(words)
+        self.assertEqual(list(res["Categories"]),
+                         [self.test_dict.normalize(word)["word_categories"]
+                          for word in words])
+
+    @ignore_warnings
+    def test_normalize_many_processes(self):
+        words = ["cats", "grammar.com", "walking", "cat"]
+        res = self.test_dict.normalize_many(words, n_jobs=2)
+        self.assertEqual(list(res["Lemmas"]),
+                         list(self.test_dict.normalize_many(words)["Lemmas"]))
+
+    @ignore_warnings
+    def test_preload(self):
+        table = self.test_dict.normalize_many(["grammarxyz"])
+        table["Categories"] = [["Noise"]]
+        self.test_dict.preload(table)
+        res = self.test_dict.normalize("grammarxyz")
+        self.test_dict._normalized = {}
+        self.assertEqual(res["word_categories"], ["Noise"])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
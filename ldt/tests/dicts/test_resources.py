@@ -80,6 +80,19 @@ class Tests(unittest.TestCase):
     def test_domain_long(self):
         self.assertTrue(self.web_dict.is_a_word("example.com/sub/something"))
 
+    def test_domain_unknown(self):
+        self.assertFalse(self.web_dict.is_a_word("example.bzzzz"))
+
+    def test_domain_in_path(self):
+        self.assertTrue(self.web_dict.is_a_word("a.b/example.org/x.bzzzz"))
+
+    def test_domain_irregular(self):
+        domain = "\u200f.\u0645\u0648\u0642\u0639\u200e"
+        self.assertTrue(self.web_dict.is_a_word("example" + domain))
+
+    def test_domain_are_related(self):
+        self.assertIsNone(self.web_dict.are_related("example.com", "test.org"))
+
     def test_file(self):
         self.assertTrue(self.file_dict.is_a_word("cat.jpg"))
 
@@ -0,0 +1,141 @@
+import unittest
+import os
+import tempfile
+
+import pandas as pd
+
+os.environ["TESTING_LDT"] = "TRUE"
+
+from ldt.experiments.analyze import score_neighborhoods, sweep_thresholds, \
+    bootstrap_scores, stream_scores
+
+def make_annotation():
+    """A small annotation of two models."""
+    return pd.DataFrame({
+        "Model": ["a", "a", "a", "a", "b", "b"],
+        "Target": ["cat", "cat", "dog", "dog", "cat", "dog"],
+        "Rank": [1, 2, 1, 2, 1, 1],
+        "Neighbor": ["cats", "feline", "dogs", "puppy", "cats", "dogs"],
+        "Similarity": [0.9, 0.65, 0.8, 0.75, 0.5, 0.95],
+        "SharedMorphForm": [True, False, True, False, True, True],
+        "Synonyms": [False, True, None, False, False, False],
+        "ShortestPath": [0.1, 0.4, None, 0.7, 0.2, 0.3],
+        "NeighborFrequency": [20000, 50.0, 12000.0, None, 5, 30000]})
+
+class Tests(unittest.TestCase):
+    """
+    The tests in this block inspect computing ld scores.
+    """
+
+    def test_binary(self):
+        res = score_neighborhoods(make_annotation())
+        self.assertEqual(res.at["a", "SharedMorphForm"], 50.0)
+        self.assertEqual(res.at["b", "SharedMorphForm"], 100.0)
+        self.assertEqual(res.at["a", "Synonyms"], 25.0)
+
+    def test_similarity(self):
+        res = score_neighborhoods(make_annotation())
+        self.assertEqual(res.at["a", "FarNeighbors"], 25.0)
+        self.assertEqual(res.at["a", "CloseNeighbors"], 50.0)
+
+    def test_frequency(self):
+        res = score_neighborhoods(make_annotation())
+        self.assertEqual(res.at["a", "HighFreqNeighbors"], 50.0)
+        self.assertEqual(res.at["a", "LowFreqNeighbors"], 50.0)
+        self.assertEqual(res.at["b", "HighFreqNeighbors"], 50.0)
+
+    def test_ontology(self):
+        res = score_neighborhoods(make_annotation())
+        self.assertEqual(res.at["a", "CloseInOntology"], 2)
+        self.assertEqual(res.at["a", "ShortestPathMedian"], 0.4)
+        self.assertEqual(res.at["b", "ShortestPathMedian"], 0.25)
+
+    def test_single_model(self):
+        input_df = make_annotation()
+        input_df = input_df[input_df["Model"] == "b"].drop(columns="Model")
+        res = score_neighborhoods(input_df)
+        self.assertEqual(len(res), 1)
+        self.assertEqual(res.iloc[0]["SharedMorphForm"], 100.0)
+
+    def test_thresholds(self):
+        res = score_neighborhoods(make_annotation(), lowfreq_threshold=10,
+                                  close_neighbors_threshold=0.95)
+        self.assertEqual(res.at["b", "HighFreqNeighbors"], 50.0)
+        self.assertEqual(res.at["b", "CloseNeighbors"], 50.0)
+
+    def test_sweep(self):
+        input_df = make_annotation()
+        res = sweep_thresholds(input_df, lowfreq_thresholds=[10, 10000],
+                               far_neighbors_thresholds=[0.65, 0.7],
+                               close_neighbors_thresholds=[0.8, 0.95],
+                               ontology_thresholds=[0.4, 0.5])
+        self.assertEqual(list(res.columns),
+                         ["Model", "LDScore", "Threshold", "Score"])
+        for i in range(2):
+            kwargs = {"lowfreq_threshold": [10, 10000][i],
+                      "far_neighbors_threshold": [0.65, 0.7][i],
+                      "close_neighbors_threshold": [0.8, 0.95][i],
+                      "ontology_threshold": [0.4, 0.5][i]}
+            scores = score_neighborhoods(input_df, **kwargs)
+            for score, threshold in [
+                    ("HighFreqNeighbors", "lowfreq_threshold"),
+                    ("LowFreqNeighbors", "lowfreq_threshold"),
+                    ("FarNeighbors", "far_neighbors_threshold"),
+                    ("CloseNeighbors", "close_neighbors_threshold"),
+                    ("CloseInOntology", "ontology_threshold")]:
+                for model in ["a", "b"]:
+                    row = res[(res["Model"] == model) &
+                              (res["LDScore"] == score) &
+                              (res["Threshold"] == kwargs[threshold])]
+                    self.assertEqual(row["Score"].iloc[0],
+                                     scores.at[model, score])
+
+    def test_sweep_subset(self):
+        res = sweep_thresholds(make_annotation(),
+                               ontology_thresholds=[0.0, 0.2, 1.0])
+        self.assertEqual(set(res["LDScore"]), {"CloseInOntology"})
+        self.assertEqual(list(res[res["Model"] == "a"]["Score"]), [0, 1, 3])
+
+    def test_bootstrap(self):
+        input_df = make_annotation()
+        input_df = input_df[input_df["Model"] == "a"]
+        res = bootstrap_scores(input_df, n_resamples=200)
+        self.assertEqual(list(res.columns), ["Score", "Lower", "Upper"])
+        self.assertEqual(res.at["SharedMorphForm", "Score"], 50.0)
+        self.assertTrue((res["Lower"] <= res["Score"]).all())
+        self.assertTrue((res["Upper"] >= res["Score"]).all())
+        # every target has one of the two neighbors in the same form
+        self.assertEqual(res.at["SharedMorphForm", "Upper"], 50.0)
+        self.assertEqual(res.at["Synonyms", "Lower"], 0.0)
+        self.assertEqual(res.at["Synonyms", "Upper"], 50.0)
+
+    def test_bootstrap_median(self):
+        input_df = make_annotation()
+        input_df = input_df[input_df["Model"] == "a"]
+        res = bootstrap_scores(input_df, n_resamples=200)
+        self.assertEqual(res.at["ShortestPathMedian", "Lower"], 0.25)
+        self.assertEqual(res.at["ShortestPathMedian", "Upper"], 0.7)
+
+    def test_bootstrap_seed(self):
+        input_df = make_annotation()
+        res = bootstrap_scores(input_df, n_resamples=50, seed=1)
+        res2 = bootstrap_scores(input_df, n_resamples=50, seed=1)
+        self.assertTrue(res.equals(res2))
+
+    def test_bootstrap_error(self):
+        with self.assertRaises(ValueError):
+            bootstrap_scores(make_annotation(), confidence=95)
+
+    def test_streaming(self):
+        input_df = make_annotation().drop(columns="Model")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "annotated.tsv")
+            input_df.to_csv(path, index=False, sep="\t")
+            res = stream_scores(path, chunksize=4)
+        scores = score_neighborhoods(input_df).iloc[0].to_dict()
+        self.assertEqual(set(res), set(scores))
+        for score in scores:
+            self.assertEqual(res[score], scores[score])
+
+if __name__ == '__main__':
+    unittest.main()
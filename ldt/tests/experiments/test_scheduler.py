@@ -0,0 +1,213 @@
+import unittest
+import os
+import time
+import shutil
+import tempfile
+import threading
+
+import pandas as pd
+
+os.environ["TESTING_LDT"] = "TRUE"
+
+from ldt.experiments.scheduler import Scheduler, schedule_experiments
+from ldt.benchmarks.synthetic import make_benchmark_data
+from ldt.benchmarks.pipeline import benchmark_config, SyntheticAnalyzer
+
+class Tests(unittest.TestCase):
+    """The tests in this block inspect the scheduling of experiment
+    stages."""
+
+    def setUp(self):
+        self.events = []
+        self.lock = threading.Lock()
+
+    def _task(self, name, seconds=0.0):
+        """Helper for a task that records its start and end."""
+        def function():
+            with self.lock:
+                self.events.append(("start", name,
+                                    threading.current_thread().name))
+            time.sleep(seconds)
+            with self.lock:
+                self.events.append(("end", name, None))
+            return name
+        return function
+
+    def _index(self, event, name):
+        return [x[:2] for x in self.events].index((event, name))
+
+    def test_dependencies(self):
+        scheduler = Scheduler(workers=2)
+        for model in ["a", "b"]:
+            scheduler.add_task("neighbors", model, self._task("n" + model))
+            scheduler.add_task("scoring", model, self._task("s" + model),
+                               dependencies=[("neighbors", model)])
+        scheduler.run()
+        for model in ["a", "b"]:
+            self.assertLess(self._index("end", "n" + model),
+                            self._index("start", "s" + model))
+        self.assertEqual(scheduler.tasks[("scoring", "a")].result, "sa")
+
+    def test_main_thread(self):
+        scheduler = Scheduler(workers=2)
+        scheduler.add_task("neighbors", "a", self._task("na", 0.05))
+        scheduler.add_task("neighbors", "b", self._task("nb", 0.2))
+        scheduler.add_task("annotation", "a", self._task("aa", 0.05),
+                           dependencies=[("neighbors", "a")], main_thread=True)
+        report = scheduler.run()
+        threads = {x[1]: x[2] for x in self.events if x[0] == "start"}
+        self.assertEqual(threads["aa"], threading.main_thread().name)
+        self.assertNotEqual(threads["nb"], threading.main_thread().name)
+        # the annotation of a overlaps with the neighbors of b
+        self.assertLess(self._index("start", "aa"), self._index("end", "nb"))
+        self.assertEqual(set(report), {"neighbors", "annotation"})
+
+    def test_exclusive(self):
+        scheduler = Scheduler(workers=2)
+        scheduler.add_task("neighbors", "a", self._task("na", 0.05))
+        scheduler.add_task("neighbors", "b", self._task("nb", 0.2))
+        scheduler.add_task("neighbors", "c", self._task("nc", 0.05),
+                           dependencies=[("neighbors", "a")])
+        scheduler.add_task("annotation", "a", self._task("aa", 0.05),
+                           dependencies=[("neighbors", "a")], exclusive=True)
+        scheduler.run()
+        threads = {x[1]: x[2] for x in self.events if x[0] == "start"}
+        self.assertEqual(threads["aa"], threading.main_thread().name)
+        # the annotation of a waits for the neighbors of b, and the
+        # neighbors of c wait for the annotation
+        self.assertLess(self._index("end", "nb"), self._index("start", "aa"))
+        self.assertLess(self._index("end", "aa"), self._index("start", "nc"))
+
+    def test_concurrency(self):
+        scheduler = Scheduler(workers=3, concurrency={"neighbors": 1})
+        for model in ["a", "b", "c"]:
+            scheduler.add_task("neighbors", model, self._task(model, 0.02))
+        scheduler.run()
+        running = 0
+        for event in self.events:
+            running += 1 if event[0] == "start" else -1
+            self.assertLessEqual(running, 1)
+
+    def test_sequential(self):
+        scheduler = Scheduler(workers=0)
+        scheduler.add_task("neighbors", "a", self._task("na"))
+        scheduler.add_task("scoring", "a", self._task("sa"),
+                           dependencies=[("neighbors", "a")])
+        scheduler.run()
+        self.assertEqual([x[1] for x in self.events if x[0] == "start"],
+                         ["na", "sa"])
+
+    def test_error(self):
+        def fail():
+            raise IOError("failed")
+        scheduler = Scheduler(workers=1)
+        scheduler.add_task("neighbors", "a", fail)
+        scheduler.add_task("scoring", "a", self._task("sa"),
+                           dependencies=[("neighbors", "a")])
+        with self.assertRaises(IOError):
+            scheduler.run()
+        self.assertEqual(self.events, [])
+
+    def test_graph_errors(self):
+        scheduler = Scheduler()
+        scheduler.add_task("a", None, self._task("a"),
+                           dependencies=[("b", None)])
+        scheduler.add_task("b", None, self._task("b"),
+                           dependencies=[("a", None)])
+        with self.assertRaises(ValueError):
+            scheduler.run()
+        with self.assertRaises(ValueError):
+            scheduler.add_task("a", None, self._task("a"))
+        with self.assertRaises(ValueError):
+            Scheduler(workers=-1)
+
+    @staticmethod
+    def _experiments(manifest, output_dir):
+        """Helper for setting up the three stages of a synthetic
+        experiment."""
+        # pylint: disable=import-outside-toplevel
+        from ldt.experiments import VectorNeighborhoods, \
+            AnnotateVectorNeighborhoods, LDScoring
+        neighbors = VectorNeighborhoods(
+            experiment_name="scheduled", overwrite=True, top_n=3,
+            embeddings=manifest["embeddings"], output_dir=output_dir,
+            dataset=manifest["vocab_sample"])
+        neighbors.save_metadata()
+        annotation = AnnotateVectorNeighborhoods(
+            experiment_name="scheduled", overwrite=True,
+            output_dir=output_dir, ldt_analyzer=SyntheticAnalyzer(),
+            multiprocessing=1, prefetch=False)
+        annotation.save_metadata()
+        scoring = LDScoring(experiment_name="scheduled", overwrite=True,
+                            output_dir=output_dir, multiprocessing=1)
+        return neighbors, annotation, scoring
+
+    def test_workflow(self):
+        path = tempfile.mkdtemp()
+        try:
+            manifest = make_benchmark_data(path, vocab_size=300,
+                                           sample_size=5, dimensions=10,
+                                           real_words=0)
+            output_dir = os.path.join(path, "experiments")
+            with benchmark_config(manifest):
+                report = schedule_experiments(
+                    *self._experiments(manifest, output_dir),
+                    workers=2).run()
+            self.assertEqual(len(report["scoring"]), 2)
+            res_df = pd.read_csv(os.path.join(
+                output_dir, "scheduled", "analysis", "ld_scores.tsv"),
+                header=0, sep="\t")
+            self.assertEqual(list(res_df.columns[1:]),
+                             ["synthetic_1", "synthetic_2"])
+        finally:
+            shutil.rmtree(path)
+
+    def test_exclusive_annotation(self):
+        path = tempfile.mkdtemp()
+        try:
+            manifest = make_benchmark_data(path, vocab_size=300,
+                                           sample_size=5, dimensions=10,
+                                           real_words=0)
+            output_dir = os.path.join(path, "experiments")
+            with benchmark_config(manifest):
+                neighbors, annotation, scoring = self._experiments(
+                    manifest, output_dir)
+                annotation.metadata["multiprocessing"] = 2
+                scheduler = schedule_experiments(neighbors, annotation,
+                                                 scoring, workers=2)
+            tasks = [x for x in scheduler.tasks.values()]
+            self.assertTrue(all(x.exclusive for x in tasks
+                                if x.stage == "annotation"))
+            self.assertFalse(any(x.exclusive for x in tasks
+                                 if x.stage != "annotation"))
+        finally:
+            shutil.rmtree(path)
+
+    def test_batch_scoring(self):
+        # pylint: disable=import-outside-toplevel
+        from ldt.experiments import LDScoring
+        path = tempfile.mkdtemp()
+        try:
+            manifest = make_benchmark_data(path, vocab_size=300,
+                                           sample_size=5, dimensions=10,
+                                           real_words=0)
+            output_dir = os.path.join(path, "experiments")
+            res = []
+            with benchmark_config(manifest):
+                schedule_experiments(*self._experiments(manifest, output_dir),
+                                     workers=0).run()
+                for batch_scoring in [False, True]:
+                    scoring = LDScoring(experiment_name="scheduled",
+                                        overwrite=True, output_dir=output_dir,
+                                        multiprocessing=1,
+                                        batch_scoring=batch_scoring)
+                    scoring.get_results()
+                    res.append(pd.read_csv(os.path.join(
+                        output_dir, "scheduled", "analysis", "ld_scores.tsv"),
+                        header=0, sep="\t"))
+            pd.testing.assert_frame_equal(res[0], res[1])
+        finally:
+            shutil.rmtree(path)
+
+if __name__ == '__main__':
+    unittest.main()
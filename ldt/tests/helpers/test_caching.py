@@ -0,0 +1,218 @@
+import unittest
+import os
+import gc
+import time
+import pickle
+import shutil
+import tempfile
+import weakref
+
+os.environ["TESTING_LDT"] = "TRUE"
+
+from ldt.helpers import caching
+from ldt.load_config import config
+from ldt.dicts.resources import ResourceDict
+
+CALLS = []
+
+@caching.cached("test.square", maxsize=2)
+def square(number):
+    CALLS.append(number)
+    return number ** 2
+
+class Lookup(object):
+    """A dictionary stand-in that counts its lookups."""
+
+    def __init__(self, language="en", identity=True):
+        self.language = language
+        self.identity = identity
+        self.calls = 0
+
+    def cache_identity(self):
+        if self.identity:
+            return ("Lookup", self.language)
+        return None
+
+    @caching.cached("test.lookup")
+    def lookup(self, word):
+        self.calls += 1
+        return [word, self.language]
+
+    @caching.cached("test.expiring", ttl=0.05)
+    def expiring(self, word):
+        self.calls += 1
+        return word
+
+    @caching.cached("test.persistent", persistent=True)
+    def persistent(self, word):
+        self.calls += 1
+        return [word]
+
+    @caching.cached("test.unreachable", persistent=True, cache_none=False)
+    def unreachable(self, word):
+        self.calls += 1
+        return None if word == "cat" else [word]
+
+class Tests(unittest.TestCase):
+    """The tests in this block inspect the caches of ldt lookups."""
+
+    def setUp(self):
+        square.cache_clear()
+        del CALLS[:]
+
+    def test_cached(self):
+        self.assertEqual([square(2), square(2), square(3)], [4, 4, 9])
+        self.assertEqual(CALLS, [2, 3])
+        self.assertEqual(square.cache_info(),
+                         caching.CacheInfo(1, 2, 2, 2))
+
+    def test_eviction(self):
+        for number in [1, 2, 1, 3, 1, 2]:
+            square(number)
+        # 2 was the least recently used when 3 was cached
+        self.assertEqual(CALLS, [1, 2, 3, 2])
+        self.assertEqual(square.cache.evictions, 2)
+
+    def test_kwargs(self):
+        key1 = caching.make_key((1,), {"a": 1, "b": 2})
+        key2 = caching.make_key((1,), {"b": 2, "a": 1})
+        self.assertEqual(key1, key2)
+        self.assertNotEqual(key1, caching.make_key((1,), {}))
+
+    def test_unhashable(self):
+        with self.assertRaises(TypeError):
+            square([1])
+
+    def test_registry(self):
+        square(2)
+        self.assertIs(caching.get_cache("test.square"), square.cache)
+        self.assertIn("ResourceDict.is_a_word", caching.list_caches())
+        report = caching.cache_report()
+        self.assertEqual(report["test.square"]["entries"], 1)
+        self.assertGreater(report["test.square"]["bytes"], 0)
+        self.assertIn("total", report)
+        caching.clear_caches("test.*")
+        self.assertEqual(len(square.cache), 0)
+
+    def test_budget(self):
+        cache = caching.register_cache("test.budget")
+        for number in range(10):
+            cache.set(number, number)
+        caching.set_cache_budget("test.bud*", 3)
+        try:
+            self.assertEqual(len(cache), 3)
+            self.assertEqual(caching.get_cache_budget("test.budget"), 3)
+            self.assertEqual(caching.register_cache("test.budget2").maxsize, 3)
+        finally:
+            caching.set_cache_budget("test.bud*", None)
+
+    def test_budget_error(self):
+        with self.assertRaises(ValueError):
+            caching.set_cache_budget("test.budget", -1)
+
+    def test_method(self):
+        self.assertTrue(hasattr(ResourceDict.is_a_word, "cache_info"))
+        self.assertEqual(ResourceDict.is_a_word.cache.name,
+                         "ResourceDict.is_a_word")
+
+    def test_estimate_size(self):
+        data = {str(i): [i] * 10 for i in range(10000)}
+        estimate = caching.estimate_size(data, sample_size=100)
+        exact = caching.estimate_size(data, sample_size=10000)
+        self.assertAlmostEqual(estimate / exact, 1, delta=0.1)
+
+    def test_identity(self):
+        first, second = Lookup(), Lookup()
+        first.lookup("cat")
+        second.lookup("cat")
+        self.assertEqual((first.calls, second.calls), (1, 0))
+        Lookup(language="fr").lookup("cat")
+        self.assertEqual(Lookup.lookup.cache_info().misses, 2)
+
+    def test_token(self):
+        first, second = Lookup(identity=False), Lookup(identity=False)
+        first.lookup("cat")
+        second.lookup("cat")
+        self.assertEqual((first.calls, second.calls), (1, 1))
+        self.assertFalse(caching.is_stable(first))
+        self.assertTrue(caching.is_stable(Lookup()))
+
+    def test_pickling(self):
+        lookup = Lookup(identity=False)
+        lookup.lookup("cat")
+        copy = pickle.loads(pickle.dumps(lookup))
+        copy.lookup("cat")
+        self.assertEqual(copy.calls, 1)
+
+    def test_not_alive(self):
+        lookup = Lookup(identity=False)
+        lookup.lookup("dog")
+        ref = weakref.ref(lookup)
+        del lookup
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_ttl(self):
+        lookup = Lookup()
+        Lookup.expiring.cache_clear()
+        lookup.expiring("cat")
+        lookup.expiring("cat")
+        self.assertEqual(lookup.calls, 1)
+        time.sleep(0.1)
+        lookup.expiring("cat")
+        self.assertEqual(lookup.calls, 2)
+        self.assertEqual(Lookup.expiring.cache.expirations, 1)
+
+    def test_persistent(self):
+        path = tempfile.mkdtemp()
+        saved = (config.get("persistent_cache"), config["path_to_cache"])
+        config["persistent_cache"] = True
+        config["path_to_cache"] = path
+        try:
+            lookup = Lookup()
+            self.assertEqual(lookup.persistent("cat"), ["cat"])
+            Lookup.persistent.cache_clear()
+            self.assertEqual(lookup.persistent("cat"), ["cat"])
+            self.assertEqual(lookup.calls, 1)
+            # the random identities are not saved
+            unstable = Lookup(identity=False)
+            unstable.persistent("cat")
+            Lookup.persistent.cache_clear()
+            unstable.persistent("cat")
+            self.assertEqual(unstable.calls, 2)
+        finally:
+            config["persistent_cache"], config["path_to_cache"] = saved
+            shutil.rmtree(path)
+
+    def test_cache_none(self):
+        path = tempfile.mkdtemp()
+        saved = (config.get("persistent_cache"), config["path_to_cache"])
+        config["persistent_cache"] = True
+        config["path_to_cache"] = path
+        try:
+            lookup = Lookup()
+            self.assertIsNone(lookup.unreachable("cat"))
+            Lookup.unreachable.cache_clear()
+            self.assertIsNone(lookup.unreachable("cat"))
+            self.assertEqual(lookup.calls, 2)
+            lookup.unreachable("dog")
+            Lookup.unreachable.cache_clear()
+            lookup.unreachable("dog")
+            self.assertEqual(lookup.calls, 3)
+        finally:
+            config["persistent_cache"], config["path_to_cache"] = saved
+            shutil.rmtree(path)
+
+    def test_resource_identity(self):
+        self.assertEqual(caching.resource_identity(ResourceDict),
+                         ("ldt.dicts.resources", "ResourceDict"))
+        first = ResourceDict(resource="names")
+        second = ResourceDict(resource="names")
+        self.assertEqual(caching.resource_identity(first),
+                         caching.resource_identity(second))
+        first._identity = None #pylint: disable=protected-access
+        self.assertNotEqual(caching.resource_identity(first),
+                            caching.resource_identity(second))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+import unittest
+import os
+import json
+import threading
+import time
+import multiprocessing
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+from urllib.parse import urlparse, parse_qs
+
+os.environ["TESTING_LDT"] = "TRUE"
+
+import requests
+
+import ldt
+from ldt.helpers import http
+from ldt.helpers.http import HTTPClient, RateLimiter, prefetch_cache, \
+    PREFETCH_LIMIT
+from ldt.helpers.caching import set_cache_budget
+
+class StubServer(ThreadingMixIn, HTTPServer):
+    """Local stand-in for the online resources."""
+    daemon_threads = True
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serving the requested path back as json, and failing on request."""
+
+    def log_message(self, *args): #pylint: disable=arguments-differ
+        pass
+
+    def do_GET(self): #pylint: disable=invalid-name
+        url = urlparse(self.path)
+        self.server.hits.append(url.path)
+        if url.path == "/missing":
+            self.send_response(404)
+            self.end_headers()
+            return
+        if url.path == "/forbidden":
+            self.send_response(403)
+            self.end_headers()
+            return
+        if url.path == "/unsupported":
+            self.send_response(501)
+            self.end_headers()
+            return
+        if url.path == "/flaky" and self.server.hits.count("/flaky") < 2:
+            self.send_response(503)
+            self.end_headers()
+            return
+        if url.path.startswith("/getSynsetIds"):
+            lemma = parse_qs(url.query)["lemma"][0]
+            data = [{"id": "bn:" + lemma, "pos": "NOUN"}]
+        elif url.path.startswith("/getOutgoingEdges"):
+            data = [{"language": "EN", "target": "bn:feline",
+                     "pointer": {"name": "is-a",
+                                 "relationGroup": "HYPERNYM"}}]
+        elif url.path.startswith("/getSynset"):
+            data = {"senses": [{"properties": {"language": "EN",
+                                               "simpleLemma": "feline"}}]}
+        else:
+            data = {"path": url.path}
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def _client_pid(_):
+    """Helper for retrieving the process of the client in a worker."""
+    return http.get_client().pid, os.getpid()
+
+class Tests(unittest.TestCase):
+    """The tests in this block inspect the shared HTTP client."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Starting the stub server."""
+        cls.server = StubServer(("127.0.0.1", 0), StubHandler)
+        cls.server.hits = []
+        cls.url = "http://127.0.0.1:" + str(cls.server.server_address[1])
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stopping the stub server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.hits.clear()
+        self.client = HTTPClient(max_workers=4, backoff=0.01)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_get_json(self):
+        res = self.client.get_json(self.url + "/cat")
+        self.assertEqual(res, {"path": "/cat"})
+
+    def test_missing(self):
+        self.assertIsNone(self.client.get_json(self.url + "/missing"))
+        self.assertEqual(self.server.hits, ["/missing"])
+
+    def test_client_error(self):
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.client.get_json(self.url + "/forbidden")
+        self.assertIsNone(self.client.get_json(self.url + "/unsupported"))
+        self.assertEqual(self.server.hits, ["/forbidden", "/unsupported"])
+
+    def test_retry(self):
+        res = self.client.get_json(self.url + "/flaky")
+        self.assertEqual(res, {"path": "/flaky"})
+        self.assertEqual(self.server.hits, ["/flaky", "/flaky"])
+
+    def test_unreachable(self):
+        client = HTTPClient(max_workers=1, retries=1, backoff=0.01)
+        self.assertIsNone(client.get_json("http://127.0.0.1:1/cat"))
+        self.assertEqual(client.requests, 2)
+
+    def test_fetch_many(self):
+        urls = [self.url + "/" + str(i) for i in range(20)]
+        res = self.client.fetch_many(urls + urls)
+        self.assertEqual(len(res), 20)
+        self.assertEqual(res[self.url + "/7"], {"path": "/7"})
+        self.assertEqual(len(self.server.hits), 20)
+
+    def test_rate_limiter(self):
+        limiter = RateLimiter(rate=50)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.wait()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_shared_client(self):
+        http._reset_client() #pylint: disable=protected-access
+        clients = []
+        threads = [threading.Thread(
+            target=lambda: clients.append(http.get_client()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(id(x) for x in clients)), 1)
+        self.assertEqual(clients[0].pid, os.getpid())
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(),
+                         "fork is not supported")
+    def test_forked_client(self):
+        http.get_client()
+        with multiprocessing.get_context("fork").Pool(1) as pool:
+            client_pid, pid = pool.map(_client_pid, [None])[0]
+        self.assertEqual(client_pid, pid)
+        self.assertNotEqual(pid, os.getpid())
+
+    def test_workers_error(self):
+        with self.assertRaises(ValueError):
+            HTTPClient(max_workers=0)
+
+    def test_babelnet_prefetch(self):
+        api_url = ldt.dicts.base.babelnet.API_URL
+        ldt.dicts.base.babelnet.API_URL = self.url + "/"
+        try:
+            babelnet = ldt.dicts.semantics.BabelNet(language="English",
+                                                    babelnet_key="test")
+            self.assertEqual(babelnet.prefetch(["cat", "dog"]), 5)
+            hits = len(self.server.hits)
+            res = babelnet.get_relations("cat", relations=("hypernyms",))
+            self.assertEqual(len(self.server.hits), hits)
+            self.assertEqual(res["hypernyms"], ["feline"])
+        finally:
+            ldt.dicts.base.babelnet.API_URL = api_url
+
+    def test_prefetch_cache(self):
+        cache = prefetch_cache("Test.prefetched")
+        self.assertEqual(cache.maxsize, PREFETCH_LIMIT)
+        set_cache_budget("Test.prefetched", 2)
+        for i in range(3):
+            cache.set(str(i), i)
+        self.assertEqual(len(cache), 2)
+
+if __name__ == '__main__':
+    unittest.main()
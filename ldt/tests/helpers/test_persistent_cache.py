@@ -0,0 +1,54 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+os.environ["TESTING_LDT"] = "TRUE"
+
+import ldt
+from ldt.helpers.persistent_cache import PersistentCache
+
+class Tests(unittest.TestCase):
+    """The tests in this block inspect the persistent cache."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Setting up the test variables."""
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.tmpdir, "cache.sqlite")
+        cls.cache = PersistentCache(namespace="test", path=cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clearning up the test variables."""
+        cls.cache.close()
+        shutil.rmtree(cls.tmpdir)
+
+    def test_set_get(self):
+        self.cache.set("cat", ["noun", "verb"])
+        self.assertEqual(self.cache.get("cat"), ["noun", "verb"])
+
+    def test_missing(self):
+        self.assertEqual(self.cache.get("nonexistent", "default"), "default")
+
+    def test_none_value(self):
+        self.cache.set("none", None)
+        self.assertIn("none", self.cache)
+
+    def test_namespaces(self):
+        self.cache.set("dog", True)
+        other = PersistentCache(namespace="other", path=self.path)
+        self.assertNotIn("dog", other)
+
+    def test_persistence(self):
+        self.cache.set("bird", {"pos": ["noun"]})
+        other = PersistentCache(namespace="test", path=self.path)
+        self.assertEqual(other.get("bird"), {"pos": ["noun"]})
+
+    def test_set_get_many(self):
+        self.cache.set_many({"a": 1, "b": 2})
+        res = self.cache.get_many(["a", "b", "c"])
+        self.assertEqual(res, {"a": 1, "b": 2})
+
+if __name__ == '__main__':
+    unittest.main()
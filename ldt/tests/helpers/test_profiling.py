@@ -0,0 +1,102 @@
+import unittest
+import os
+import functools
+
+import timeout_decorator
+
+os.environ["TESTING_LDT"] = "TRUE"
+
+from ldt.helpers.profiling import Profiler, get_profiler, profiled
+from ldt.dicts.semantics.metadictionary import MetaDictionary
+
+@functools.lru_cache(maxsize=None)
+def cached_square(number):
+    return number ** 2
+
+def time_out():
+    raise timeout_decorator.timeout_decorator.TimeoutError()
+
+class Tests(unittest.TestCase):
+    """The tests in this block inspect the profiling of ldt components."""
+
+    def setUp(self):
+        self.profiler = Profiler()
+        self.profiler.enable()
+
+    def test_call(self):
+        res = self.profiler.call("component", "resource", sum, [1, 2])
+        self.assertEqual(res, 3)
+        self.assertEqual(self.profiler.stats[("component", "resource")][0], 1)
+        self.profiler.call("component", None, sum, [1, 2])
+        self.assertIn(("component", "total"), self.profiler.stats)
+
+    def test_disabled(self):
+        self.profiler.disable()
+        self.profiler.call("component", None, sum, [1, 2])
+        self.profiler.record_hit("component")
+        self.assertEqual(self.profiler.stats, {})
+
+    def test_cache_hits(self):
+        cached_square.cache_clear()
+        for _ in range(3):
+            self.profiler.call("square", None, cached_square, 4)
+        self.assertEqual(self.profiler.stats[("square", "total")][3], 2)
+
+    def test_timeouts(self):
+        with self.assertRaises(timeout_decorator.timeout_decorator.TimeoutError):
+            self.profiler.call("slow", None, time_out)
+        self.assertEqual(self.profiler.stats[("slow", "total")][2], 1)
+
+    def test_since_merge(self):
+        self.profiler.call("a", None, sum, [1])
+        snapshot = self.profiler.snapshot()
+        self.profiler.call("a", None, sum, [1])
+        self.profiler.call("b", "x", sum, [1])
+        delta = self.profiler.since(snapshot)
+        self.assertEqual(delta[("a", "total")][0], 1)
+        self.assertEqual(delta[("b", "x")][0], 1)
+        self.profiler.merge(delta)
+        self.assertEqual(self.profiler.stats[("a", "total")][0], 3)
+
+    def test_summary(self):
+        self.profiler.call("a", "x", sum, [1])
+        self.profiler.record_hit("a", "x")
+        res = self.profiler.summary()
+        self.assertEqual(res["a"]["x"]["calls"], 1)
+        self.assertEqual(res["a"]["x"]["cache_hits"], 1)
+        self.assertEqual(set(res["a"]["x"]), {"calls", "seconds", "timeouts",
+                                              "cache_hits"})
+
+    def test_decorator(self):
+        square = profiled("square")(cached_square)
+        self.assertTrue(hasattr(square, "cache_info"))
+        profiler = get_profiler()
+        was_enabled = profiler.enabled
+        profiler.enable()
+        try:
+            snapshot = profiler.snapshot()
+            self.assertEqual(square(3), 9)
+            self.assertEqual(profiler.since(snapshot)[("square", "total")][0],
+                             1)
+        finally:
+            if not was_enabled:
+                profiler.disable()
+
+    def test_metadictionary(self):
+        profiler = get_profiler()
+        was_enabled = profiler.enabled
+        profiler.enable()
+        try:
+            snapshot = profiler.snapshot()
+            meta = MetaDictionary(language="English", order=("wordnet",))
+            meta.get_relations("cat")
+            res = profiler.since(snapshot)
+            self.assertEqual(res[("MetaDictionary.get_relations",
+                                  "wordnet")][0], 1)
+            self.assertIn(("MetaDictionary.is_a_word", "wordnet"), res)
+        finally:
+            if not was_enabled:
+                profiler.disable()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+import os
+
+os.environ["TESTING_LDT"] = "TRUE"
+
+import ldt
+from ldt.helpers.resources import lookup_language_by_code
+
+class Tests(unittest.TestCase):
+    """The tests in this block inspect the lookup of language codes."""
+
+    def test_code_to_name(self):
+        self.assertEqual(lookup_language_by_code("en"), "English")
+
+    def test_name_to_code(self):
+        self.assertEqual(lookup_language_by_code("English", reverse=True),
+                         "en")
+
+    def test_lowercase_name_to_code(self):
+        self.assertEqual(lookup_language_by_code("french", reverse=True),
+                         "fr")
+
+    def test_normalized_code(self):
+        self.assertEqual(lookup_language_by_code("de", reverse=True), "de")
+
+    def test_unknown_language(self):
+        with self.assertRaises(ldt.helpers.exceptions.LanguageError):
+            lookup_language_by_code("cat")
+        with self.assertRaises(ldt.helpers.exceptions.LanguageError):
+            lookup_language_by_code("Klingon", reverse=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import os
+import pickle
+import shutil
+import tempfile
+
+os.environ["TESTING_LDT"] = "TRUE"
+
+import ldt
+from ldt.helpers import shared_resources
+from ldt.helpers.shared_resources import write_compact, open_compact, \
+    ResourceRegistry
+
+class Tests(unittest.TestCase):
+    """The tests in this block inspect the shared read-only resources."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Setting up the test variables."""
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.registry = ResourceRegistry(path=cls.tmpdir)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Cleaning up the test variables."""
+        shutil.rmtree(cls.tmpdir)
+
+    def test_vocabulary(self):
+        path = os.path.join(self.tmpdir, "vocab.ldtr")
+        write_compact(frozenset(["cat", "dog", "café", "a"]), path)
+        vocab = open_compact(path)
+        self.assertIn("café", vocab)
+        self.assertNotIn("cow", vocab)
+        self.assertNotIn(1, vocab)
+        self.assertEqual(len(vocab), 4)
+        self.assertEqual(sorted(vocab), ["a", "café", "cat", "dog"])
+
+    def test_dictionary(self):
+        path = os.path.join(self.tmpdir, "dict.ldtr")
+        write_compact({"cat": {"dog", "mouse"}, "dog": 5, "cow": ["milk"],
+                       "ant": {"bee": 2}}, path)
+        data = open_compact(path)
+        self.assertEqual(data["cat"], frozenset(["dog", "mouse"]))
+        self.assertEqual(data["dog"], 5)
+        self.assertEqual(data["ant"]["bee"], 2)
+        self.assertEqual(data.get("bird", []), [])
+        with self.assertRaises(KeyError):
+            data["bird"]
+        self.assertEqual(dict(data.items())["cow"], ["milk"])
+
+    def test_empty(self):
+        path = os.path.join(self.tmpdir, "empty.ldtr")
+        write_compact({}, path)
+        self.assertNotIn("cat", open_compact(path))
+
+    def test_pickle(self):
+        path = os.path.join(self.tmpdir, "pickled.ldtr")
+        write_compact({"cat": 1}, path)
+        data = pickle.loads(pickle.dumps(open_compact(path)))
+        self.assertEqual(data["cat"], 1)
+
+    def test_registry(self):
+        source = os.path.join(self.tmpdir, "source.vocab")
+        with open(source, "w") as stream:
+            stream.write("cat\ndog\n")
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return frozenset(["cat", "dog"])
+
+        view = self.registry.get(source, loader, lowercasing=True)
+        self.assertIn("dog", view)
+        registry = ResourceRegistry(path=self.tmpdir)
+        self.assertIn("cat", registry.get(source, loader, lowercasing=True))
+        self.assertEqual(len(calls), 1)
+        registry.get(source, loader, lowercasing=False)
+        self.assertEqual(len(calls), 2)
+
+    def test_resource_dict(self):
+        registry = shared_resources._REGISTRY
+        shared_resources._REGISTRY = self.registry
+        try:
+            names = ldt.dicts.resources.NameDictionary(language="english",
+                                                       lowercasing=False)
+            shared = ldt.dicts.resources.ResourceDict(resource="names",
+                                                      language="english",
+                                                      lowercasing=False,
+                                                      shared=True)
+            self.assertIsInstance(shared.data,
+                                  shared_resources.SharedVocabulary)
+            self.assertEqual(sorted(names.data), sorted(shared.data))
+            self.assertTrue(shared.is_a_word("Alice"))
+        finally:
+            shared_resources._REGISTRY = registry
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+import os
+import tempfile
+
+import pandas as pd
+
+os.environ["TESTING_LDT"] = "TRUE"
+
+from ldt.helpers import tables
+
+try:
+    import pyarrow #pylint: disable=unused-import
+    PYARROW = True
+except ImportError:
+    PYARROW = False
+
+def make_table():
+    """A small neighbors table."""
+    return pd.DataFrame({"Target": ["cat", "cat", "dog"],
+                         "Rank": [1, 2, 1],
+                         "Neighbor": ["cats", "feline", "dogs"],
+                         "Similarity": [0.9, 0.7, 0.8],
+                         "Synonyms": [False, True, None]})
+
+class Tests(unittest.TestCase):
+    """
+    The tests in this block inspect saving and loading experiment tables.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.stem = os.path.join(self.tmp.name, "model")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_tsv(self):
+        path = tables.write_table(make_table(), self.stem)
+        self.assertEqual(path, self.stem + ".tsv")
+        res = tables.read_table(path)
+        self.assertEqual(list(res["Neighbor"]), ["cats", "feline", "dogs"])
+
+    def test_projection(self):
+        path = tables.write_table(make_table(), self.stem)
+        res = tables.read_table(path, columns=["Neighbor", "Missing"])
+        self.assertEqual(list(res.columns), ["Neighbor"])
+
+    def test_columns(self):
+        path = tables.write_table(make_table(), self.stem)
+        self.assertEqual(tables.get_columns(path), list(make_table().columns))
+
+    def test_chunks(self):
+        path = tables.write_table(make_table(), self.stem)
+        chunks = list(tables.read_table_chunks(
+            path, chunksize=2, columns=["Synonyms"],
+            dtype={"Synonyms": "boolean"}))
+        self.assertEqual([len(x) for x in chunks], [2, 1])
+        self.assertTrue(chunks[0]["Synonyms"].iloc[1])
+
+    def test_find_table(self):
+        self.assertIsNone(tables.find_table(self.stem))
+        tables.write_table(make_table(), self.stem)
+        self.assertEqual(tables.find_table(self.stem), self.stem + ".tsv")
+
+    def test_find_table_format(self):
+        tables.write_table(make_table(), self.stem)
+        self.assertEqual(tables.find_table(self.stem, fmt="tsv"),
+                         self.stem + ".tsv")
+        with self.assertRaises(ValueError):
+            tables.find_table(self.stem, fmt="xlsx")
+
+    def test_stale_format(self):
+        # a table left over from a run in another format
+        with open(self.stem + ".parquet", "w") as f:
+            f.write("stale")
+        tables.write_table(make_table(), self.stem)
+        self.assertFalse(os.path.exists(self.stem + ".parquet"))
+        self.assertEqual(tables.find_table(self.stem), self.stem + ".tsv")
+
+    def test_list_tables(self):
+        tables.write_table(make_table(), self.stem)
+        with open(os.path.join(self.tmp.name, "metadata.json"), "w") as f:
+            f.write("{}")
+        self.assertEqual(tables.list_tables(self.tmp.name),
+                         {"model": self.stem + ".tsv"})
+
+    def test_format_error(self):
+        with self.assertRaises(ValueError):
+            tables.write_table(make_table(), self.stem, fmt="xlsx")
+
+    @unittest.skipIf(PYARROW, "pyarrow is installed")
+    def test_parquet_missing(self):
+        with self.assertRaises(ImportError):
+            tables.check_format("parquet")
+
+    @unittest.skipUnless(PYARROW, "pyarrow is not installed")
+    def test_parquet(self):
+        path = tables.write_table(make_table(), self.stem, fmt="parquet")
+        self.assertEqual(path, self.stem + ".parquet")
+        self.assertFalse(os.path.exists(self.stem + ".tsv"))
+        res = tables.read_table(path, columns=["Target", "Similarity"])
+        self.assertEqual(list(res.columns), ["Target", "Similarity"])
+        self.assertEqual(list(res["Similarity"]), [0.9, 0.7, 0.8])
+
+    @unittest.skipUnless(PYARROW, "pyarrow is not installed")
+    def test_parquet_preferred(self):
+        tables.write_table(make_table(), self.stem, fmt="parquet",
+                           export_tsv=True)
+        self.assertTrue(os.path.exists(self.stem + ".tsv"))
+        self.assertEqual(tables.find_table(self.stem), self.stem + ".parquet")
+        self.assertEqual(tables.list_tables(self.tmp.name),
+                         {"model": self.stem + ".parquet"})
+
+    @unittest.skipUnless(PYARROW, "pyarrow is not installed")
+    def test_parquet_stale_tsv(self):
+        tables.write_table(make_table(), self.stem)
+        tables.write_table(make_table(), self.stem, fmt="parquet")
+        self.assertFalse(os.path.exists(self.stem + ".tsv"))
+        tables.write_table(make_table(), self.stem)
+        self.assertFalse(os.path.exists(self.stem + ".parquet"))
+        self.assertEqual(tables.find_table(self.stem, fmt="tsv"),
+                         self.stem + ".tsv")
+
+    @unittest.skipUnless(PYARROW, "pyarrow is not installed")
+    def test_parquet_chunks(self):
+        path = tables.write_table(make_table(), self.stem, fmt="parquet")
+        chunks = list(tables.read_table_chunks(
+            path, chunksize=2, columns=["Synonyms"],
+            dtype={"Synonyms": "boolean"}))
+        self.assertEqual([len(x) for x in chunks], [2, 1])
+        self.assertEqual(str(chunks[0]["Synonyms"].dtype), "boolean")
+
+if __name__ == '__main__':
+    unittest.main()
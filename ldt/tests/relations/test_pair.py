@@ -92,6 +92,16 @@ class Tests(unittest.TestCase):
         worked = "SharedPOS" in res and "Associations" in res
         self.assertTrue(worked)
 
+    @ignore_warnings
+    def test_prefetch(self):
+        """Test prefetching the dictionary data for a wordlist."""
+        res = self.test_dict.prefetch(["kindness", "happiness", "one",
+                                       "kindness"])
+        self.assertEqual(res, 3)
+        self.assertIn("happiness", self.test_dict._normalizer._normalized)
+        self.assertIn("kindness", self.test_dict._derivation_dict._analyzed)
+        self.assertNotIn("one", self.test_dict._derivation_dict._analyzed)
+
     # @ignore_warnings
     # def test_gdeps(self):
     #     """Test gdeps cooccurrence."""
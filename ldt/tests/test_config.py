@@ -3,11 +3,13 @@
 
 import unittest
 import os
+import sys
+import subprocess
 
 os.environ["TESTING_LDT"] = "TRUE"
 
 import ldt
-from ldt.load_config import config
+from ldt.load_config import config, nltk_download
 
 class Tests(unittest.TestCase):
     """
@@ -19,5 +21,27 @@ class Tests(unittest.TestCase):
         res = config
         self.assertEqual("English", res["default_language"])
 
+    def test_lazy_import(self):
+        """Test that importing ldt does not load the subpackages."""
+        code = "import sys, ldt; print('ldt.dicts' in sys.modules, " \
+               "'pandas' in sys.modules)"
+        res = subprocess.run([sys.executable, "-c", code],
+                             stdout=subprocess.PIPE, env=os.environ,
+                             check=True, universal_newlines=True)
+        self.assertEqual(res.stdout.strip().split("\n")[-1], "False False")
+
+    def test_lazy_attribute(self):
+        """Test loading subpackages on first access."""
+        self.assertIs(ldt.dicts, sys.modules["ldt.dicts"])
+        self.assertIs(ldt.RelationsInPair, ldt.relations.RelationsInPair)
+        with self.assertRaises(AttributeError):
+            ldt.no_such_module
+
+    def test_nltk_download_once(self):
+        """Test that NLTK resources are checked only once."""
+        nltk_download()
+        nltk_download()
+        self.assertEqual(nltk_download.cache_info().currsize, 1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -45,7 +45,7 @@ setup(
     install_requires=["ruamel.yaml", "wiktionaryparser==0.0.7",
                       "hurry.filesize", "timeout-decorator", "inflect",
                       "nltk", "vecto", "pandas", "pyenchant", "outdated",
-                      "p_tqdm"],
+                      "p_tqdm", "requests"],
     cmdclass={'test': PyTest},# "install": Install},
     author_email='anna_rogers@uml.edu',
     description='Linguistic diagnostics for word embeddings',
@@ -68,5 +68,6 @@ setup(
         ],
     extras_require = {
         'testing': ['pytest'],
+        'parquet': ['pyarrow'],
     }
 )
\ No newline at end of file